@@ -1,29 +1,165 @@
 """
 Algoritma Alpha-Beta Pruning untuk NIM Misere
 Optimasi: Memoization (Symmetry Reduction) + Depth Limit + Heuristic + Recursion Fix
+
+Mode pencarian:
+  - "alphabeta": alpha-beta window penuh (-inf, +inf)
+  - "pvs": probe null-window dengan bound integer. Nilai posisi hanya
+    +-1, jadi window nol di sekitar 0 sudah menentukan nilai pasti;
+    node giliran berhenti di langkah menang pertama yang terbukti dan
+    tidak pernah perlu re-search.
 """
 
+import math
 import time
 import sys
 from functools import reduce
 from operator import ixor
-from game.nim_logic import is_terminal, get_moves, apply_move
+from algorithms.memory_stats import MemoryTracker, approx_table_bytes
+from game.nim_logic import NimState, PileHistogram
+from game.zobrist import SIDE_KEY, REGIME_KEY
 
 # 1. FIX RECURSION ERROR: Naikkan batas rekursi Python
 sys.setrecursionlimit(5000)
 
+# Cek deadline hanya tiap N node agar overhead time.perf_counter() kecil
+DEADLINE_CHECK_INTERVAL = 1024
+
+# Budget default alphabeta_move() jika pemanggil tidak memberi batas waktu.
+# Posisi kalah harus membuktikan SEMUA langkah kalah (eksponensial), jadi
+# tanpa batas Hard/Extreme bisa berpikir berjam-jam.
+DEFAULT_MOVE_TIME_MS = 2000
+
+# Perkiraan kerja (node x langkah per node) yang masih nyaman untuk satu
+# langkah di GUI, dipakai adaptive_depth()
+SEARCH_WORK_BUDGET = 50_000_000
+
+# Jenis entri transposition table (memo)
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Mode pencarian yang didukung AlphaBetaAgent
+SEARCH_MODES = ("alphabeta", "pvs")
+DEFAULT_SEARCH = "pvs"
+
+# Versi semantik memo (key, check, nilai, flag); naikkan jika berubah agar
+# transposition table yang tersimpan di disk (tt_store) tidak dimuat lagi
+ENGINE_VERSION = "ab-1"
+
+
+def canonical_form(piles):
+    """
+    Bentuk minimal yang ekuivalen (nilai permainan sama) dengan `piles`.
+
+    Teori NIM Misère (Bouton): hasil posisi hanya ditentukan oleh
+      - fase: masih ada tumpukan > 1 (normal) atau tidak (end game), dan
+      - NIM-SUM (fase normal) / paritas jumlah tumpukan 1 (end game).
+    Keduanya tidak berubah jika tumpukan kosong dibuang dan pasangan
+    tumpukan berukuran sama dihapus. Satu-satunya jebakan misère: jika
+    penghapusan pasangan menghilangkan SEMUA tumpukan > 1, fase berubah;
+    maka satu pasangan [2, 2] dipertahankan sebagai penanda fase normal.
+
+    Returns:
+        list: Ukuran tumpukan terurut dari bentuk kanonik
+    """
+    odd = {}
+    has_bigs = False
+    for p in piles:
+        if p > 0:
+            odd[p] = not odd.get(p, False)
+            has_bigs = has_bigs or p > 1
+    form = sorted(p for p, is_odd in odd.items() if is_odd)
+    if has_bigs and not any(p > 1 for p in form):
+        form = sorted(form + [2, 2])
+    return form
+
+
+def canonical_key(state, is_max_turn):
+    """
+    Kunci TT untuk canonical_form(state) tanpa membangun bentuknya: O(1).
+
+    Hash XOR Zobrist (xkey) sudah menghapus pasangan kembar dan tumpukan
+    kosong; bit fase (REGIME_KEY) membedakan fase normal vs end game.
+    Konsisten dengan canonical_form: [2, 2] saling menghapus di xkey dan
+    hanya menyumbang bit fase.
+
+    Returns:
+        tuple: (key, check)
+    """
+    key = state.xkey
+    check = state.xcheck
+    if state.bigs:
+        key ^= REGIME_KEY
+        check ^= REGIME_KEY
+    if not is_max_turn:
+        key ^= SIDE_KEY
+    return key, check
+
+
+class SearchTimeout(Exception):
+    """Dilempar dari dalam pencarian saat batas waktu/node habis atau di-stop."""
+
+
 class AlphaBetaAgent:
-    def __init__(self, max_depth=200):
+    # Jenis posisi yang bisa dipakai search
+    REPRESENTATIONS = {"list": NimState, "histogram": PileHistogram}
+
+    def __init__(self, max_depth=200, time_limit_ms=None, keep_memo=False,
+                 representation="list", canonicalize=True, search="alphabeta",
+                 track_memory=False):
         self.nodes_explored = 0
         self.pruning_count = 0
+        # memo: zobrist key -> (check, value, flag). Flag wajib karena nilai
+        # hasil cutoff hanya batas (bound), bukan nilai pasti; check
+        # memverifikasi bahwa entri memang milik posisi ini (anti tabrakan).
         self.memo = {}
+        # Ukuran memo terbesar selama pencarian terakhir. Kode yang membuang
+        # entri di tengah pencarian harus memperbaruinya dulu (seperti
+        # ProofNumberAgent._evict), karena len(memo) di akhir tidak lagi peak
+        self.memo_peak = 0
         # Batasi kedalaman agar tidak crash pada game dengan ribuan stik
         self.max_depth = max_depth 
+        # Kedalaman efektif pencarian yang sedang/terakhir berjalan
+        self.depth_limit = max_depth
+        # Batas waktu per langkah (ms). None = tanpa batas.
+        self.time_limit_ms = time_limit_ms
+        self.deadline = None
+        # Batas node per pencarian (None = tanpa batas)
+        self.node_limit = None
+        # Diset dari thread lain (mis. perintah "stop") untuk menghentikan pencarian
+        self.stop_requested = False
+        # True = memo tidak dikosongkan antar pencarian (cache tetap hangat).
+        # Aman karena heuristic_value adalah evaluasi eksak (teori misère).
+        self.keep_memo = keep_memo
+        # "list" = NimState (langkah per tumpukan), "histogram" = PileHistogram
+        # (langkah per ukuran berbeda; lebih sedikit anak jika banyak ukuran kembar).
+        # Key Zobrist keduanya sama, jadi memo bisa dipakai bergantian.
+        self.position_type = self.REPRESENTATIONS[representation]
+        self.representation = representation
+        # True = posisi direduksi ke bentuk kanonik sebelum lookup memo,
+        # sehingga posisi yang ekuivalen berbagi satu entri
+        self.canonicalize = canonicalize
+        # "alphabeta" = window penuh, "pvs" = probe null-window (lihat probe())
+        if search not in SEARCH_MODES:
+            raise ValueError(f"Mode pencarian tidak dikenal: {search}")
+        self.search = search
+        # True = tracemalloc selama get_best_move() (peak & hotspot alokasi
+        # di stats; pencarian jauh lebih lambat)
+        self.track_memory = track_memory
 
-    def reset_counters(self):
+    def reset_counters(self, clear_memo=True):
         self.nodes_explored = 0
         self.pruning_count = 0
-        self.memo = {}
+        if clear_memo:
+            self.memo = {}
+
+    def _check_limits(self):
+        """Lempar SearchTimeout jika deadline, batas node, atau stop tercapai."""
+        if self.stop_requested:
+            raise SearchTimeout()
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+        if self.node_limit is not None and self.nodes_explored >= self.node_limit:
+            raise SearchTimeout()
 
     def get_nim_sum(self, state):
         """Hitung XOR sum (untuk heuristic)."""
@@ -33,10 +169,14 @@ class AlphaBetaAgent:
         """
         Menilai kondisi papan menggunakan rumus matematika (Reflex) 
         jika kedalaman pencarian sudah mentok (Depth Limit Reached).
+
+        Dengan NimState semua besaran sudah di-cache (O(1)).
         """
-        ones = sum(1 for p in state if p == 1)
-        bigs = sum(1 for p in state if p > 1)
-        nim_s = self.get_nim_sum(state)
+        if isinstance(state, (list, tuple)):
+            state = NimState(state)
+        ones = state.ones
+        bigs = state.bigs
+        nim_s = state.nim_sum
 
         # Logika Misere (Sama seperti Reflex Agent)
         is_winning = False
@@ -55,40 +195,77 @@ class AlphaBetaAgent:
         else:
             return -1 if is_max_turn else 1
 
+    @staticmethod
+    def _oracle_first(state, moves):
+        """
+        Pindahkan langkah menang versi teori (jika ada) ke urutan pertama,
+        sehingga cutoff terjadi tanpa mencoba langkah lain.
+        """
+        oracle = state.winning_move()
+        if oracle is not None:
+            moves.remove(oracle)
+            moves.insert(0, oracle)
+
     def alphabeta(self, state, is_max_turn, alpha, beta, depth):
+        """
+        Alpha-beta pada NimState dengan make/unmake in-place.
+
+        `state` dimutasi selama pencarian dan dikembalikan utuh saat fungsi
+        selesai normal (tidak jika SearchTimeout dilempar).
+        """
         self.nodes_explored += 1
+
+        # Hentikan pencarian jika waktu habis / di-stop (dicek berkala saja)
+        if self.nodes_explored % DEADLINE_CHECK_INTERVAL == 0:
+            self._check_limits()
         
-        # 2. OPTIMASI SYMMETRY: Gunakan sorted()
-        # Agar [10, 50] dan [50, 10] dianggap state yang sama di memori.
-        state_key = (tuple(sorted(state)), is_max_turn)
+        # 2. OPTIMASI SYMMETRY: hash Zobrist berbasis penjumlahan tidak
+        # bergantung urutan, jadi [10, 50] dan [50, 10] berbagi entri memo
+        # tanpa sorted(). Key di-update O(1) oleh NimState.play/undo.
+        # Dengan canonicalize, posisi ekuivalen (pasangan kembar, tumpukan
+        # kosong) juga berbagi entri.
+        if self.canonicalize:
+            state_key, state_check = canonical_key(state, is_max_turn)
+        else:
+            state_key = state.key if is_max_turn else state.key ^ SIDE_KEY
+            state_check = state.check
 
-        # Cek memori (Cache)
-        if state_key in self.memo:
-            return self.memo[state_key]
+        # Cek memori (Cache): nilai bound hanya dipakai jika memotong window
+        entry = self.memo.get(state_key)
+        if entry is not None and entry[0] == state_check:
+            _, cached, flag = entry
+            if (flag == EXACT
+                    or (flag == LOWER and cached >= beta)
+                    or (flag == UPPER and cached <= alpha)):
+                return cached
+        alpha_orig, beta_orig = alpha, beta
 
-        if is_terminal(state):
+        if state.total == 0:
             return 1 if is_max_turn else -1
         
         # 3. DEPTH LIMIT CHECK
         # Jika sudah berpikir terlalu dalam, stop dan pakai insting (heuristic)
         if depth <= 0:
             val = self.heuristic_value(state, is_max_turn)
-            self.memo[state_key] = val
+            self.memo[state_key] = (state_check, val, EXACT)
             return val
 
-        moves = get_moves(state)
+        moves = state.moves()
         
         # Urutkan moves: ambil stik terbanyak dulu (optimasi pruning)
         # Jika depth tinggal sedikit, random aja biar cepat, tapi jika masih awal, sort penting.
         if depth > 2:
             moves.sort(key=lambda x: x[1], reverse=True)
 
+        self._oracle_first(state, moves)
+
         if is_max_turn:
             value = float('-inf')
-            for move in moves:
-                next_state = apply_move(state, move)
+            for i, k in moves:
+                state.play(i, k)
                 # Panggil rekursif dengan depth berkurang
-                val = self.alphabeta(next_state, False, alpha, beta, depth - 1)
+                val = self.alphabeta(state, False, alpha, beta, depth - 1)
+                state.undo(i, k)
                 value = max(value, val)
                 alpha = max(alpha, value)
                 if alpha >= beta:
@@ -96,65 +273,301 @@ class AlphaBetaAgent:
                     break
         else:
             value = float('inf')
-            for move in moves:
-                next_state = apply_move(state, move)
-                val = self.alphabeta(next_state, True, alpha, beta, depth - 1)
+            for i, k in moves:
+                state.play(i, k)
+                val = self.alphabeta(state, True, alpha, beta, depth - 1)
+                state.undo(i, k)
                 value = min(value, val)
                 beta = min(beta, value)
                 if beta <= alpha:
                     self.pruning_count += 1
                     break
         
-        # Simpan ke memori
-        self.memo[state_key] = value
+        # Simpan ke memori beserta jenis bound-nya.
+        # Nilai hanya +-1: batas bawah +1 / batas atas -1 sudah pasti.
+        if value <= alpha_orig and value != -1:
+            flag = UPPER
+        elif value >= beta_orig and value != 1:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.memo[state_key] = (state_check, value, flag)
         return value
 
-    def get_best_move(self, state):
+    def probe(self, state, depth):
+        """
+        Probe null-window: apakah pemain giliran di `state` menang?
+
+        Nilai hanya +-1, sehingga window (-1, +1) adalah window nol di
+        sekitar 0: setiap hasil pasti fail-high (+1) atau fail-low (-1)
+        dan bisa disimpan sebagai EXACT. Dalam bentuk negamax dengan
+        bound integer, node berhenti begitu satu anak terbukti kalah
+        bagi lawan.
+
+        Memo memakai key sisi Max (nilai dari sudut pandang pemain
+        giliran), jadi konsisten dengan entri EXACT mode "alphabeta".
+
+        Returns:
+            int: 1 jika pemain giliran menang, -1 jika kalah
+        """
+        self.nodes_explored += 1
+        if self.nodes_explored % DEADLINE_CHECK_INTERVAL == 0:
+            self._check_limits()
+
+        if self.canonicalize:
+            state_key, state_check = canonical_key(state, True)
+        else:
+            state_key, state_check = state.key, state.check
+        entry = self.memo.get(state_key)
+        if entry is not None and entry[0] == state_check and entry[2] == EXACT:
+            return entry[1]
+
+        if state.total == 0:
+            return 1
+
+        if depth <= 0:
+            value = self.heuristic_value(state, True)
+            self.memo[state_key] = (state_check, value, EXACT)
+            return value
+
+        moves = state.moves()
+        if depth > 2:
+            moves.sort(key=lambda x: x[1], reverse=True)
+        self._oracle_first(state, moves)
+
+        value = -1
+        for i, k in moves:
+            state.play(i, k)
+            reply = self.probe(state, depth - 1)
+            state.undo(i, k)
+            if reply < 0:
+                # Satu langkah menang sudah cukup: sisa langkah dipangkas
+                value = 1
+                self.pruning_count += 1
+                break
+        self.memo[state_key] = (state_check, value, EXACT)
+        return value
+
+    def get_best_move(self, state, time_limit_ms=None):
         start_time = time.time()
-        self.reset_counters()
-        
-        best_value = float('-inf')
-        best_move = None
-        
-        moves = get_moves(state)
-        # Sorting moves di level teratas SANGAT PENTING agar langsung cek "Ambil Semua"
-        moves.sort(key=lambda x: x[1], reverse=True)
+        self.reset_counters(clear_memo=not self.keep_memo)
+        self.memo_peak = len(self.memo)
+        tracker = MemoryTracker() if self.track_memory else None
+        if tracker is not None:
+            tracker.start()
 
-        alpha = float('-inf')
-        beta = float('inf')
+        try:
+            # Budget waktu: argumen per-call mengalahkan setting agent
+            if time_limit_ms is None:
+                time_limit_ms = self.time_limit_ms
+            if time_limit_ms is not None:
+                self.deadline = time.perf_counter() + time_limit_ms / 1000.0
+            else:
+                self.deadline = None
+            timed_out = False
 
-        # Tentukan kedalaman dinamis
-        total_sticks = sum(state)
-        current_depth_limit = self.max_depth
-        
-        # Jika stik sangat banyak (>500), kurangi kedalaman agar tidak lemot
-        if total_sticks > 500:
-            current_depth_limit = 100 
+            best_value = float('-inf')
+            best_move = None
+
+            # Salinan kerja: dimutasi in-place oleh alphabeta()
+            position = self.position_type(state)
+
+            moves = position.moves()
+            # Sorting moves di level teratas SANGAT PENTING agar langsung cek "Ambil Semua"
+            moves.sort(key=lambda x: x[1], reverse=True)
+            self._oracle_first(position, moves)
+
+            alpha = float('-inf')
+            beta = float('inf')
+
+            # Tentukan kedalaman dinamis
+            total_sticks = position.total
+            current_depth_limit = self.max_depth
+
+            # Jika stik sangat banyak (>500), kurangi kedalaman agar tidak lemot
+            if total_sticks > 500:
+                current_depth_limit = min(self.max_depth, 100)
+            self.depth_limit = current_depth_limit
+
+            # PVS di root: langkah pertama (oracle) adalah principal variation;
+            # langkah lain cukup diuji dengan probe null-window yang sama, dan
+            # karena nilainya biner hasil probe tidak pernah perlu re-search
+            pvs = self.search == "pvs"
+
+            for move in moves:
+                position.play(*move)
+                try:
+                    if pvs:
+                        value = -self.probe(position, current_depth_limit)
+                    else:
+                        value = self.alphabeta(position, False, alpha, beta, current_depth_limit)
+                except SearchTimeout:
+                    # Waktu habis: pakai langkah terbaik yang sudah terbukti
+                    timed_out = True
+                    break
+                position.undo(*move)
+
+                if value > best_value:
+                    best_value = value
+                    best_move = move
+
+                alpha = max(alpha, best_value)
+                # +1 adalah nilai maksimum: langkah lain tidak mungkin lebih baik
+                if best_value >= 1:
+                    break
+
+            # Belum ada langkah yang selesai dievaluasi -> ambil langkah urutan pertama
+            if best_move is None and moves:
+                best_move = moves[0]
+            self.deadline = None
+
+            # Histogram: (size, jumlah) -> (index_tumpukan, jumlah)
+            if best_move is not None and self.position_type is PileHistogram:
+                best_move = PileHistogram.to_pile_move(state, best_move)
 
+            duration_ms = (time.time() - start_time) * 1000.0
+
+            stats = {
+                "algorithm": "Alpha-Beta (Robust)",
+                "duration_ms": duration_ms,
+                "nodes_explored": self.nodes_explored,
+                "pruning_count": self.pruning_count,
+                "best_value": best_value,
+                "total_possible_moves": len(moves),
+                "depth_limit": current_depth_limit,
+                "time_limit_ms": time_limit_ms,
+                "timed_out": timed_out,
+                "memo_size": len(self.memo),
+                "memo_peak": max(self.memo_peak, len(self.memo)),
+                "memo_bytes": approx_table_bytes(self.memo),
+                "representation": self.representation,
+                "search": self.search
+            }
+        finally:
+            # tracemalloc tidak boleh tertinggal aktif jika pencarian gagal
+            memory = tracker.stop() if tracker is not None else None
+        if memory is not None:
+            stats.update(memory)
+        return best_move, stats
+
+    def analyse(self, state, time_limit_ms=None):
+        """
+        Multi-PV: nilai SETIAP langkah root yang berbeda, bukan hanya yang terbaik.
+
+        Langkah yang menghasilkan posisi kanonik sama (mis. mengambil dari
+        dua tumpukan kembar) dievaluasi sekali. Semua langkah memakai satu
+        memo bersama dan probe null-window (nilai biner), jadi subposisi
+        yang sudah terbukti untuk satu langkah tidak dicari ulang. Jika
+        budget waktu habis, langkah yang belum selesai dilaporkan "unknown".
+
+        Returns:
+            tuple: (lines, stats). lines = list dict {"move", "moves" (semua
+            langkah root yang ekuivalen), "result" ("win" / "loss" / "unknown"
+            bagi pemain giliran), "nodes"}; menang dulu, lalu unknown, lalu kalah
+        """
+        start_time = time.time()
+        self.reset_counters(clear_memo=not self.keep_memo)
+        if time_limit_ms is None:
+            time_limit_ms = self.time_limit_ms
+        self.deadline = None if time_limit_ms is None else time.perf_counter() + time_limit_ms / 1000.0
+
+        position = self.position_type(state)
+        moves = position.moves()
+        moves.sort(key=lambda x: x[1], reverse=True)
+        self._oracle_first(position, moves)
+        depth = self.max_depth if position.total <= 500 else min(self.max_depth, 100)
+        self.depth_limit = depth
+
+        # Kelompokkan langkah per posisi hasil sebelum mencari apa pun
+        lines = []
+        representatives = []
+        by_child = {}
         for move in moves:
-            next_state = apply_move(state, move)
-            value = self.alphabeta(next_state, False, alpha, beta, current_depth_limit)
-            
-            if value > best_value:
-                best_value = value
-                best_move = move
-            
-            alpha = max(alpha, best_value)
-        
-        duration_ms = (time.time() - start_time) * 1000.0
-        
+            position.play(*move)
+            if self.canonicalize:
+                child = canonical_key(position, True)
+            else:
+                child = (position.key, position.check)
+            position.undo(*move)
+            pile_move = move
+            if self.position_type is PileHistogram:
+                pile_move = PileHistogram.to_pile_move(state, move)
+            line = by_child.get(child)
+            if line is None:
+                line = by_child[child] = {"move": pile_move, "moves": [],
+                                          "result": "unknown", "nodes": 0}
+                lines.append(line)
+                representatives.append(move)
+            line["moves"].append(pile_move)
+
+        timed_out = False
+        for line, move in zip(lines, representatives):
+            nodes_before = self.nodes_explored
+            position.play(*move)
+            try:
+                value = -self.probe(position, depth)
+            except SearchTimeout:
+                # position sudah termutasi di tengah probe: sisa langkah unknown
+                timed_out = True
+                line["nodes"] = self.nodes_explored - nodes_before
+                break
+            position.undo(*move)
+            line["nodes"] = self.nodes_explored - nodes_before
+            line["result"] = "win" if value > 0 else "loss"
+        self.deadline = None
+
+        order = {"win": 0, "unknown": 1, "loss": 2}
+        lines.sort(key=lambda line: order[line["result"]])
         stats = {
-            "algorithm": "Alpha-Beta (Robust)",
-            "duration_ms": duration_ms,
+            "algorithm": "Alpha-Beta (Analysis)",
+            "duration_ms": (time.time() - start_time) * 1000.0,
             "nodes_explored": self.nodes_explored,
             "pruning_count": self.pruning_count,
-            "best_value": best_value,
             "total_possible_moves": len(moves),
-            "depth_limit": current_depth_limit
+            "distinct_moves": len(lines),
+            "winning_moves": sum(len(line["moves"]) for line in lines if line["result"] == "win"),
+            "depth_limit": depth,
+            "time_limit_ms": time_limit_ms,
+            "timed_out": timed_out,
+            "memo_size": len(self.memo),
+            "representation": self.representation
         }
-        
-        return best_move, stats
+        return lines, stats
+
+
+def adaptive_depth(state, work_budget=SEARCH_WORK_BUDGET):
+    """
+    Pilih kedalaman agar pembuktian muat dalam work_budget.
+
+    Dengan memo yang benar, pembuktian menang/kalah harus mencoba SEMUA
+    langkah di setiap ply berselang (posisi kalah) termasuk root, dan tiap
+    node membangkitkan b langkah. Kerja ~ b^(depth/2 + 2) dengan b = jumlah
+    langkah berbeda (jumlah ukuran tumpukan berbeda; histogram).
+    """
+    branching = max(2, sum(set(state)))
+    full_width_plies = int(math.log(work_budget) / math.log(branching)) - 2
+    if full_width_plies < 1:
+        return 1
+    return 2 * full_width_plies
+
+
+def alphabeta_move(state, time_limit_ms=None, search=DEFAULT_SEARCH):
+    if time_limit_ms is None:
+        time_limit_ms = DEFAULT_MOVE_TIME_MS
+    # Histogram hanya menguntungkan jika ada ukuran tumpukan kembar
+    active = [p for p in state if p > 0]
+    representation = "histogram" if len(set(active)) < len(active) else "list"
+    agent = AlphaBetaAgent(max_depth=adaptive_depth(state), representation=representation,
+                           search=search)
+    return agent.get_best_move(state, time_limit_ms=time_limit_ms)
+
 
-def alphabeta_move(state):
-    agent = AlphaBetaAgent()
-    return agent.get_best_move(state)
\ No newline at end of file
+def alphabeta_analyse(state, time_limit_ms=None):
+    """Evaluasi semua langkah root (AlphaBetaAgent.analyse) dengan setting alphabeta_move()."""
+    if time_limit_ms is None:
+        time_limit_ms = DEFAULT_MOVE_TIME_MS
+    active = [p for p in state if p > 0]
+    representation = "histogram" if len(set(active)) < len(active) else "list"
+    agent = AlphaBetaAgent(max_depth=adaptive_depth(state), representation=representation,
+                           search="pvs")
+    return agent.analyse(state, time_limit_ms=time_limit_ms)
@@ -0,0 +1,300 @@
+"""
+Engine Sprague-Grundy untuk NIM dan varian subtraction game.
+
+Setiap tumpukan diringkas menjadi satu nilai Grundy dari tabel yang
+dihitung sekali per rule set (lalu di-cache dan diperbesar jika perlu).
+Posisi menang/kalah cukup dibaca dari XOR nilai Grundy, sehingga
+memilih langkah hanya O(jumlah tumpukan x jumlah pengambilan legal).
+
+Misère memakai aturan "tame" (Conway): jika semua nilai Grundy <= 1,
+pemain giliran menang bila XOR == 0; selain itu menang bila XOR != 0.
+Aturan ini berlaku untuk NIM biasa dan rule set bawaan; untuk rule set
+lain diverifikasi dulu dengan brute force pada posisi kecil.
+"""
+
+import time
+from array import array
+from functools import lru_cache
+
+from game.rules import get_rule_set
+
+# Ukuran awal tabel Grundy; tabel diperbesar 2x saat tumpukan lebih besar
+INITIAL_TABLE_SIZE = 1024
+# Di atas ukuran ini nilai diambil lewat periode (tabel tidak diperbesar lagi)
+MAX_TABLE_SIZE = 1 << 20
+# Batas posisi kecil untuk verifikasi aturan misère: (jumlah tumpukan, ukuran)
+MISERE_CHECK_PILES = 3
+MISERE_CHECK_SIZE = 12
+
+_tables = {}
+_periods = {}
+_misere_checked = {}
+
+
+def _closed_form_period(rules):
+    """
+    Periode tabel Grundy jika bentuk tertutupnya diketahui, atau None.
+
+    - ambil 1..m        -> n mod (m + 1)
+    - ambil pangkat dua -> n mod 3
+    """
+    if rules.allowed == "powers_of_two":
+        return 3
+    if rules.allowed == tuple(range(1, len(rules.allowed) + 1)):
+        return len(rules.allowed) + 1
+    return None
+
+
+def _detect_period(rules, table):
+    """
+    Cari periode p dengan table[n] == table[n + p] di paruh akhir tabel.
+
+    Subtraction game berhingga (pengambilan maksimum s) pasti periodik
+    pada akhirnya, dan cukup s nilai berurutan yang cocok untuk
+    membuktikan periodisitas selanjutnya.
+
+    Returns:
+        tuple (awal_periodik, periode) atau None
+    """
+    length = len(table)
+    if rules.allowed == "powers_of_two" or max(rules.allowed) > length // 4:
+        return None
+    start = length // 2
+    for p in range(1, length // 4 + 1):
+        if all(table[n] == table[n + p] for n in range(start, length - p)):
+            return start, p
+    return None
+
+
+def _extend_table(rules, table, size):
+    """Tambah isi `table` sampai panjangnya `size` (nilai mex per ukuran)."""
+    periodic = _periods.get(rules.name)
+    if periodic is None and not table:
+        period = _closed_form_period(rules)
+        if period is not None:
+            periodic = (0, period)
+            table.extend(range(period))
+
+    # Hitung mex bertahap (berlipat dua) dan cek periode setiap tahap
+    while periodic is None and len(table) < size:
+        for n in range(len(table), min(size, max(INITIAL_TABLE_SIZE, 2 * len(table)))):
+            reachable = 0
+            for k in rules.takes(n):
+                reachable |= 1 << table[n - k]
+            # mex = bit 0 terendah pada mask nilai yang bisa dicapai
+            table.append((~reachable & (reachable + 1)).bit_length() - 1)
+        periodic = _detect_period(rules, table)
+    if periodic is None:
+        return
+
+    # Pola periodik: salin blok (kelipatan periode) sekaligus, tanpa mex
+    # per ukuran; blok berlipat dua setiap putaran
+    _periods[rules.name] = periodic
+    start, period = periodic
+    while len(table) < size:
+        block = (len(table) - start) // period * period
+        table.extend(table[-block:])
+    del table[size:]
+
+
+def grundy_table(rules, max_pile):
+    """
+    Tabel nilai Grundy untuk ukuran 0..max_pile (minimal), di-cache per rule set.
+
+    Args:
+        rules: RuleSet / nama rule set (tidak boleh NIM biasa, g(n) = n)
+        max_pile: Ukuran tumpukan terbesar yang dibutuhkan
+
+    Returns:
+        array: table[n] = nilai Grundy tumpukan berukuran n
+    """
+    rules = get_rule_set(rules)
+    table = _tables.get(rules.name)
+    if table is None:
+        table = array("I")
+        _tables[rules.name] = table
+    if len(table) <= max_pile:
+        size = max(INITIAL_TABLE_SIZE, len(table))
+        while size <= max_pile:
+            size *= 2
+        _extend_table(rules, table, size)
+    return table
+
+
+def grundy_function(rules, max_pile):
+    """
+    Fungsi g(n) untuk 0 <= n <= max_pile.
+
+    Tumpukan raksasa (mis. 10^9 stik) tidak butuh tabel sepanjang itu:
+    di luar MAX_TABLE_SIZE nilai diambil dari periode tabel.
+
+    Raises:
+        ValueError: Jika tabel belum periodik sampai MAX_TABLE_SIZE
+    """
+    rules = get_rule_set(rules)
+    table = grundy_table(rules, min(max_pile, MAX_TABLE_SIZE - 1))
+    if max_pile < len(table):
+        return table.__getitem__
+    periodic = _periods.get(rules.name)
+    if periodic is None:
+        raise ValueError(f"Tabel Grundy '{rules.name}' tidak periodik sampai {MAX_TABLE_SIZE}")
+    start, period = periodic
+    limit = len(table)
+
+    def grundy(n):
+        return table[n] if n < limit else table[start + (n - start) % period]
+    return grundy
+
+
+def grundy_values(piles, rules=None):
+    """Nilai Grundy setiap tumpukan (NIM biasa: nilai = ukuran tumpukan)."""
+    rules = get_rule_set(rules)
+    if rules is None or rules.is_unrestricted:
+        return list(piles)
+    return list(map(grundy_function(rules, max(piles, default=0)), piles))
+
+
+def check_misere_rule(rules):
+    """
+    Verifikasi (brute force, di-cache) bahwa aturan misère "tame" benar
+    untuk rule set ini pada semua posisi kecil.
+
+    Raises:
+        ValueError: Jika ada posisi kecil yang melanggar aturan
+    """
+    rules = get_rule_set(rules)
+    if rules is None or rules.is_unrestricted:
+        return
+    if rules.name in _misere_checked:
+        if not _misere_checked[rules.name]:
+            raise ValueError(f"Misère play tidak didukung untuk rule set '{rules.name}'")
+        return
+
+    table = grundy_table(rules, MISERE_CHECK_SIZE)
+
+    @lru_cache(maxsize=None)
+    def mover_wins(piles):
+        if not any(piles):
+            return True  # lawan baru saja mengambil stik terakhir
+        for i, p in enumerate(piles):
+            for k in rules.takes(p):
+                child = tuple(sorted(piles[:i] + (p - k,) + piles[i + 1:]))
+                if not mover_wins(child):
+                    return True
+        return False
+
+    def positions(count, low):
+        if count == 0:
+            yield ()
+            return
+        for p in range(low, MISERE_CHECK_SIZE + 1):
+            for rest in positions(count - 1, p):
+                yield (p,) + rest
+
+    ok = True
+    for piles in positions(MISERE_CHECK_PILES, 0):
+        values = [table[p] for p in piles]
+        if mover_wins(piles) != _misere_mover_wins(values):
+            ok = False
+            break
+    _misere_checked[rules.name] = ok
+    if not ok:
+        raise ValueError(f"Misère play tidak didukung untuk rule set '{rules.name}'")
+
+
+def _misere_mover_wins(values):
+    xor = 0
+    big = False
+    for g in values:
+        xor ^= g
+        big = big or g > 1
+    return xor != 0 if big else xor == 0
+
+
+def _find_take(rules, grundy, pile, target):
+    """Jumlah legal yang diambil dari `pile` agar nilai Grundy-nya `target`."""
+    if grundy is None:
+        return pile - target if target < pile else None
+    for k in rules.takes(pile):
+        if grundy(pile - k) == target:
+            return k
+    return None
+
+
+def grundy_move(state, time_limit_ms=None, rules=None, misere=True):
+    """
+    Pilih langkah dari nilai Grundy per tumpukan.
+
+    Args:
+        state: List / NimState jumlah stik per tumpukan
+        time_limit_ms: Diterima agar seragam dengan engine lain (selalu instan)
+        rules: RuleSet / nama rule set (None = NIM biasa)
+        misere: True = pengambil stik terakhir kalah, False = normal play
+
+    Returns:
+        tuple: (move, stats)
+    """
+    start_time = time.perf_counter()
+    rules = get_rule_set(rules)
+    # Tumpukan array('Q') (huge-board) dipakai langsung tanpa salinan list
+    piles = getattr(state, "piles", state)
+
+    if rules is None or rules.is_unrestricted:
+        grundy = None
+        values = piles
+    else:
+        grundy = grundy_function(rules, max(piles, default=0))
+        values = list(map(grundy, piles))
+        if misere:
+            check_misere_rule(rules)
+
+    if grundy is None and hasattr(state, "nim_sum"):
+        # NIM biasa: XOR & jumlah nilai > 1 sudah di-cache NimState (O(1))
+        xor, bigs = state.nim_sum, state.bigs
+    else:
+        xor = 0
+        bigs = 0
+        for g in values:
+            xor ^= g
+            if g > 1:
+                bigs += 1
+
+    move = None
+    if misere:
+        winning = xor != 0 if bigs else xor == 0
+    else:
+        winning = xor != 0
+
+    if winning:
+        strategy_used = "Grundy XOR -> losing position for opponent"
+        for i, p in enumerate(piles):
+            if p == 0:
+                continue
+            g = values[i]
+            target = g ^ xor
+            # Misère: jika setelah langkah semua nilai Grundy <= 1,
+            # lawan harus menerima XOR 1 (jumlah tumpukan bernilai 1 ganjil)
+            if misere and target <= 1 and bigs - (g > 1) == 0:
+                target ^= 1
+            k = _find_take(rules, grundy, p, target)
+            if k is not None:
+                move = (i, k)
+                break
+
+    if move is None:
+        # Posisi kalah: ambil 1 dari tumpukan terbesar agar permainan panjang
+        strategy_used = "Losing position (stall)"
+        largest = max(piles, default=0)
+        if largest > 0:
+            move = (piles.index(largest), 1)
+
+    stats = {
+        "algorithm": "Sprague-Grundy",
+        "duration_ms": (time.perf_counter() - start_time) * 1000.0,
+        "strategy": strategy_used,
+        "nodes_explored": 0,
+        "grundy_xor": xor,
+        "rule_set": rules.name if rules is not None else "nim",
+        "misere": misere
+    }
+    return move, stats
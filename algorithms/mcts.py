@@ -0,0 +1,331 @@
+"""
+Monte Carlo Tree Search (UCT) untuk NIM Misère dan varian rule set.
+
+Tidak memakai teori NIM-SUM sama sekali, sehingga tetap bisa dipakai
+pada varian tanpa strategi tertutup. Kekuatan diatur lewat budget
+waktu / iterasi.
+
+Optimasi:
+  - Rollout dijalankan per batch: satu seleksi + ekspansi + backprop
+    untuk `batch_size` playout sekaligus dari leaf yang sama, sehingga
+    overhead traversal pohon dibagi ke banyak playout.
+  - Playout memakai list tumpukan tidak-kosong dengan swap-remove (O(1)
+    per langkah) dan tidak membuat state baru.
+  - Pohon dipakai ulang antar langkah: setelah lawan bergerak, subtree
+    yang cocok dengan posisi baru menjadi root berikutnya.
+  - MCTS-Solver: node yang sudah terbukti menang/kalah tidak di-rollout
+    lagi dan buktinya dirambatkan ke atas (playout acak NIM Misère
+    sangat bising, jadi bukti pasti di akhir permainan sangat membantu).
+"""
+
+import math
+import random
+import time
+
+from game.rules import get_rule_set
+
+DEFAULT_MOVE_TIME_MS = 1000
+DEFAULT_BATCH_SIZE = 16
+# Konstanta eksplorasi UCT (sqrt(2) = UCB1 klasik)
+DEFAULT_EXPLORATION = math.sqrt(2)
+
+# Nilai terbukti (dari sudut pandang pemain yang bergerak menuju node)
+WIN, LOSS = 1, -1
+
+
+class MCTSNode:
+    """
+    Satu node pohon. `wins` dihitung dari sudut pandang pemain yang
+    melakukan `move` menuju node ini (pemain giliran di parent).
+    """
+
+    __slots__ = ("piles", "parent", "move", "children", "untried", "visits", "wins",
+                 "proven")
+
+    def __init__(self, piles, parent=None, move=None):
+        self.piles = piles
+        self.parent = parent
+        self.move = move
+        self.children = []
+        self.untried = None  # dibangkitkan saat node pertama kali diekspansi
+        self.visits = 0
+        self.wins = 0.0
+        # Pengambil stik terakhir kalah (Misère)
+        self.proven = LOSS if not any(piles) else None
+
+    def count(self):
+        """Jumlah node di subtree ini (termasuk node ini)."""
+        total = 0
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            total += 1
+            stack.extend(node.children)
+        return total
+
+
+class MCTSAgent:
+    """
+    Agen MCTS dengan pohon yang bertahan antar panggilan get_best_move().
+    """
+
+    def __init__(self, time_limit_ms=None, max_iterations=None,
+                 batch_size=DEFAULT_BATCH_SIZE, exploration=DEFAULT_EXPLORATION,
+                 seed=None):
+        """
+        Args:
+            time_limit_ms: Budget waktu default per langkah (None = DEFAULT_MOVE_TIME_MS)
+            max_iterations: Batas jumlah batch per langkah (None = hanya waktu)
+            batch_size: Jumlah playout per leaf yang diekspansi
+            exploration: Konstanta eksplorasi UCT
+            seed: Seed RNG (untuk hasil yang bisa direproduksi)
+        """
+        self.time_limit_ms = time_limit_ms
+        self.max_iterations = max_iterations
+        self.batch_size = batch_size
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.root = None
+        self.rules = None
+        self._takes_cache = {}
+
+        # Statistik langkah terakhir
+        self.iterations = 0
+        self.playouts = 0
+        self.nodes_created = 0
+
+    def reset_tree(self):
+        self.root = None
+
+    # ---------------- TREE REUSE ----------------
+    def _find_root(self, piles):
+        """
+        Cari node untuk `piles` di pohon sebelumnya: root itu sendiri,
+        atau balasan lawan setelah langkah yang kita pilih (root = anak terpilih).
+        """
+        if self.root is None:
+            return None
+        if self.root.piles == piles:
+            return self.root
+        for child in self.root.children:
+            if child.piles == piles:
+                return child
+        return None
+
+    # ---------------- MOVES ----------------
+    def _legal_moves(self, piles):
+        rules = self.rules
+        if rules is None:
+            return [(i, k) for i, p in enumerate(piles) for k in range(1, p + 1)]
+        return [(i, k) for i, p in enumerate(piles) for k in rules.takes(p)]
+
+    def _takes(self, pile):
+        """Tuple jumlah legal untuk rule set terbatas (di-cache per ukuran)."""
+        takes = self._takes_cache.get(pile)
+        if takes is None:
+            takes = self._takes_cache[pile] = tuple(self.rules.takes(pile))
+        return takes
+
+    # ---------------- SEARCH ----------------
+    def _select(self, node):
+        log_parent = 0.0
+        c = self.exploration
+        while node.proven is None and not node.untried and node.children:
+            log_parent = math.log(node.visits)
+            node = max(
+                node.children,
+                key=lambda ch: ch.wins / ch.visits + c * math.sqrt(log_parent / ch.visits)
+            )
+        return node
+
+    def _expand(self, node):
+        if node.untried is None:
+            node.untried = self._legal_moves(node.piles)
+        if not node.untried:
+            return node
+        # Ambil langkah acak dari yang belum dicoba (swap-remove)
+        untried = node.untried
+        j = self.rng.randrange(len(untried))
+        untried[j], untried[-1] = untried[-1], untried[j]
+        i, k = untried.pop()
+        piles = node.piles[:i] + (node.piles[i] - k,) + node.piles[i + 1:]
+        child = MCTSNode(piles, node, (i, k))
+        node.children.append(child)
+        self.nodes_created += 1
+        return child
+
+    @staticmethod
+    def _propagate_proof(node):
+        """
+        Rambatkan bukti dari `node` ke atas.
+
+        Parent kalah (bagi yang bergerak ke parent) jika ada anak yang
+        terbukti menang bagi pemain giliran; parent menang jika semua
+        langkah sudah dicoba dan semuanya terbukti kalah.
+        """
+        while node.proven is not None and node.parent is not None:
+            parent = node.parent
+            if parent.proven is not None:
+                return
+            if node.proven == WIN:
+                parent.proven = LOSS
+            elif not parent.untried and all(ch.proven == LOSS for ch in parent.children):
+                parent.proven = WIN
+            else:
+                return
+            node = parent
+
+    def _rollout_batch(self, piles, count):
+        """
+        Jalankan `count` playout dari `piles`.
+
+        Playout acak, kecuali langkah yang langsung menyisakan tepat 1 stik
+        untuk lawan selalu diambil jika legal (berlaku di semua rule set).
+
+        Returns:
+            int: Berapa playout yang dimenangkan pemain giliran di `piles`
+        """
+        rand = self.rng.random
+        restricted = self.rules is not None
+        takes_of = self._takes
+        is_legal = self.rules.is_legal if restricted else None
+        start = [p for p in piles if p]
+        wins = 0
+        for _ in range(count):
+            live = start.copy()
+            turn = 0
+            while live:
+                turn ^= 1
+                n = len(live)
+                if n == 1 and live[0] > 1 and (not restricted or is_legal(live[0], live[0] - 1)):
+                    live[0] = 1
+                    continue
+                if n == 2 and 1 in live:
+                    other = live[0] if live[1] == 1 else live[1]
+                    if not restricted or is_legal(other, other):
+                        live = [1]
+                        continue
+                # int(random() * n) jauh lebih murah daripada randrange()
+                j = int(rand() * n)
+                p = live[j]
+                if restricted:
+                    takes = takes_of(p)
+                    p -= takes[int(rand() * len(takes))]
+                else:
+                    p -= 1 + int(rand() * p)
+                if p:
+                    live[j] = p
+                else:
+                    live[j] = live[-1]
+                    live.pop()
+            # Pengambil stik terakhir (sisi turn ^ 1) kalah
+            if turn == 0:
+                wins += 1
+        self.playouts += count
+        return wins
+
+    def _iterate(self, root):
+        leaf = self._select(root)
+        if leaf.proven is None:
+            leaf = self._expand(leaf)
+        batch = self.batch_size
+        if leaf.proven is not None:
+            # Termasuk leaf terminal: pengambil stik terakhir kalah
+            reward = 1.0 if leaf.proven == WIN else 0.0
+            self._propagate_proof(leaf)
+        else:
+            # Menang bagi pemain giliran di leaf = kalah bagi yang bergerak ke leaf
+            reward = 1.0 - self._rollout_batch(leaf.piles, batch) / batch
+
+        # Satu batch dihitung satu kunjungan (reward = rata-rata batch)
+        # agar skala eksplorasi UCT tidak bergantung pada batch_size
+        node = leaf
+        while node is not None:
+            node.visits += 1
+            node.wins += reward
+            reward = 1.0 - reward
+            node = node.parent
+
+    @staticmethod
+    def _choose(root):
+        if not root.children:
+            return None
+        return max(root.children, key=_choose_key)
+
+    def get_best_move(self, state, time_limit_ms=None, rules=None):
+        """
+        Cari langkah terbaik untuk `state` dalam budget waktu / iterasi.
+
+        Returns:
+            tuple: (move, stats)
+        """
+        start_time = time.perf_counter()
+        if time_limit_ms is None:
+            time_limit_ms = self.time_limit_ms or DEFAULT_MOVE_TIME_MS
+        deadline = start_time + time_limit_ms / 1000.0
+
+        rules = get_rule_set(rules)
+        if rules is not None and rules.is_unrestricted:
+            rules = None
+        if rules is not self.rules:
+            self.rules = rules
+            self._takes_cache = {}
+            self.reset_tree()
+
+        piles = tuple(state)
+        root = self._find_root(piles)
+        reused_visits = root.visits if root is not None else 0
+        if root is None:
+            root = MCTSNode(piles)
+        root.parent = None
+        root.move = None
+
+        self.iterations = 0
+        self.playouts = 0
+        self.nodes_created = 0
+        while True:
+            self._iterate(root)
+            self.iterations += 1
+            if self.max_iterations is not None and self.iterations >= self.max_iterations:
+                break
+            if time.perf_counter() >= deadline:
+                break
+            if root.proven is not None:
+                break
+
+        best = self._choose(root)
+        # Root berikutnya dicari di antara balasan lawan atas langkah ini
+        self.root = best
+
+        stats = {
+            "algorithm": "MCTS",
+            "proven": {WIN: "loss", LOSS: "win", None: None}[root.proven],
+            "duration_ms": (time.perf_counter() - start_time) * 1000.0,
+            "nodes_explored": self.nodes_created,
+            "iterations": self.iterations,
+            "playouts": self.playouts,
+            "batch_size": self.batch_size,
+            "reused_visits": reused_visits,
+            "root_visits": root.visits,
+            "win_rate": best.wins / best.visits if best is not None else 0.0,
+            "time_limit_ms": time_limit_ms
+        }
+        return (best.move if best is not None else None), stats
+
+
+def _choose_key(child):
+    # Langkah terbukti menang dulu, terbukti kalah paling akhir, lalu visits
+    return (child.proven == WIN, child.proven != LOSS, child.visits)
+
+
+def mcts_move(state, time_limit_ms=None, rules=None, agent=None):
+    """
+    Fungsi engine untuk algo_map.
+
+    Args:
+        agent: MCTSAgent yang dipakai ulang antar langkah (tree reuse).
+            None = agen baru tanpa pohon sebelumnya.
+    """
+    if agent is None:
+        agent = MCTSAgent()
+    return agent.get_best_move(state, time_limit_ms=time_limit_ms, rules=rules)
@@ -0,0 +1,87 @@
+"""
+Akuntansi memori struktur pencarian untuk stats engine.
+
+approx_table_bytes() memperkirakan ukuran transposition table dari
+sys.getsizeof dict ditambah rata-rata ukuran sampel entri (key + nilai),
+jadi biayanya O(sampel), bukan O(entri), dan aman dipanggil tiap langkah.
+
+MemoryTracker (opsional) membungkus tracemalloc selama satu pencarian
+untuk peak byte dan hotspot alokasi per baris kode. tracemalloc membuat
+setiap alokasi jauh lebih lambat, jadi hanya dipakai jika diminta.
+"""
+
+import sys
+import tracemalloc
+from itertools import islice
+from pathlib import Path
+
+# Jumlah entri yang diukur untuk memperkirakan ukuran rata-rata entri
+TABLE_SAMPLE = 64
+# Jumlah hotspot alokasi yang dilaporkan
+HOTSPOT_COUNT = 5
+
+
+def _object_bytes(obj):
+    """Ukuran objek + isi tuple (int kecil yang di-cache interpreter gratis)."""
+    if isinstance(obj, tuple):
+        return sys.getsizeof(obj) + sum(_object_bytes(x) for x in obj)
+    if isinstance(obj, int) and -5 <= obj <= 256:
+        return 0
+    return sys.getsizeof(obj)
+
+
+def approx_table_bytes(table, sample=TABLE_SAMPLE):
+    """Perkiraan byte yang dipakai dict `table` beserta key & nilainya."""
+    items = list(islice(table.items(), sample))
+    if not items:
+        return sys.getsizeof(table)
+    per_entry = sum(_object_bytes(k) + _object_bytes(v) for k, v in items) / len(items)
+    return int(sys.getsizeof(table) + len(table) * per_entry)
+
+
+def frame_location(frame):
+    # Dua komponen path terakhir cukup untuk dikenali (mis. algorithms/alpha_beta.py)
+    return f"{Path(*Path(frame.filename).parts[-2:])}:{frame.lineno}"
+
+
+class MemoryTracker:
+    """
+    Ukur alokasi selama satu pencarian dengan tracemalloc.
+
+    Jika tracemalloc sudah aktif (mis. soak test), tracing dibiarkan
+    berjalan; jika tidak, dinyalakan di start() dan dimatikan di stop().
+    """
+
+    def __init__(self, top=HOTSPOT_COUNT):
+        self.top = top
+        self._owns_tracing = False
+        self._before = None
+
+    def start(self):
+        self._owns_tracing = not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._before = tracemalloc.take_snapshot()
+
+    def stop(self):
+        """
+        Returns:
+            dict: "traced_peak_bytes" dan "memory_hotspots" (list lokasi,
+                selisih byte & jumlah blok sejak start(), terbesar dulu)
+        """
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        if self._owns_tracing:
+            tracemalloc.stop()
+        ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+        diff = snapshot.filter_traces(ignore).compare_to(self._before.filter_traces(ignore), "lineno")
+        self._before = None
+        return {
+            "traced_peak_bytes": peak,
+            "memory_hotspots": [
+                {"location": frame_location(stat.traceback[0]),
+                 "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in diff[:self.top]
+            ]
+        }
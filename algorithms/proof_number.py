@@ -0,0 +1,315 @@
+"""
+Depth-first proof-number search (df-pn) untuk NIM Misère.
+
+Berbeda dengan alpha-beta berbatas kedalaman, df-pn tidak pernah memakai
+heuristic_value(): hasil hanya dilaporkan "terbukti" jika pohon buktinya
+benar-benar lengkap sampai posisi terminal.
+
+Formulasi negamax (Nagai): setiap node menyimpan
+    phi   = proof number   (bukti pemain giliran MENANG)
+    delta = disproof number (bukti pemain giliran KALAH)
+dengan phi(n) = min delta(anak) dan delta(n) = sum phi(anak).
+
+Optimasi:
+  - Node adalah tuple posisi tereduksi: bentuk kanonik (sama dengan
+    canonicalize di AlphaBetaAgent) atau cukup tumpukan tidak-kosong
+    terurut. Anak selalu punya total stik lebih kecil dari node-nya,
+    jadi graf pencarian asiklik dan tuple bisa langsung jadi kunci TT.
+  - Inisialisasi df-pn+: teori NIM-SUM hanya dipakai untuk nilai awal
+    phi/delta anak yang belum pernah dikunjungi dan urutan langkah,
+    tidak pernah sebagai hasil akhir.
+  - Anak node tereduksi dihitung inkremental (hapus satu tumpukan,
+    sisipkan sisanya, batalkan pasangan kembar) dan daftar anak di-cache,
+    karena df-pn mengunjungi ulang node yang sama berkali-kali.
+  - Transposition table dibatasi jumlah entrinya; saat penuh, entri yang
+    belum terbukti dibuang lebih dulu (anak-anak root tidak pernah dibuang).
+"""
+
+import time
+from bisect import bisect_left
+
+from algorithms.alpha_beta import SearchTimeout, canonical_form
+from algorithms.memory_stats import MemoryTracker, approx_table_bytes
+
+# "Tak hingga" integer untuk proof / disproof number
+INF = 1 << 40
+# Nilai awal phi / delta yang "sulit" untuk anak yang menurut teori
+# berlawanan (masih berhingga: belum terbukti)
+INIT_HARD = 1000
+DEFAULT_MOVE_TIME_MS = 2000
+# Batas entri TT (tuple posisi kecil + pasangan int, ~200 byte per entri)
+DEFAULT_MAX_ENTRIES = 500_000
+# Batas total anak yang disimpan di cache ekspansi (dikosongkan jika lewat)
+CHILDREN_CACHE_LIMIT = 1_000_000
+
+
+def _theory_wins(node):
+    """Prediksi teori misère: apakah pemain giliran di `node` menang."""
+    nim_sum = 0
+    ones = 0
+    bigs = False
+    for p in node:
+        nim_sum ^= p
+        if p == 1:
+            ones += 1
+        elif p > 1:
+            bigs = True
+    return nim_sum != 0 if bigs else ones % 2 == 0
+
+
+class ProofNumberAgent:
+    """
+    Agen df-pn dengan transposition table terbatas.
+
+    TT: tuple posisi tereduksi -> (phi, delta), dari sudut pandang pemain giliran.
+    """
+
+    def __init__(self, time_limit_ms=None, max_entries=DEFAULT_MAX_ENTRIES,
+                 node_limit=None, canonicalize=True, track_memory=False):
+        """
+        Args:
+            time_limit_ms: Budget waktu default per langkah (None = DEFAULT_MOVE_TIME_MS)
+            max_entries: Batas jumlah entri transposition table
+            node_limit: Batas jumlah node per pencarian (None = hanya waktu)
+            canonicalize: True = reduksi kanonik (pasangan kembar dihapus);
+                False = hanya urutan tumpukan yang diabaikan
+            track_memory: True = tracemalloc selama pencarian (peak &
+                hotspot alokasi di stats; jauh lebih lambat)
+        """
+        self.time_limit_ms = time_limit_ms
+        self.max_entries = max_entries
+        self.node_limit = node_limit
+        self.canonicalize = canonicalize
+        self.track_memory = track_memory
+        self.table = {}
+        self.deadline = None
+        self.stop_requested = False
+        self._pinned = frozenset()
+        self._root = None
+        self._children_cache = {}
+        self._cached_children = 0
+
+        # Statistik pencarian terakhir
+        self.nodes_explored = 0
+        self.evictions = 0
+        self.peak_entries = 0
+
+    def _check_limits(self):
+        if self.stop_requested:
+            raise SearchTimeout()
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+        if self.node_limit is not None and self.nodes_explored >= self.node_limit:
+            raise SearchTimeout()
+
+    # ---------------- TABLE ----------------
+    def _store(self, node, phi, delta):
+        if len(self.table) >= self.max_entries and node not in self.table:
+            self._evict()
+        self.table[node] = (phi, delta)
+
+    def _evict(self):
+        """Buang entri yang belum terbukti; jika masih penuh, buang separuh yang tersisa."""
+        table = self.table
+        before = len(table)
+        self.peak_entries = max(self.peak_entries, before)
+        pinned = self._pinned
+        table = {node: e for node, e in table.items()
+                 if e[0] == 0 or e[1] == 0 or node in pinned}
+        if len(table) >= self.max_entries // 2:
+            items = list(table.items())
+            table = dict(items[len(items) // 2:])
+            table.update((node, e) for node, e in items if node in pinned)
+        self.table = table
+        self.evictions += before - len(table)
+
+    # ---------------- SEARCH ----------------
+    def _reduce(self, piles):
+        if self.canonicalize:
+            return tuple(canonical_form(piles))
+        return tuple(sorted(p for p in piles if p))
+
+    def _reduced_child(self, others, new):
+        """
+        Anak tereduksi dari node tereduksi (terurut, tanpa kembar) yang
+        satu tumpukannya diganti `new`; `others` = sisa tumpukan node.
+        """
+        values = list(others)
+        if new:
+            j = bisect_left(values, new)
+            if self.canonicalize and j < len(values) and values[j] == new:
+                del values[j]  # pasangan kembar saling menghapus
+            else:
+                values.insert(j, new)
+        if self.canonicalize and (new > 1 or (others and others[-1] > 1)) \
+                and not (values and values[-1] > 1):
+            # Penanda fase normal (lihat canonical_form)
+            values = sorted(values + [2, 2])
+        return tuple(values)
+
+    def _children(self, node, reduced=True):
+        """
+        Anak unik `node` sebagai list (move, anak, phi_awal, delta_awal),
+        langkah yang menurut teori menang di depan, lalu ambil terbanyak.
+
+        Args:
+            reduced: True jika `node` sendiri sudah tereduksi (bukan root asli)
+        """
+        cached = self._children_cache.get(node) if reduced else None
+        if cached is not None:
+            return cached
+        # Jalur inkremental hanya untuk node tanpa tumpukan kembar (penanda [2, 2])
+        fast = reduced and len(set(node)) == len(node)
+        piles = list(node)
+        seen = set()
+        good = []
+        rest = []
+        for i, p in enumerate(node):
+            others = node[:i] + node[i + 1:]
+            for k in range(p, 0, -1):
+                if fast:
+                    child = self._reduced_child(others, p - k)
+                else:
+                    piles[i] = p - k
+                    child = self._reduce(piles)
+                if child in seen:
+                    continue
+                seen.add(child)
+                if not child:
+                    # Lawan baru saja mengambil stik terakhir: anak menang bagi pemain giliran
+                    rest.append(((i, k), child, 0, INF))
+                elif _theory_wins(child):
+                    rest.append(((i, k), child, 1, INIT_HARD))
+                else:
+                    good.append(((i, k), child, INIT_HARD, max(1, sum(set(child)))))
+            piles[i] = p
+        children = good + rest
+
+        if reduced:
+            if self._cached_children + len(children) > CHILDREN_CACHE_LIMIT:
+                self._children_cache = {}
+                self._cached_children = 0
+            self._children_cache[node] = children
+            self._cached_children += len(children)
+        return children
+
+    def _mid(self, node, th_phi, th_delta):
+        """
+        Multiple iterative deepening: kembangkan `node` sampai
+        phi >= th_phi atau delta >= th_delta, lalu simpan dan kembalikan (phi, delta).
+        """
+        # Satu node df-pn mahal (semua anak dibangkitkan), jadi batas dicek tiap node
+        self.nodes_explored += 1
+        self._check_limits()
+
+        entry = self.table.get(node)
+        if entry is not None and (entry[0] >= th_phi or entry[1] >= th_delta):
+            return entry
+
+        children = self._children(node, reduced=node is not self._root)
+        while True:
+            # phi = min delta anak, delta = sum phi anak
+            table = self.table
+            delta = 0
+            best = None
+            best_phi = 0
+            best_delta = second_delta = INF
+            for child_info in children:
+                c_entry = table.get(child_info[1])
+                c_phi, c_delta = c_entry if c_entry is not None else child_info[2:]
+                delta += c_phi
+                if c_delta < best_delta:
+                    second_delta = best_delta
+                    best, best_phi, best_delta = child_info[1], c_phi, c_delta
+                elif c_delta < second_delta:
+                    second_delta = c_delta
+            phi = best_delta
+            delta = min(delta, INF)
+            if phi >= th_phi or delta >= th_delta:
+                break
+            self._mid(best,
+                      min(INF, th_delta + best_phi - delta),
+                      min(th_phi, second_delta + 1))
+
+        self._store(node, phi, delta)
+        return phi, delta
+
+    def get_best_move(self, state, time_limit_ms=None):
+        """
+        Cari bukti untuk posisi `state` dalam budget waktu / node / memori.
+
+        Returns:
+            tuple: (move, stats). stats["solved"] = "win" / "loss" (bagi pemain
+            giliran) jika terbukti, None jika budget habis lebih dulu.
+        """
+        start_time = time.perf_counter()
+        if time_limit_ms is None:
+            time_limit_ms = self.time_limit_ms or DEFAULT_MOVE_TIME_MS
+        self.deadline = start_time + time_limit_ms / 1000.0
+        self.nodes_explored = 0
+        self.evictions = 0
+        self.peak_entries = 0
+        timed_out = False
+        tracker = MemoryTracker() if self.track_memory else None
+        if tracker is not None:
+            tracker.start()
+
+        try:
+            # Root = posisi asli (bukan tereduksi) agar langkahnya berupa index tumpukan asli
+            root = self._root = tuple(state)
+            children = self._children(root, reduced=False)
+            self._pinned = frozenset(child for _, child, _, _ in children)
+            phi, delta = 1, 1
+            try:
+                phi, delta = self._mid(root, INF, INF)
+            except SearchTimeout:
+                timed_out = True
+            self.deadline = None
+
+            # Menang: anak dengan delta 0 (lawan terbukti kalah). Belum terbukti:
+            # anak yang paling dekat terbukti kalah bagi lawan.
+            move = None
+            best_delta = INF + 1
+            for child_move, child, init_phi, init_delta in children:
+                c_delta = self.table.get(child, (init_phi, init_delta))[1]
+                if c_delta < best_delta:
+                    move, best_delta = child_move, c_delta
+            if timed_out:
+                # Entri root belum tersimpan: hitung dari anak-anaknya
+                phi = best_delta
+                delta = min(INF, sum(self.table.get(child, (init_phi, init_delta))[0]
+                                     for _, child, init_phi, init_delta in children))
+            self._pinned = frozenset()
+            self._root = None
+
+            solved = "win" if phi == 0 else "loss" if delta == 0 else None
+            stats = {
+                "algorithm": "Proof-Number (df-pn)",
+                "duration_ms": (time.perf_counter() - start_time) * 1000.0,
+                "nodes_explored": self.nodes_explored,
+                "solved": solved,
+                "proof_number": phi,
+                "disproof_number": delta,
+                "best_value": {"win": 1, "loss": -1, None: 0}[solved],
+                "tt_size": len(self.table),
+                "tt_peak": max(self.peak_entries, len(self.table)),
+                "tt_bytes": approx_table_bytes(self.table),
+                "tt_evictions": self.evictions,
+                "time_limit_ms": time_limit_ms,
+                "timed_out": timed_out,
+                "canonicalize": self.canonicalize
+            }
+        finally:
+            # tracemalloc tidak boleh tertinggal aktif jika pencarian gagal
+            memory = tracker.stop() if tracker is not None else None
+        if memory is not None:
+            stats.update(memory)
+        return move, stats
+
+
+def proof_number_move(state, time_limit_ms=None):
+    """Fungsi engine untuk algo_map (agen & TT baru per langkah)."""
+    if time_limit_ms is None:
+        time_limit_ms = DEFAULT_MOVE_TIME_MS
+    agent = ProofNumberAgent()
+    return agent.get_best_move(state, time_limit_ms=time_limit_ms)
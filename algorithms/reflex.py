@@ -7,23 +7,30 @@ from functools import reduce
 from operator import ixor
 import time
 import random 
+from game.nim_logic import as_nim_state
 
 def nim_sum(state):
     """Hitung XOR dari semua tumpukan (NIM-SUM)."""
     return reduce(ixor, state, 0)
 
-def reflex_move(state):
+def reflex_move(state, time_limit_ms=None):
     """
     Strategi:
     1. End Game: Jika sisa tumpukan cuma angka 1 semua, atur biar ganjil/genap (Misere).
     2. Winning Position (Nim-Sum != 0): Cari langkah pasti biar Nim-Sum jadi 0.
     3. Losing Position (Nim-Sum == 0): Ambil acak (biar tidak kaku).
+
+    `time_limit_ms` diterima agar seragam dengan engine lain; Reflex selalu
+    instan sehingga budget waktu diabaikan.
     """
     start_time = time.time()
     
-    # Hitung jumlah tumpukan yang isinya cuma 1 (ones) dan lebih dari 1 (bigs)
-    ones = sum(1 for p in state if p == 1)
-    bigs = sum(1 for p in state if p > 1)
+    # Jumlah tumpukan yang isinya cuma 1 (ones) dan lebih dari 1 (bigs)
+    # sudah di-cache oleh NimState
+    position = as_nim_state(state)
+    state = position.piles
+    ones = position.ones
+    bigs = position.bigs
     
     move = None
     strategy_used = ""
@@ -47,7 +54,7 @@ def reflex_move(state):
  
     # KASUS 2: NORMAL GAME (Masih ada tumpukan besar)
     else:
-        nim = nim_sum(state)
+        nim = position.nim_sum
         
         # -POSISI KALAH (Losing Position)
         if nim == 0:
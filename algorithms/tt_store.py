@@ -0,0 +1,120 @@
+"""
+Simpan / muat transposition table (memo AlphaBetaAgent) ke file biner.
+
+Layout file (little-endian):
+    Header, 64 byte : magic "NIMTT\\0\\0\\0", versi format (u16), ukuran record (u16),
+                      nama rule set (16 byte), versi engine (16 byte),
+                      jumlah entri (u64), CRC32 seluruh record (u32)
+    Record, 18 byte : key (u64), check (u64), nilai (i8), flag (u8)
+
+File hanya dimuat jika versi format, rule set, dan versi engine (termasuk
+sidik jari kunci Zobrist) sama persis, ukuran file cocok dengan jumlah
+entri, dan CRC32 benar; selain itu ValueError dan engine mulai dingin.
+File ditulis ke path sementara lalu di-rename agar tidak pernah terpotong.
+
+Path default diambil dari environment variable NIM_TT_FILE.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+
+from algorithms.alpha_beta import ENGINE_VERSION, EXACT
+from game.zobrist import CHECKS, KEYS, REGIME_KEY, SIDE_KEY
+
+MAGIC = b"NIMTT\0\0\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHH16s16sQI8x")
+RECORD = struct.Struct("<QQbB")
+# Batas jumlah entri yang ditulis / dimuat (~18 byte per entri di disk)
+DEFAULT_MAX_ENTRIES = 2_000_000
+TT_FILE_ENV = "NIM_TT_FILE"
+
+
+def engine_fingerprint():
+    """Versi engine + sidik jari kunci Zobrist (entri lama tidak valid jika berubah)."""
+    keys = struct.pack("<4Q", KEYS[1], CHECKS[1], SIDE_KEY, REGIME_KEY)
+    return f"{ENGINE_VERSION}:{zlib.crc32(keys):08x}"
+
+
+def default_path():
+    """Path dari NIM_TT_FILE, atau None jika tidak di-set."""
+    return os.environ.get(TT_FILE_ENV) or None
+
+
+def _encode(text):
+    data = text.encode("ascii")
+    if len(data) > 16:
+        raise ValueError(f"'{text}' lebih dari 16 byte")
+    return data
+
+
+def save_table(memo, path, rules="nim", max_entries=DEFAULT_MAX_ENTRIES):
+    """
+    Tulis `memo` ke `path`. Jika lebih dari `max_entries`, entri EXACT
+    didahulukan (bound saja kurang berguna saat dimuat ulang).
+
+    Returns:
+        int: Jumlah entri yang ditulis
+    """
+    items = memo.items()
+    if len(memo) > max_entries:
+        exact = [(k, e) for k, e in items if e[2] == EXACT]
+        bounds = [(k, e) for k, e in items if e[2] != EXACT]
+        items = (exact + bounds)[:max_entries]
+
+    body = bytearray(RECORD.size * len(items))
+    offset = 0
+    pack_into = RECORD.pack_into
+    for key, (check, value, flag) in items:
+        pack_into(body, offset, key, check, int(value), flag)
+        offset += RECORD.size
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, _encode(rules),
+                         _encode(engine_fingerprint()), len(items), zlib.crc32(body))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, path)
+    return len(items)
+
+
+def load_table(path, rules="nim", max_entries=DEFAULT_MAX_ENTRIES):
+    """
+    Muat memo dari `path` (dibaca lewat mmap).
+
+    Returns:
+        dict: key -> (check, nilai, flag), paling banyak `max_entries` entri
+
+    Raises:
+        ValueError: File bukan TT, versi / rule set berbeda, atau rusak
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < HEADER.size:
+            raise ValueError(f"{path}: bukan file TT (terlalu kecil)")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, record_size, file_rules, engine, count, crc = HEADER.unpack_from(mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: bukan file TT (magic salah)")
+            if version != FORMAT_VERSION or record_size != RECORD.size:
+                raise ValueError(f"{path}: versi format {version} tidak didukung")
+            file_rules = file_rules.rstrip(b"\0").decode("ascii", "replace")
+            if file_rules != rules:
+                raise ValueError(f"{path}: TT untuk rule set '{file_rules}', bukan '{rules}'")
+            if engine.rstrip(b"\0") != _encode(engine_fingerprint()):
+                raise ValueError(f"{path}: TT dari versi engine lain")
+            end = HEADER.size + count * RECORD.size
+            if end != size:
+                raise ValueError(f"{path}: ukuran file tidak cocok dengan jumlah entri")
+            view = memoryview(mm)[HEADER.size:end]
+            try:
+                if zlib.crc32(view) != crc:
+                    raise ValueError(f"{path}: CRC salah (file rusak)")
+                stop = min(count, max_entries) * RECORD.size
+                return {key: (check, value, flag)
+                        for key, check, value, flag in RECORD.iter_unpack(view[:stop])}
+            finally:
+                view.release()
@@ -23,13 +23,85 @@ DIFFICULTY_LEVELS = {
         "description": "Tantangan ekstrem dengan 2000 stik",
         "piles": [50, 100, 150, 200, 250, 300, 350, 400, 450, 500],  
         "total_sticks": 2750
+    },
+    # Varian subtraction game: "rules" = nama rule set di game.rules.RULE_SETS
+    "Take 1-3": {
+        "description": "Hanya boleh mengambil 1-3 stik per langkah",
+        "piles": [7, 12, 18, 25, 33],
+        "total_sticks": 95,
+        "rules": "subtract_1_3"
+    },
+    "Powers of Two": {
+        "description": "Hanya boleh mengambil 1, 2, 4, 8, ... stik",
+        "piles": [100, 250, 400, 650, 1000],
+        "total_sticks": 2400,
+        "rules": "powers_of_two"
+    },
+    "Take 1, 3 or 4": {
+        "description": "Hanya boleh mengambil 1, 3, atau 4 stik",
+        "piles": [15, 30, 45, 60, 75, 90],
+        "total_sticks": 315,
+        "rules": "subtract_1_3_4"
+    }
+}
+
+# Level huge-board: tumpukan dibangkitkan dari seed oleh
+# game.huge_board.get_level() (terlalu besar untuk ditulis sebagai list)
+HUGE_LEVELS = {
+    "Huge: 100K piles": {
+        "description": "100.000 tumpukan berisi 1-1000 stik",
+        "num_piles": 100_000,
+        "max_pile": 1_000,
+        "seed": 1
+    },
+    "Huge: 1M piles": {
+        "description": "1.000.000 tumpukan berisi 1-100 stik",
+        "num_piles": 1_000_000,
+        "max_pile": 100,
+        "seed": 2
+    },
+    "Huge: giant piles": {
+        "description": "1.000 tumpukan berisi sampai 10^9 stik",
+        "num_piles": 1_000,
+        "max_pile": 1_000_000_000,
+        "seed": 3
+    },
+    "Huge: Take 1-3, 100K piles": {
+        "description": "100.000 tumpukan raksasa, hanya boleh ambil 1-3 stik",
+        "num_piles": 100_000,
+        "max_pile": 1_000_000_000,
+        "seed": 4,
+        "rules": "subtract_1_3"
     }
 }
 
 # Algoritma yang tersedia
 ALGORITHMS = {
     "Reflex": "Agen berbasis aturan (NIM-SUM)",
-    "Alpha-Beta": "Minimax dengan Alpha-Beta Pruning"
+    "Alpha-Beta": "Minimax dengan Alpha-Beta Pruning",
+    "Grundy": "Sprague-Grundy (tabel nilai Grundy, mendukung varian)",
+    "MCTS": "Monte Carlo Tree Search (UCT, rollout per batch)",
+    "Proof-Number": "Depth-first proof-number search (df-pn, hasil terbukti)"
+}
+
+# Kontrol waktu (chess clock) per pemain
+# - base_ms + increment_ms : total waktu per pemain + tambahan tiap langkah
+# - move_deadline_ms       : batas keras per langkah
+TIME_CONTROLS = {
+    "Unlimited": None,
+    "Blitz 5s + 100ms": {"base_ms": 5000, "increment_ms": 100},
+    "Bullet 1s + 20ms": {"base_ms": 1000, "increment_ms": 20},
+    "Deadline 200ms/move": {"move_deadline_ms": 200},
+    "Deadline 50ms/move": {"move_deadline_ms": 50}
+}
+
+# Kecepatan auto-play (delay antar langkah, ms). None = turbo: engine
+# jalan di thread latar secepat mungkin, canvas di-refresh per frame
+AUTO_PLAY_SPEEDS = {
+    "Normal": 600,
+    "Fast": 150,
+    "Very Fast": 30,
+    "Turbo": None
 }
 
 # Pengaturan GUI
@@ -40,5 +112,14 @@ GUI_CONFIG = {
     "match_width": 8,
     "match_height": 40,
     "match_gap": 6,
-    "row_spacing": 60
+    "row_spacing": 60,
+    # Log langkah: ditampung lalu ditulis sekali per interval (ms),
+    # baris lama dibuang di atas batas; False = tidak mencatat per langkah
+    "log_flush_ms": 250,
+    "log_max_lines": 500,
+    "log_moves": True,
+    # Batas frame rate canvas saat auto-play turbo
+    "turbo_fps": 20,
+    # Budget analisis (ms) untuk hint langkah menang di mode Player vs Komputer
+    "hint_time_ms": 300
 }
\ No newline at end of file
@@ -3,9 +3,56 @@ Controller untuk menjalankan pertandingan komputer vs komputer
 """
 
 import time
-from game.nim_logic import is_terminal, apply_move, get_moves
+from array import array
+from game.nim_logic import NimState, is_terminal, apply_move
+from game.huge_board import ArrayNimState, is_huge
+from game.rules import get_rule_set
+from game.match_log import FLAG_SUBSTITUTED, stats_flags
 from algorithms.reflex import reflex_move
 from algorithms.alpha_beta import alphabeta_move
+from algorithms.proof_number import proof_number_move
+from algorithms.grundy import grundy_move
+from algorithms.mcts import MCTSAgent, mcts_move
+
+# Engine diberi sedikit kurang dari budget agar sempat kembali sebelum deadline
+ENGINE_TIME_FACTOR = 0.9
+
+# Engine yang menerima argumen `rules` (varian subtraction game).
+# Engine lain hanya paham NIM biasa dan diganti Grundy pada varian.
+RULE_AWARE_ALGOS = {"Grundy", "MCTS"}
+
+# Engine yang tetap O(piles) tanpa enumerasi langkah (closed form).
+# Di huge-board mode engine lain diganti Grundy.
+HUGE_SAFE_ALGOS = {"Reflex", "Grundy"}
+
+# Engine yang menyimpan state antar langkah (mis. pohon MCTS). Controller
+# membuat satu agen per pemain dan mengopernya lewat argumen `agent`.
+AGENT_FACTORIES = {"MCTS": MCTSAgent}
+
+
+class MoveRecord:
+    """
+    Array prealokasi untuk merekam langkah play_full_game() tanpa alokasi
+    per langkah. Index j = langkah ke-(j + 1) sejak clear().
+
+    Langkah di luar `capacity` tidak direkam; capacity >= total stik awal
+    selalu cukup (setiap langkah mengambil minimal satu stik).
+    """
+
+    __slots__ = ("capacity", "count", "players", "piles", "takes", "duration_ms", "nodes")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0
+        self.players = array("B", bytes(capacity))
+        self.piles = array("Q", bytes(8 * capacity))
+        self.takes = array("Q", bytes(8 * capacity))
+        self.duration_ms = array("d", bytes(8 * capacity))
+        self.nodes = array("Q", bytes(8 * capacity))
+
+    def clear(self):
+        """Pakai ulang array untuk game berikutnya (isi lama ditimpa)."""
+        self.count = 0
 
 
 class GameController:
@@ -13,17 +60,32 @@ class GameController:
     Controller untuk mengelola pertandingan NIM antara dua AI.
     """
     
-    def __init__(self, initial_state, player1_algo, player2_algo):
+    def __init__(self, initial_state, player1_algo, player2_algo, time_control=None,
+                 rules=None, match_log=None, huge=None, profiler=None):
         """
         Inisialisasi game controller.
         
         Args:
             initial_state: List berisi jumlah stik di setiap tumpukan
-            player1_algo: str, "Reflex" atau "Alpha-Beta" atau "Human"
-            player2_algo: str, "Reflex" atau "Alpha-Beta"
+            player1_algo: str, "Reflex", "Alpha-Beta", "Grundy", "MCTS", "Proof-Number" atau "Human"
+            player2_algo: str, "Reflex", "Alpha-Beta", "Grundy", "MCTS" atau "Proof-Number"
+            time_control: dict opsional (lihat TIME_CONTROLS di config.settings),
+                berisi "base_ms"/"increment_ms" (chess clock) dan/atau
+                "move_deadline_ms" (batas keras per langkah). None = tanpa batas.
+            rules: RuleSet / nama rule set (lihat game.rules). None = NIM biasa.
+            match_log: MatchLogWriter opsional; setiap langkah langsung
+                ditulis ke log biner (lihat game.match_log).
+            huge: Paksa huge-board mode (None = otomatis dari ukuran papan).
+                State disimpan di array, langkah diterapkan in-place tanpa
+                salinan state, dan history tidak menyimpan state_after.
+            profiler: EngineProfiler opsional (lihat game.profiling); setiap
+                panggilan engine diprofil atas nama engine yang benar-benar
+                dipanggil. None = engine dipanggil langsung.
         """
-        self.initial_state = initial_state.copy()
-        self.state = initial_state.copy()
+        self.huge = is_huge(initial_state) if huge is None else huge
+        self.initial_state = array("Q", initial_state) if self.huge else list(initial_state)
+        # NimState: total/nim-sum/ones/bigs di-cache untuk engine & GUI
+        self.state = self._new_state()
         self.player1_algo = player1_algo
         self.player2_algo = player2_algo
         self.current_player = 1
@@ -35,16 +97,44 @@ class GameController:
         self.total_moves = 0
         self.match_start_time = None
         self.match_duration = 0
+
+        # Kontrol waktu
+        self.time_control = time_control
+        self._reset_clocks()
+
+        # Aturan pengambilan (None / "nim" = NIM biasa)
+        self.rules = get_rule_set(rules)
+        if self.rules is not None and self.rules.is_unrestricted:
+            self.rules = None
         
         # Algoritma mapping
         self.algo_map = {
             "Reflex": reflex_move,
-            "Alpha-Beta": alphabeta_move
+            "Alpha-Beta": alphabeta_move,
+            "Grundy": grundy_move,
+            "MCTS": mcts_move,
+            "Proof-Number": proof_number_move
         }
+        # Agen per (pemain, algoritma) untuk engine di AGENT_FACTORIES
+        self.agents = {}
+        # Langkah yang sudah dihitung di luar match (warm-up):
+        # (algoritma, tuple tumpukan) -> (move, stats), dipakai sekali
+        self.precomputed = {}
+
+        # Log biner streaming (game_id diberikan writer saat langkah pertama)
+        self.match_log = match_log
+        self.log_game_id = None
+
+        self.profiler = profiler
     
+    def _new_state(self):
+        if self.huge:
+            return ArrayNimState(self.initial_state)
+        return NimState(self.initial_state)
+
     def reset(self):
         """Reset game ke kondisi awal."""
-        self.state = self.initial_state.copy()
+        self.state = self._new_state()
         self.current_player = 1
         self.game_over = False
         self.winner = None
@@ -52,6 +142,16 @@ class GameController:
         self.total_moves = 0
         self.match_start_time = None
         self.match_duration = 0
+        self._reset_clocks()
+        self.agents = {}
+        self.log_game_id = None
+
+    def _reset_clocks(self):
+        """Reset sisa waktu, flag-fall, dan overrun kedua pemain."""
+        base_ms = self.time_control.get("base_ms") if self.time_control else None
+        self.clock_ms = {1: base_ms, 2: base_ms}
+        self.flag_falls = {1: 0, 2: 0}
+        self.overruns = {1: 0, 2: 0}
     
     def get_current_algo(self):
         """Mendapatkan algoritma untuk pemain saat ini."""
@@ -60,6 +160,165 @@ class GameController:
         else:
             return self.player2_algo
     
+    def get_move_budget_ms(self, player=None):
+        """
+        Hitung budget waktu (ms) untuk langkah berikutnya.
+
+        Budget = min(sisa clock pemain, deadline per langkah).
+
+        Returns:
+            float atau None: None jika tidak ada kontrol waktu
+        """
+        if not self.time_control:
+            return None
+        if player is None:
+            player = self.current_player
+
+        budgets = []
+        if self.clock_ms[player] is not None:
+            budgets.append(max(0, self.clock_ms[player]))
+        if self.time_control.get("move_deadline_ms") is not None:
+            budgets.append(self.time_control["move_deadline_ms"])
+        return min(budgets) if budgets else None
+
+    def engine_call_kwargs(self, budget_ms):
+        """
+        Argumen keyword untuk memanggil engine dengan budget tertentu.
+
+        Returns:
+            dict atau None: None berarti engine tidak perlu dipanggil
+                (clock sudah habis, langsung fallback)
+        """
+        if budget_ms is None:
+            return {}
+        if budget_ms <= 0:
+            return None
+        return {"time_limit_ms": budget_ms * ENGINE_TIME_FACTOR}
+
+    def resolve_engine(self, algo_name):
+        """
+        Fungsi engine yang dipanggil untuk `algo_name` pada rule set game ini.
+
+        Pada varian (rules bukan NIM biasa) engine yang tidak paham rule set,
+        dan di huge-board mode engine yang mengenumerasi langkah, diganti
+        engine Grundy agar tetap memilih langkah legal dalam O(piles).
+
+        Returns:
+            tuple: (fungsi_engine, kwargs_tambahan)
+        """
+        supported = (self.rules is None or algo_name in RULE_AWARE_ALGOS) and \
+            (not self.huge or algo_name in HUGE_SAFE_ALGOS)
+        algo_func = self.algo_map[algo_name] if supported else grundy_move
+        return algo_func, ({"rules": self.rules} if self.rules is not None else {})
+
+    def add_precomputed(self, algo_name, piles, move, stats):
+        """
+        Daftarkan langkah `algo_name` untuk posisi `piles` yang sudah dihitung
+        sebelumnya (mis. game.warmup); dipakai sekali, menggantikan panggilan engine.
+        """
+        self.precomputed[(algo_name, tuple(piles))] = (move, stats)
+
+    def _take_precomputed(self, algo_name, start):
+        """(move, stats) dari precomputed untuk state saat ini, atau None."""
+        cached = self.precomputed.pop((algo_name, tuple(self.state)), None)
+        if cached is None:
+            return None
+        move, stats = cached
+        stats = dict(stats)
+        stats["precomputed"] = True
+        stats["warmup_ms"] = stats.get("duration_ms", 0.0)
+        stats["duration_ms"] = (time.perf_counter() - start) * 1000.0
+        return move, stats
+
+    def _run_engine(self, algo_name, budget_ms):
+        """
+        Jalankan engine untuk pemain saat ini dengan budget waktu.
+
+        Jika budget sudah habis (clock 0) engine tidak dipanggil sama sekali;
+        langkah dari precomputed dipakai tanpa memanggil engine.
+
+        Returns:
+            tuple: (move, stats, start) - move/stats None jika engine dilewati
+        """
+        start = time.perf_counter()
+        if self.precomputed:
+            cached = self._take_precomputed(algo_name, start)
+            if cached is not None:
+                return cached[0], cached[1], start
+        kwargs = self.engine_call_kwargs(budget_ms)
+        if kwargs is None:
+            return None, None, start
+        algo_func, extra = self.resolve_engine(algo_name)
+        if algo_name in AGENT_FACTORIES and algo_func is self.algo_map[algo_name]:
+            extra["agent"] = self._get_agent(algo_name)
+        if self.profiler is not None:
+            profiled_name = algo_name if algo_func is self.algo_map[algo_name] else "Grundy"
+            move, stats = self.profiler.call(profiled_name, algo_func, self.state, **kwargs, **extra)
+        else:
+            move, stats = algo_func(self.state, **kwargs, **extra)
+        return move, stats, start
+
+    def _get_agent(self, algo_name):
+        """Agen milik pemain saat ini (dibuat saat pertama kali dipakai)."""
+        key = (self.current_player, algo_name)
+        if key not in self.agents:
+            self.agents[key] = AGENT_FACTORIES[algo_name]()
+        return self.agents[key]
+
+    def _resolve_overrun(self, algo_name, move, stats, start, budget_ms):
+        """
+        Terapkan fallback jika engine melewati budget atau tidak menghasilkan move.
+
+        Langkah engine yang terlambat dibuang dan diganti langkah Reflex
+        (oracle NIM-SUM yang instan; Grundy pada varian rule set).
+
+        Returns:
+            tuple: (move, stats, elapsed_ms)
+        """
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        overrun = move is None or (budget_ms is not None and elapsed_ms > budget_ms)
+        if not overrun:
+            if self.resolve_engine(algo_name)[0] is not self.algo_map[algo_name]:
+                stats = dict(stats)
+                stats["substituted_for"] = algo_name
+            return move, stats, elapsed_ms
+
+        self.overruns[self.current_player] += 1
+        engine_stats = stats or {}
+        fallback_func, extra = self.resolve_engine("Reflex")
+        move, stats = fallback_func(self.state, **extra)
+        stats = dict(stats)
+        stats["fallback_from"] = algo_name
+        stats["overrun"] = True
+        stats["nodes_explored"] = engine_stats.get("nodes_explored", 0)
+
+        # Waktu yang benar-benar terpakai (engine + fallback)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        stats["duration_ms"] = elapsed_ms
+        return move, stats, elapsed_ms
+
+    def _charge_clock(self, player, elapsed_ms):
+        """Kurangi clock pemain, catat flag-fall, lalu tambahkan increment."""
+        if self.clock_ms[player] is None:
+            return
+        self.clock_ms[player] -= elapsed_ms
+        if self.clock_ms[player] <= 0:
+            # Flag jatuh: tidak langsung kalah, tapi langkah berikutnya
+            # hanya mendapat increment (atau langsung fallback jika 0)
+            self.flag_falls[player] += 1
+            self.clock_ms[player] = 0
+        self.clock_ms[player] += self.time_control.get("increment_ms", 0)
+
+    def _start_match_timer(self):
+        # Mulai timer match pada move pertama
+        if self.match_start_time is None:
+            self.match_start_time = time.time()
+        if self.match_log is not None and self.log_game_id is None:
+            self.log_game_id = self.match_log.begin_game(
+                self.initial_state, self.player1_algo, self.player2_algo,
+                rules=self.rules, time_control=self.time_control
+            )
+
     def play_one_move(self):
         """
         Mainkan satu langkah dari pemain saat ini.
@@ -70,25 +329,88 @@ class GameController:
         if self.game_over:
             return None
         
-        # Mulai timer match pada move pertama
-        if self.match_start_time is None:
-            self.match_start_time = time.time()
+        self._start_match_timer()
         
         # Dapatkan algoritma untuk pemain saat ini
         algo_name = self.get_current_algo()
-        algo_func = self.algo_map[algo_name]
+        budget_ms = self.get_move_budget_ms()
         
-        # Eksekusi move
-        move, stats = algo_func(self.state)
+        # Eksekusi move (dengan kontrol waktu bila aktif)
+        move, stats, start = self._run_engine(algo_name, budget_ms)
+        return self.finish_engine_move(algo_name, move, stats, start, budget_ms)
+
+    def finish_engine_move(self, algo_name, move, stats, start, budget_ms):
+        """
+        Selesaikan langkah engine yang dihitung di tempat lain (mis. worker pool).
+
+        Menangani overrun/fallback, clock, validasi move, dan history.
+
+        Args:
+            algo_name: Nama algoritma yang menghitung move
+            move: Tuple (index_tumpukan, jumlah) atau None jika engine gagal/timeout
+            stats: dict statistik dari engine (atau None)
+            start: time.perf_counter() saat engine mulai dipanggil
+            budget_ms: Budget dari get_move_budget_ms() saat engine dipanggil
+
+        Returns:
+            dict: Informasi tentang langkah yang dimainkan
+        """
+        self._start_match_timer()
+        move, stats, elapsed_ms = self._resolve_overrun(algo_name, move, stats, start, budget_ms)
+        self._charge_clock(self.current_player, elapsed_ms)
         
         # Terapkan move
         try:
-            self.state = apply_move(self.state, move)
+            new_state = self._apply(move)
         except ValueError as e:
             print(f"[ERROR MOVE] {e}")
-            # fallback: lewati giliran atau pakai move random valid
-            valid_moves = get_moves(self.state)
-            self.state = apply_move(self.state, valid_moves[0])
+            # fallback: langkah engine pengganti (selalu legal, tanpa enumerasi)
+            fallback_func, extra = self.resolve_engine("Reflex")
+            move, _ = fallback_func(self.state, **extra)
+            new_state = self._apply(move)
+        return self._record_move(algo_name, move, new_state, stats, budget_ms)
+
+    def _apply(self, move):
+        """
+        Terapkan move yang sudah divalidasi.
+
+        Huge-board mode: state diubah in-place (O(1), tanpa salinan array).
+
+        Raises:
+            ValueError: Jika move tidak legal
+        """
+        if not self.huge:
+            return apply_move(self.state, move, self.rules)
+        i, k = move
+        piles = self.state.piles
+        if not (0 <= i < len(piles)) or k <= 0 or k > piles[i]:
+            raise ValueError(f"Invalid move: {move}")
+        if self.rules is not None and not self.rules.is_legal(piles[i], k):
+            raise ValueError(f"Invalid move: taking {k} is not allowed by rule set '{self.rules.name}'")
+        self.state.play(i, k)
+        return self.state
+
+    def play_move(self, move, algorithm="Human", stats=None):
+        """
+        Terapkan langkah dari luar (manusia atau klien server).
+
+        Raises:
+            ValueError: Jika game sudah selesai atau move tidak legal
+
+        Returns:
+            dict: Informasi tentang langkah yang dimainkan
+        """
+        if self.game_over:
+            raise ValueError("Game sudah selesai")
+        self._start_match_timer()
+        new_state = self._apply(move)
+        if stats is None:
+            stats = {"duration_ms": 0, "nodes_explored": 0}
+        return self._record_move(algorithm, move, new_state, stats, None)
+
+    def _record_move(self, algo_name, move, new_state, stats, budget_ms):
+        """Simpan state baru, history, dan cek akhir permainan."""
+        self.state = new_state
         self.total_moves += 1
         
         # Simpan history
@@ -97,10 +419,15 @@ class GameController:
             "player": self.current_player,
             "algorithm": algo_name,
             "move": move,
-            "state_after": self.state.copy(),
-            "stats": stats
+            # Huge-board: salinan state per langkah terlalu mahal (O(piles))
+            "state_after": None if self.huge else self.state.to_list(),
+            "stats": stats,
+            "budget_ms": budget_ms,
+            "clock_ms": self.clock_ms[self.current_player]
         }
         self.move_history.append(move_info)
+        if self.match_log is not None:
+            self.match_log.write_move(self.log_game_id, move_info)
         
         # Cek apakah game selesai
         if is_terminal(self.state):
@@ -112,6 +439,12 @@ class GameController:
             move_info["game_over"] = True
             move_info["winner"] = self.winner
             move_info["loser"] = self.current_player
+            if self.match_log is not None:
+                self.match_log.end_game(
+                    self.log_game_id, self.winner, self.total_moves,
+                    self.match_duration * 1000.0,
+                    sum(m["stats"].get("nodes_explored", 0) for m in self.move_history)
+                )
         else:
             move_info["game_over"] = False
             # Ganti pemain
@@ -119,6 +452,125 @@ class GameController:
         
         return move_info
     
+    def play_full_game(self, record=None):
+        """
+        Jalur cepat self-play: mainkan game sampai selesai tanpa dict/list per langkah.
+
+        Dibanding memanggil play_one_move() berulang: engine & kwargs
+        di-resolve sekali per pemain, langkah divalidasi inline lalu
+        diterapkan in-place ke state (tanpa apply_move()), akhir game dibaca
+        dari total yang di-cache, dan move_history TIDAK diisi (sehingga
+        get_match_summary() tidak punya statistik per pemain). Kontrol
+        waktu, fallback overrun, dan match_log tetap berlaku.
+
+        Args:
+            record: MoveRecord opsional untuk merekam setiap langkah
+
+        Raises:
+            ValueError: Jika game sudah selesai
+
+        Returns:
+            dict: {"winner", "total_moves", "match_duration_sec",
+                "player1"/"player2": {"moves_count", "total_time_ms", "total_nodes"}}
+        """
+        if self.game_over:
+            raise ValueError("Game sudah selesai")
+        self._start_match_timer()
+
+        # Engine per pemain (index = nomor pemain)
+        first = self.current_player
+        engines = [None, None, None]
+        for player, algo_name in ((1, self.player1_algo), (2, self.player2_algo)):
+            self.current_player = player
+            algo_func, extra = self.resolve_engine(algo_name)
+            substituted = algo_func is not self.algo_map[algo_name]
+            if algo_name in AGENT_FACTORIES and not substituted:
+                extra["agent"] = self._get_agent(algo_name)
+            if self.profiler is not None:
+                algo_func = self.profiler.wrap("Grundy" if substituted else algo_name, algo_func)
+            engines[player] = (algo_name, algo_func, extra, FLAG_SUBSTITUTED if substituted else 0)
+        player = self.current_player = first
+
+        state = self.state
+        piles = state.piles
+        pile_count = len(piles)
+        rules = self.rules
+        timed = bool(self.time_control)
+        log = self.match_log
+        total_time = [0.0, 0.0, 0.0]
+        total_nodes = [0, 0, 0]
+        move_counts = [0, 0, 0]
+        clock = time.perf_counter
+
+        while True:
+            algo_name, algo_func, extra, substituted = engines[player]
+            budget_ms = None
+            start = clock()
+            cached = self._take_precomputed(algo_name, start) if self.precomputed else None
+            if cached is not None:
+                move, stats = cached
+            elif not timed:
+                move, stats = algo_func(state, **extra)
+            else:
+                budget_ms = self.get_move_budget_ms(player)
+                kwargs = self.engine_call_kwargs(budget_ms)
+                move = stats = None
+                if kwargs is not None:
+                    move, stats = algo_func(state, **kwargs, **extra)
+            elapsed_ms = (clock() - start) * 1000.0
+            if move is None or (budget_ms is not None and elapsed_ms > budget_ms):
+                move, stats, elapsed_ms = self._resolve_overrun(
+                    algo_name, move, stats, start, budget_ms)
+            if timed:
+                self._charge_clock(player, elapsed_ms)
+
+            i, k = move
+            if not (0 <= i < pile_count) or k <= 0 or k > piles[i] or \
+                    (rules is not None and not rules.is_legal(piles[i], k)):
+                print(f"[ERROR MOVE] Invalid move: {move}")
+                fallback_func, fallback_extra = self.resolve_engine("Reflex")
+                (i, k), _ = fallback_func(state, **fallback_extra)
+            state.play(i, k)
+
+            self.total_moves += 1
+            nodes = stats.get("nodes_explored", 0)
+            total_time[player] += elapsed_ms
+            total_nodes[player] += nodes
+            move_counts[player] += 1
+            if record is not None and record.count < record.capacity:
+                j = record.count
+                record.players[j] = player
+                record.piles[j] = i
+                record.takes[j] = k
+                record.duration_ms[j] = elapsed_ms
+                record.nodes[j] = nodes
+                record.count = j + 1
+            if log is not None:
+                log.write_move_fields(self.log_game_id, player, stats_flags(stats) | substituted,
+                                      i, k, stats.get("duration_ms", 0.0), nodes, self.total_moves)
+
+            if state.total == 0:
+                break
+            player = self.current_player = 3 - player
+
+        # Pemain yang mengambil stik terakhir = kalah (Misère)
+        self.game_over = True
+        self.winner = 3 - player
+        self.match_duration = time.time() - self.match_start_time
+        if log is not None:
+            log.end_game(self.log_game_id, self.winner, self.total_moves,
+                         self.match_duration * 1000.0, total_nodes[1] + total_nodes[2])
+
+        return {
+            "winner": self.winner,
+            "total_moves": self.total_moves,
+            "match_duration_sec": self.match_duration,
+            "player1": {"moves_count": move_counts[1], "total_time_ms": total_time[1],
+                        "total_nodes": total_nodes[1]},
+            "player2": {"moves_count": move_counts[2], "total_time_ms": total_time[2],
+                        "total_nodes": total_nodes[2]}
+        }
+
     def get_match_summary(self):
         """
         Mendapatkan ringkasan pertandingan.
@@ -147,19 +599,27 @@ class GameController:
             "loser": (2 if self.winner == 1 else 1) if self.game_over else None,
             "total_moves": self.total_moves,
             "match_duration_sec": current_duration,
+            "time_control": self.time_control,
+            "rules": self.rules.name if self.rules is not None else "nim",
             "player1": {
                 "algorithm": self.player1_algo,
                 "moves_count": len(p1_moves),
                 "total_time_ms": p1_total_time,
                 "avg_time_ms": p1_total_time / len(p1_moves) if p1_moves else 0,
-                "total_nodes": p1_total_nodes
+                "total_nodes": p1_total_nodes,
+                "clock_remaining_ms": self.clock_ms[1],
+                "flag_falls": self.flag_falls[1],
+                "overruns": self.overruns[1]
             },
             "player2": {
                 "algorithm": self.player2_algo,
                 "moves_count": len(p2_moves),
                 "total_time_ms": p2_total_time,
                 "avg_time_ms": p2_total_time / len(p2_moves) if p2_moves else 0,
-                "total_nodes": p2_total_nodes
+                "total_nodes": p2_total_nodes,
+                "clock_remaining_ms": self.clock_ms[2],
+                "flag_falls": self.flag_falls[2],
+                "overruns": self.overruns[2]
             }
         }
         
@@ -0,0 +1,141 @@
+"""
+Huge-board mode: papan dengan jutaan tumpukan atau tumpukan berisi ~10^9 stik.
+
+- ArrayNimState menyimpan tumpukan di array('Q') (8 byte per tumpukan)
+  dan tidak menjaga hash Zobrist, sehingga membangun / menyalin state
+  tetap murah. Karena turunan NimState, semua fast path yang sudah ada
+  (is_terminal, get_game_info, winning_move, reflex) langsung berlaku.
+- Level huge tidak ditulis sebagai list literal di config, tapi
+  dibangkitkan deterministik dari spesifikasi HUGE_LEVELS (seed).
+"""
+
+import random
+from array import array
+from functools import reduce
+from operator import eq, xor
+
+from config.settings import DIFFICULTY_LEVELS, HUGE_LEVELS
+from game.nim_logic import NimState
+
+# Di atas batas ini GameController otomatis memakai huge-board mode
+HUGE_PILE_COUNT = 10_000
+HUGE_PILE_SIZE = 1_000_000
+# Maksimal ukuran tumpukan yang muat di array('Q') / record match log (u32)
+MAX_PILE_SIZE = (1 << 32) - 1
+
+
+class ArrayNimState(NimState):
+    """
+    NimState berbasis array('Q') untuk huge-board mode.
+
+    Invariant (total, NIM-SUM, ones, bigs, active) tetap di-update O(1)
+    per langkah; key/check Zobrist selalu 0 (tidak dipakai engine huge).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, piles):
+        # Salinan array dibuat di level C; tanpa loop Python per tumpukan
+        self.piles = array("Q", piles)
+        count = len(self.piles)
+        zeros = self.piles.count(0)
+        self.total = sum(self.piles)
+        self.nim_sum = reduce(xor, self.piles, 0)
+        self.ones = self.piles.count(1)
+        self.active = count - zeros
+        self.bigs = self.active - self.ones
+        self.key = self.check = self.xkey = self.xcheck = 0
+
+    def copy(self):
+        new = ArrayNimState.__new__(ArrayNimState)
+        new.piles = array("Q", self.piles)
+        new.total = self.total
+        new.nim_sum = self.nim_sum
+        new.ones = self.ones
+        new.bigs = self.bigs
+        new.active = self.active
+        new.key = new.check = new.xkey = new.xcheck = 0
+        return new
+
+    def set_pile(self, i, new):
+        old = self.piles[i]
+        self.piles[i] = new
+        self.total += new - old
+        self.nim_sum ^= old ^ new
+        self.ones += (new == 1) - (old == 1)
+        self.bigs += (new > 1) - (old > 1)
+        self.active += (new > 0) - (old > 0)
+
+    def moves(self):
+        """
+        Sengaja ditolak: enumerasi langkah O(total stik) tidak layak di papan
+        raksasa. GameController.resolve_engine() mengganti engine yang
+        mengenumerasi langkah dengan Grundy, jadi ini hanya terjadi jika
+        engine seperti itu dipanggil langsung dengan ArrayNimState.
+
+        Raises:
+            TypeError: Selalu
+        """
+        raise TypeError("huge-board state tidak mengenumerasi langkah "
+                        "(pakai engine closed-form: Reflex / Grundy)")
+
+    def to_list(self):
+        return self.piles.tolist()
+
+    def __eq__(self, other):
+        # array('Q') tidak pernah sama dengan list / array typecode lain,
+        # jadi bandingkan per elemen agar kontrak NimState.__eq__ tetap berlaku
+        other = getattr(other, "piles", other)
+        if isinstance(other, array) and other.typecode == "Q":
+            return self.piles == other
+        try:
+            if len(other) != len(self.piles):
+                return False
+            return all(map(eq, self.piles, other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"ArrayNimState({len(self.piles)} piles, total={self.total}, "
+                f"nim_sum={self.nim_sum})")
+
+
+def is_huge(piles):
+    """True jika papan terlalu besar untuk representasi & engine biasa."""
+    return len(piles) > HUGE_PILE_COUNT or max(piles, default=0) > HUGE_PILE_SIZE
+
+
+def generate_piles(spec):
+    """
+    Bangkitkan tumpukan untuk satu spesifikasi HUGE_LEVELS (deterministik).
+
+    Args:
+        spec: dict dengan "num_piles", "max_pile", "seed"
+
+    Returns:
+        array('Q'): Ukuran setiap tumpukan (1..max_pile)
+    """
+    if spec["max_pile"] > MAX_PILE_SIZE:
+        raise ValueError(f"max_pile maksimal {MAX_PILE_SIZE}")
+    rng = random.Random(spec["seed"])
+    high = spec["max_pile"]
+    return array("Q", (rng.randint(1, high) for _ in range(spec["num_piles"])))
+
+
+def get_level(name):
+    """
+    Definisi level dari DIFFICULTY_LEVELS atau HUGE_LEVELS (dibangkitkan).
+
+    Returns:
+        dict: seperti entri DIFFICULTY_LEVELS ("piles", "rules", ...)
+    """
+    if name in DIFFICULTY_LEVELS:
+        return DIFFICULTY_LEVELS[name]
+    spec = HUGE_LEVELS[name]
+    piles = generate_piles(spec)
+    level = dict(spec)
+    level["piles"] = piles
+    level["total_sticks"] = sum(piles)
+    return level
@@ -0,0 +1,385 @@
+"""
+Format log pertandingan biner (append-only) + writer streaming dan reader mmap.
+
+Layout file (little-endian):
+    File header, 32 byte : magic "NIMLOG\\0\\0", versi (u16), ukuran record (u16)
+    Record, masing-masing 32 byte, diawali:
+        tipe (u8), a (u8), b (u16), game_id (u32)
+    lalu 24 byte payload per tipe:
+        GAME_START : a = kode rule set, b = p1 (u8) + p2 (u8);
+                     jumlah tumpukan (u32), waktu mulai (f64),
+                     base_ms, increment_ms, move_deadline_ms (u32, 0 = tidak ada)
+        PILES      : a = jumlah nilai (<= 5), b = 0; nomor chunk (u32),
+                     5 x u32 ukuran tumpukan awal
+        MOVE       : a = pemain, b = flag; pile, take (u32), durasi ms (f32),
+                     nodes (u64), nomor langkah (u32)
+        GAME_END   : a = pemenang; total langkah (u32), pad, durasi match ms (f64),
+                     total nodes (u64)
+
+Versi 1 menyimpan jumlah tumpukan dan nomor chunk sebagai u16 (maksimal
+65535 tumpukan), dengan 6 tumpukan per record PILES; file versi 1 tetap
+bisa dibaca, tapi tidak bisa ditambah oleh writer versi ini.
+
+Semua record berukuran sama sehingga record ke-i bisa dibaca langsung
+(random seek) dan banyak game boleh berselang-seling dalam satu file
+(mis. dari match server).
+"""
+
+import mmap
+import os
+import struct
+import time
+
+MAGIC = b"NIMLOG\0\0"
+VERSION = 2
+HEADER = struct.Struct("<8sHH20x")
+RECORD_SIZE = 32
+
+REC_GAME_START, REC_PILES, REC_MOVE, REC_GAME_END = 1, 2, 3, 4
+
+# Awalan bersama semua record: tipe, a, b, game_id
+RECORD_PREFIX = struct.Struct("<BBHI")
+GAME_START = struct.Struct("<BBBBIIdIII")
+PILES = struct.Struct("<BBHII5I")
+MOVE = struct.Struct("<BBHIIIfQI")
+GAME_END = struct.Struct("<BBHII4xdQ")
+PILES_PER_RECORD = 5
+# Batas u32 untuk jumlah tumpukan, nomor chunk, dan ukuran tumpukan
+MAX_U32 = 0xFFFFFFFF
+
+# Layout versi 1 (hanya dibaca)
+GAME_START_V1 = struct.Struct("<BBHIBB2xdIII")
+PILES_V1 = struct.Struct("<BBHI6I")
+
+# Flag record MOVE
+FLAG_OVERRUN = 1
+FLAG_SUBSTITUTED = 2
+FLAG_TIMED_OUT = 4
+
+# Kode algoritma & rule set disimpan sebagai u8. Hanya boleh DITAMBAH di
+# akhir agar file lama tetap terbaca; 0 = tidak dikenal.
+ALGORITHM_CODES = ("?", "Human", "Reflex", "Alpha-Beta", "Grundy", "MCTS", "Client",
+                   "Proof-Number")
+RULE_CODES = ("nim", "subtract_1_3", "powers_of_two", "subtract_1_3_4")
+
+
+def _code(table, name):
+    return table.index(name) if name in table else 0
+
+
+def _name(table, code):
+    return table[code] if code < len(table) else "?"
+
+
+def stats_flags(stats):
+    """Flag record MOVE (FLAG_*) dari dict stats engine."""
+    flags = 0
+    if stats.get("overrun"):
+        flags |= FLAG_OVERRUN
+    if stats.get("substituted_for"):
+        flags |= FLAG_SUBSTITUTED
+    if stats.get("timed_out"):
+        flags |= FLAG_TIMED_OUT
+    return flags
+
+
+class MatchLogWriter:
+    """
+    Penulis log streaming: record ditambahkan ke akhir file tiap langkah
+    dan di-flush saat game selesai.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._next_game_id = 1
+        if exists:
+            with MatchLogReader(path) as reader:
+                if reader.version != VERSION:
+                    raise ValueError(f"{path}: log versi {reader.version} tidak bisa "
+                                     f"ditambah (writer menulis versi {VERSION})")
+                ids = reader.game_ids()
+                self._next_game_id = max(ids) + 1 if ids else 1
+        self._file = open(path, "ab")
+        if not exists:
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+
+    def begin_game(self, initial_piles, player1_algo, player2_algo, rules=None,
+                   time_control=None):
+        """
+        Tulis record GAME_START + PILES.
+
+        Raises:
+            ValueError: Jika jumlah atau ukuran tumpukan melebihi u32
+
+        Returns:
+            int: game_id untuk write_move() / end_game()
+        """
+        game_id = self._next_game_id
+        self._next_game_id += 1
+        tc = time_control or {}
+        rules_name = getattr(rules, "name", rules) or "nim"
+        piles = initial_piles
+        if len(piles) > MAX_U32 or (piles and max(piles) > MAX_U32):
+            raise ValueError("match log hanya mendukung jumlah & ukuran tumpukan sampai 2^32 - 1")
+
+        self._file.write(GAME_START.pack(
+            REC_GAME_START, _code(RULE_CODES, rules_name),
+            _code(ALGORITHM_CODES, player1_algo), _code(ALGORITHM_CODES, player2_algo),
+            game_id, len(piles), time.time(),
+            tc.get("base_ms") or 0, tc.get("increment_ms") or 0, tc.get("move_deadline_ms") or 0
+        ))
+        for chunk, offset in enumerate(range(0, len(piles), PILES_PER_RECORD)):
+            values = piles[offset:offset + PILES_PER_RECORD]
+            self._file.write(PILES.pack(
+                REC_PILES, len(values), 0, game_id, chunk,
+                *values, *([0] * (PILES_PER_RECORD - len(values)))
+            ))
+        return game_id
+
+    def write_move(self, game_id, move_info):
+        """Tulis satu record MOVE dari dict move_info GameController."""
+        stats = move_info.get("stats") or {}
+        pile, take = move_info["move"]
+        self.write_move_fields(
+            game_id, move_info["player"], stats_flags(stats), pile, take,
+            stats.get("duration_ms", 0.0), stats.get("nodes_explored", 0),
+            move_info["move_number"]
+        )
+
+    def write_move_fields(self, game_id, player, flags, pile, take, duration_ms,
+                          nodes, move_number):
+        """Tulis satu record MOVE dari nilai mentah (tanpa dict move_info)."""
+        self._file.write(MOVE.pack(
+            REC_MOVE, player, flags, game_id, pile, take, duration_ms, nodes, move_number
+        ))
+
+    def end_game(self, game_id, winner, total_moves, duration_ms, total_nodes):
+        """Tulis record GAME_END lalu flush ke disk."""
+        self._file.write(GAME_END.pack(
+            REC_GAME_END, winner or 0, 0, game_id,
+            total_moves, duration_ms, total_nodes
+        ))
+        self._file.flush()
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MatchLogReader:
+    """
+    Pembaca log berbasis mmap. Record tidak dimuat ke objek Python sampai
+    diminta; iterasi memakai struct.iter_unpack langsung di atas mmap.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            # Header divalidasi sebelum mmap; file ditutup jika tidak valid
+            size = os.fstat(self._file.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"{path}: bukan match log (file terlalu kecil)")
+            magic, version, record_size = HEADER.unpack(self._file.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path}: bukan match log (magic salah)")
+            if version > VERSION or record_size != RECORD_SIZE:
+                raise ValueError(f"{path}: versi log {version} tidak didukung")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        self.version = version
+        # _piles_values = index nilai tumpukan pertama di tuple record PILES
+        if version == 1:
+            self._game_start, self._piles = GAME_START_V1, PILES_V1
+            self._piles_values = 4
+        else:
+            self._game_start, self._piles = GAME_START, PILES
+            self._piles_values = 5
+        # Record terakhir yang terpotong (mis. proses mati saat menulis) diabaikan
+        self.num_records = (size - HEADER.size) // RECORD_SIZE
+        self._types = None
+
+    # ---------------- RAW ACCESS ----------------
+    def _offset(self, index):
+        if not 0 <= index < self.num_records:
+            raise IndexError(index)
+        return HEADER.size + index * RECORD_SIZE
+
+    def _view(self, start=0, stop=None):
+        stop = self.num_records if stop is None else min(stop, self.num_records)
+        return memoryview(self._mm)[HEADER.size + start * RECORD_SIZE:
+                                    HEADER.size + stop * RECORD_SIZE]
+
+    def record_types(self):
+        """bytes berisi tipe setiap record (satu byte per record, di-cache)."""
+        if self._types is None:
+            self._types = self._mm[HEADER.size:HEADER.size + self.num_records * RECORD_SIZE:RECORD_SIZE]
+        return self._types
+
+    def read_record(self, index):
+        """Baca record ke-`index` sebagai tuple sesuai tipenya (layout versi file)."""
+        offset = self._offset(index)
+        layout = {
+            REC_GAME_START: self._game_start,
+            REC_PILES: self._piles,
+            REC_MOVE: MOVE,
+            REC_GAME_END: GAME_END
+        }.get(self._mm[offset])
+        if layout is None:
+            raise ValueError(f"record {index}: tipe {self._mm[offset]} tidak dikenal")
+        return layout.unpack_from(self._mm, offset)
+
+    def _find(self, record_type):
+        """Index semua record bertipe `record_type` (pencarian byte di level C)."""
+        types = self.record_types()
+        marker = bytes([record_type])
+        found = []
+        pos = types.find(marker)
+        while pos != -1:
+            found.append(pos)
+            pos = types.find(marker, pos + 1)
+        return found
+
+    # ---------------- MOVES ----------------
+    def iter_moves(self, game_id=None, start=0, stop=None):
+        """
+        Iterasi record MOVE sebagai tuple
+        (tipe, pemain, flag, game_id, pile, take, durasi_ms, nodes, nomor_langkah).
+
+        Args:
+            game_id: Hanya langkah game ini (None = semua)
+            start, stop: Batas index record yang dipindai (mis. dari games())
+        """
+        view = self._view(start, stop)
+        try:
+            for rec in MOVE.iter_unpack(view):
+                if rec[0] == REC_MOVE and (game_id is None or rec[3] == game_id):
+                    yield rec
+        finally:
+            view.release()
+
+    def count_moves(self):
+        return self.record_types().count(REC_MOVE)
+
+    # ---------------- GAMES ----------------
+    def game_ids(self):
+        return [RECORD_PREFIX.unpack_from(self._mm, self._offset(i))[3]
+                for i in self._find(REC_GAME_START)]
+
+    def _read_game_start(self, index):
+        """
+        Record GAME_START dinormalkan untuk kedua versi:
+        (rules, n_piles, game_id, p1, p2, waktu mulai, base_ms, increment_ms, deadline_ms).
+        """
+        rec = self.read_record(index)
+        if self.version == 1:
+            _, rules, n_piles, game_id, p1, p2, *rest = rec
+        else:
+            _, rules, p1, p2, game_id, n_piles, *rest = rec
+        return (rules, n_piles, game_id, p1, p2, *rest)
+
+    def games(self):
+        """
+        Ringkasan semua game (tanpa memuat record MOVE).
+
+        Returns:
+            dict: game_id -> dict info game
+        """
+        games = {}
+        for i in self._find(REC_GAME_START):
+            (rules, n_piles, game_id, p1, p2, started,
+             base_ms, increment_ms, deadline_ms) = self._read_game_start(i)
+            games[game_id] = {
+                "game_id": game_id,
+                "start_record": i,
+                "rules": _name(RULE_CODES, rules),
+                "num_piles": n_piles,
+                "player1": _name(ALGORITHM_CODES, p1),
+                "player2": _name(ALGORITHM_CODES, p2),
+                "start_time": started,
+                "time_control": {
+                    "base_ms": base_ms or None,
+                    "increment_ms": increment_ms or None,
+                    "move_deadline_ms": deadline_ms or None
+                },
+                "end_record": None,
+                "winner": None,
+                "total_moves": None
+            }
+        for i in self._find(REC_GAME_END):
+            _, winner, _, game_id, total_moves, duration_ms, total_nodes = self.read_record(i)
+            if game_id in games:
+                games[game_id].update(
+                    end_record=i, winner=winner or None, total_moves=total_moves,
+                    duration_ms=duration_ms, total_nodes=total_nodes
+                )
+        return games
+
+    def initial_piles(self, game_id, start_record=None):
+        """Tumpukan awal game `game_id` (dicari mulai dari record GAME_START-nya)."""
+        start = start_record if start_record is not None else self.games()[game_id]["start_record"]
+        n_piles = self._read_game_start(start)[1]
+        first = self._piles_values
+        piles = []
+        i = start + 1
+        while len(piles) < n_piles and i < self.num_records:
+            rec = self.read_record(i)
+            if rec[0] == REC_PILES and rec[3] == game_id:
+                piles.extend(rec[first:first + rec[1]])
+            i += 1
+        return piles
+
+    # ---------------- LIFECYCLE ----------------
+    def close(self):
+        self._types = None
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ringkas isi match log biner")
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    with MatchLogReader(args.path) as reader:
+        games = reader.games()
+        per_player = {}
+        for rec in reader.iter_moves():
+            game = games.get(rec[3])
+            if game is None:
+                continue
+            algo = game["player1"] if rec[1] == 1 else game["player2"]
+            total = per_player.setdefault(algo, [0, 0.0, 0])
+            total[0] += 1
+            total[1] += rec[6]
+            total[2] += rec[7]
+
+        print(f"{args.path}: {len(games)} games, {reader.count_moves()} moves, "
+              f"{reader.num_records} records")
+        for algo, (moves, duration, nodes) in sorted(per_player.items()):
+            print(f"  {algo:<12} moves={moves:<8} avg_ms={duration / moves:.3f} "
+                  f"avg_nodes={nodes / moves:.1f}")
+
+
+if __name__ == "__main__":
+    main()
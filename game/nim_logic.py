@@ -4,29 +4,313 @@ Core logic untuk permainan NIM versi Misere
 (Pemain yang mengambil stik terakhir KALAH)
 """
 
+from game.rules import get_rule_set
+from game.zobrist import MASK64, TABLE_SIZE, KEYS, CHECKS, pile_key, pile_check
+
+
+class NimState:
+    """
+    State NIM dengan invariant yang di-cache.
+
+    Total stik, NIM-SUM, jumlah tumpukan berisi 1 (ones), tumpukan > 1 (bigs)
+    dan tumpukan aktif di-update O(1) setiap langkah, sehingga konsumen
+    (search, reflex, GUI) tidak perlu memindai ulang semua tumpukan.
+
+    Hash Zobrist (key, check) yang tidak bergantung urutan tumpukan juga
+    dijaga inkremental; dipakai sebagai kunci transposition table.
+    Versi XOR-nya (xkey, xcheck) hanya bergantung pada PARITAS jumlah
+    tumpukan tiap ukuran (pasangan tumpukan kembar saling menghapus),
+    dipakai untuk kunci kanonik (lihat algorithms.alpha_beta.canonical_key).
+
+    Mendukung protokol sequence (len, index, iterasi) agar bisa dipakai
+    di tempat yang sebelumnya menerima list.
+    """
+
+    __slots__ = ("piles", "total", "nim_sum", "ones", "bigs", "active",
+                 "key", "check", "xkey", "xcheck")
+
+    def __init__(self, piles):
+        self.piles = list(piles)
+        self.total = 0
+        self.nim_sum = 0
+        self.ones = 0
+        self.bigs = 0
+        self.active = 0
+        self.key = 0
+        self.check = 0
+        self.xkey = 0
+        self.xcheck = 0
+        for p in self.piles:
+            pk = pile_key(p)
+            pc = pile_check(p)
+            self.key += pk
+            self.check += pc
+            self.xkey ^= pk
+            self.xcheck ^= pc
+            self.total += p
+            self.nim_sum ^= p
+            if p == 1:
+                self.ones += 1
+            elif p > 1:
+                self.bigs += 1
+        self.active = self.ones + self.bigs
+        self.key &= MASK64
+        self.check &= MASK64
+
+    def copy(self):
+        """Salin state tanpa menghitung ulang invariant."""
+        new = NimState.__new__(NimState)
+        new.piles = self.piles.copy()
+        new.total = self.total
+        new.nim_sum = self.nim_sum
+        new.ones = self.ones
+        new.bigs = self.bigs
+        new.active = self.active
+        new.key = self.key
+        new.check = self.check
+        new.xkey = self.xkey
+        new.xcheck = self.xcheck
+        return new
+
+    def set_pile(self, i, new):
+        """Ubah isi satu tumpukan dan update semua invariant dalam O(1)."""
+        old = self.piles[i]
+        self.piles[i] = new
+        self.total += new - old
+        self.nim_sum ^= old ^ new
+        self.ones += (new == 1) - (old == 1)
+        self.bigs += (new > 1) - (old > 1)
+        self.active += (new > 0) - (old > 0)
+        if new < TABLE_SIZE and old < TABLE_SIZE:
+            kn, ko, cn, co = KEYS[new], KEYS[old], CHECKS[new], CHECKS[old]
+        else:
+            kn, ko, cn, co = pile_key(new), pile_key(old), pile_check(new), pile_check(old)
+        self.key = (self.key + kn - ko) & MASK64
+        self.check = (self.check + cn - co) & MASK64
+        self.xkey ^= kn ^ ko
+        self.xcheck ^= cn ^ co
+
+    def play(self, i, k):
+        """Ambil k stik dari tumpukan i (in-place, tanpa validasi - untuk search)."""
+        self.set_pile(i, self.piles[i] - k)
+
+    def undo(self, i, k):
+        """Batalkan play(i, k)."""
+        self.set_pile(i, self.piles[i] + k)
+
+    def apply(self, move):
+        """
+        Versi tervalidasi dari play() yang mengembalikan state baru.
+
+        Raises:
+            ValueError: Jika move tidak legal
+        """
+        i, k = move
+        if not (0 <= i < len(self.piles)):
+            raise ValueError(f"Invalid pile index: {i}")
+        if k <= 0 or k > self.piles[i]:
+            raise ValueError(f"Invalid move: cannot take {k} from pile {i} with {self.piles[i]} sticks")
+        new = self.copy()
+        new.play(i, k)
+        return new
+
+    def is_terminal(self):
+        return self.total == 0
+
+    def moves(self):
+        """Semua langkah legal (index_tumpukan, jumlah)."""
+        return get_moves(self.piles)
+
+    def winning_move(self):
+        return winning_move(self)
+
+    def to_list(self):
+        return self.piles.copy()
+
+    def __len__(self):
+        return len(self.piles)
+
+    def __getitem__(self, i):
+        return self.piles[i]
+
+    def __iter__(self):
+        return iter(self.piles)
+
+    def __eq__(self, other):
+        if isinstance(other, NimState):
+            return self.piles == other.piles
+        return self.piles == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"NimState({self.piles})"
+
+
+class PileHistogram:
+    """
+    Posisi NIM sebagai multiset: jumlah tumpukan per ukuran (histogram).
+
+    Urutan tumpukan tidak relevan untuk nilai permainan, jadi tumpukan
+    berukuran sama cukup diwakili satu entri. Langkah dibangkitkan per
+    UKURAN berbeda (size, jumlah), bukan per tumpukan, sehingga anak-anak
+    yang identik (mis. ambil 3 dari salah satu dari lima tumpukan 50)
+    hanya muncul sekali.
+
+    Antarmuka sama dengan NimState untuk search (play/undo/moves/
+    winning_move, invariant dan hash Zobrist), dan key-nya identik dengan
+    NimState untuk posisi yang sama.
+    """
+
+    __slots__ = ("counts", "total", "nim_sum", "ones", "bigs", "active",
+                 "key", "check", "xkey", "xcheck")
+
+    def __init__(self, piles):
+        # counts: ukuran (> 0) -> banyak tumpukan; tumpukan kosong tidak disimpan
+        self.counts = {}
+        for p in piles:
+            if p > 0:
+                self.counts[p] = self.counts.get(p, 0) + 1
+        state = NimState(piles)
+        self.total = state.total
+        self.nim_sum = state.nim_sum
+        self.ones = state.ones
+        self.bigs = state.bigs
+        self.active = state.active
+        self.key = state.key
+        self.check = state.check
+        self.xkey = state.xkey
+        self.xcheck = state.xcheck
+
+    def _move_pile(self, old, new):
+        """Pindahkan satu tumpukan dari ukuran old ke new (O(1))."""
+        counts = self.counts
+        if old:
+            c = counts[old] - 1
+            if c:
+                counts[old] = c
+            else:
+                del counts[old]
+        if new:
+            counts[new] = counts.get(new, 0) + 1
+        self.total += new - old
+        self.nim_sum ^= old ^ new
+        self.ones += (new == 1) - (old == 1)
+        self.bigs += (new > 1) - (old > 1)
+        self.active += (new > 0) - (old > 0)
+        if new < TABLE_SIZE and old < TABLE_SIZE:
+            kn, ko, cn, co = KEYS[new], KEYS[old], CHECKS[new], CHECKS[old]
+        else:
+            kn, ko, cn, co = pile_key(new), pile_key(old), pile_check(new), pile_check(old)
+        self.key = (self.key + kn - ko) & MASK64
+        self.check = (self.check + cn - co) & MASK64
+        self.xkey ^= kn ^ ko
+        self.xcheck ^= cn ^ co
+
+    def play(self, size, k):
+        """Ambil k stik dari salah satu tumpukan berukuran `size`."""
+        self._move_pile(size, size - k)
+
+    def undo(self, size, k):
+        """Batalkan play(size, k)."""
+        self._move_pile(size - k, size)
+
+    def moves(self):
+        """Langkah legal per ukuran berbeda: [(size, jumlah), ...]."""
+        return [(size, k) for size in self.counts for k in range(1, size + 1)]
+
+    def winning_move(self):
+        """Sama dengan winning_move() tetapi dalam bentuk (size, jumlah)."""
+        if self.bigs == 0:
+            if self.ones % 2 == 0 and self.ones > 0:
+                return (1, 1)
+            return None
+        if self.bigs == 1:
+            size = next(s for s in self.counts if s > 1)
+            return (size, size) if self.ones % 2 == 1 else (size, size - 1)
+        if self.nim_sum == 0:
+            return None
+        for size in self.counts:
+            target = size ^ self.nim_sum
+            if target < size:
+                return (size, size - target)
+        return None
+
+    def is_terminal(self):
+        return self.total == 0
+
+    @staticmethod
+    def to_pile_move(piles, move):
+        """Terjemahkan (size, jumlah) ke (index_tumpukan, jumlah) pada list piles."""
+        size, k = move
+        return (list(piles).index(size), k)
+
+
+def as_nim_state(state):
+    """Kembalikan state sebagai NimState (tanpa salinan jika sudah NimState)."""
+    return state if isinstance(state, NimState) else NimState(state)
+
+
+def winning_move(state):
+    """
+    Langkah menang berdasarkan teori NIM Misère (closed form, O(piles)).
+
+    Args:
+        state: List atau NimState
+
+    Returns:
+        Tuple (index_tumpukan, jumlah) atau None jika posisi kalah
+    """
+    state = as_nim_state(state)
+    piles = state.piles
+    if state.bigs == 0:
+        # End game: menang jika jumlah tumpukan 1 genap; ambil satu
+        if state.ones % 2 == 0 and state.ones > 0:
+            return (next(i for i, p in enumerate(piles) if p == 1), 1)
+        return None
+    if state.bigs == 1:
+        # Satu tumpukan besar: sisakan jumlah tumpukan 1 yang GANJIL
+        i = next(i for i, p in enumerate(piles) if p > 1)
+        return (i, piles[i]) if state.ones % 2 == 1 else (i, piles[i] - 1)
+    if state.nim_sum == 0:
+        return None
+    for i, p in enumerate(piles):
+        target = p ^ state.nim_sum
+        if target < p:
+            return (i, p - target)
+    return None
+
+
 def is_terminal(state):
     """
     Cek apakah game sudah selesai (semua tumpukan kosong).
     
     Args:
-        state: List berisi jumlah stik di setiap tumpukan
+        state: List atau NimState berisi jumlah stik di setiap tumpukan
         
     Returns:
         bool: True jika semua tumpukan kosong
     """
+    if isinstance(state, NimState):
+        return state.total == 0
     return all(pile == 0 for pile in state)
 
 
-def get_moves(state):
+def get_moves(state, rules=None):
     """
     Menghasilkan semua langkah legal dari state saat ini.
     
     Args:
         state: List berisi jumlah stik di setiap tumpukan
+        rules: RuleSet / nama rule set (None = NIM biasa)
         
     Returns:
         List of tuple: [(index_tumpukan, jumlah_stik_diambil), ...]
     """
+    rules = get_rule_set(rules)
+    if rules is not None and not rules.is_unrestricted:
+        return [(i, k) for i, pile in enumerate(state) for k in rules.takes(pile)]
+
     moves = []
     for i, pile in enumerate(state):
         for k in range(1, pile + 1):
@@ -34,17 +318,27 @@ def get_moves(state):
     return moves
 
 
-def apply_move(state, move):
+def apply_move(state, move, rules=None):
     """
     Mengembalikan state baru setelah langkah dilakukan.
     
     Args:
-        state: List berisi jumlah stik di setiap tumpukan
+        state: List atau NimState berisi jumlah stik di setiap tumpukan
         move: Tuple (index_tumpukan, jumlah_stik_diambil)
+        rules: RuleSet / nama rule set (None = NIM biasa)
         
     Returns:
-        List: State baru setelah move diterapkan
+        List (atau NimState jika input NimState): State baru setelah move diterapkan
     """
+    rules = get_rule_set(rules)
+    if rules is not None:
+        i, k = move
+        if 0 <= i < len(state) and not rules.is_legal(state[i], k):
+            raise ValueError(f"Invalid move: taking {k} is not allowed by rule set '{rules.name}'")
+
+    if isinstance(state, NimState):
+        return state.apply(move)
+
     i, k = move
 
     # Validasi: pastikan hanya satu pile dan jumlah legal
@@ -64,11 +358,19 @@ def get_game_info(state):
     Mendapatkan informasi statistik dari state saat ini.
     
     Args:
-        state: List berisi jumlah stik di setiap tumpukan
+        state: List atau NimState berisi jumlah stik di setiap tumpukan
         
     Returns:
         dict: Informasi game (total stik, jumlah tumpukan aktif, dll)
     """
+    if isinstance(state, NimState):
+        # Semua sudah di-cache: O(1)
+        return {
+            "total_sticks": state.total,
+            "active_piles": state.active,
+            "total_piles": len(state.piles),
+            "empty_piles": len(state.piles) - state.active
+        }
     return {
         "total_sticks": sum(state),
         "active_piles": sum(1 for p in state if p > 0),
@@ -0,0 +1,277 @@
+"""
+Profiling opt-in untuk panggilan engine di GameController.
+
+Jika aktif, setiap panggilan engine dibungkus profiler dan hasilnya
+dikumpulkan per (engine, level). dump() menulis ke direktori output:
+- <engine>_<level>.pstats    : cProfile (buka dengan pstats / snakeviz)
+- <engine>_<level>.collapsed : stack tersampel "a;b;c count" untuk flame
+  graph (flamegraph.pl, speedscope, inferno)
+
+File yang sudah ada digabung (bukan ditimpa), sehingga beberapa match
+dengan engine & level yang sama terkumpul dalam satu profil.
+
+Diaktifkan lewat environment variable NIM_PROFILE (mode: "cprofile",
+"sample", atau keduanya dipisah koma; "1" = keduanya) dan NIM_PROFILE_DIR,
+atau lewat CLI modul ini:
+    python -m game.profiling Alpha-Beta Reflex --level Hard --games 3
+    python -m game.profiling MCTS Grundy --level Medium --mode sample --out profiles
+
+Tanpa profiler (default) controller memanggil engine langsung: tidak ada
+overhead sama sekali.
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+PROFILE_ENV = "NIM_PROFILE"
+PROFILE_DIR_ENV = "NIM_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = "profiles"
+
+PROFILE_MODES = ("cprofile", "sample")
+# Interval sampling stack (ms); thread sampler butuh GIL, jadi interval
+# di bawah sys.getswitchinterval() (5 ms) tidak menambah resolusi
+DEFAULT_SAMPLE_INTERVAL_MS = 5.0
+# Batas kedalaman stack per sampel (rekursi alpha-beta / df-pn bisa dalam)
+MAX_STACK_DEPTH = 256
+
+
+def parse_modes(value):
+    """
+    Mode profiling dari string "cprofile,sample" / "1" / "all".
+
+    Raises:
+        ValueError: Jika ada mode yang tidak dikenal
+    """
+    value = (value or "").strip().lower()
+    if value in ("", "0", "off", "false"):
+        return ()
+    if value in ("1", "on", "true", "all"):
+        return PROFILE_MODES
+    modes = tuple(m.strip() for m in value.split(",") if m.strip())
+    for mode in modes:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"mode profiling tidak dikenal: {mode}")
+    return modes
+
+
+def profiler_from_env(label=None):
+    """EngineProfiler sesuai NIM_PROFILE / NIM_PROFILE_DIR, atau None jika tidak di-set."""
+    modes = parse_modes(os.environ.get(PROFILE_ENV))
+    if not modes:
+        return None
+    out_dir = os.environ.get(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR
+    return EngineProfiler(out_dir, label=label, modes=modes)
+
+
+def _slug(text):
+    """Nama aman untuk file ("Take 1-3" -> "Take_1-3")."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(text)).strip("_") or "custom"
+
+
+def _frame_name(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class _StackSampler:
+    """
+    Thread latar yang menyampel stack thread engine selama engine berjalan.
+
+    Stack dipotong di frame pembungkus (EngineProfiler.call), sehingga akar
+    setiap sampel adalah fungsi engine.
+    """
+
+    def __init__(self, interval_ms, root_code):
+        self.interval = interval_ms / 1000.0
+        self.root_code = root_code
+        self._lock = threading.Lock()
+        self._target = None
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread = None
+
+    def begin(self, counts):
+        """Mulai menyampel thread pemanggil ke `counts` (Counter stack -> jumlah)."""
+        with self._lock:
+            self._target = (threading.get_ident(), counts)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="engine-sampler", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def end(self):
+        with self._lock:
+            self._target = None
+        self._wake.clear()
+
+    def close(self):
+        self._stop = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._stop = False
+
+    def _run(self):
+        while not self._stop:
+            self._wake.wait()
+            time.sleep(self.interval)
+            with self._lock:
+                target = self._target
+                if target is None:
+                    continue
+                frame = sys._current_frames().get(target[0])
+                stack = []
+                code = None
+                while frame is not None and frame.f_code is not self.root_code \
+                        and len(stack) < MAX_STACK_DEPTH:
+                    code = frame.f_code
+                    # Frame Profile.runcall (mode cprofile) bukan bagian engine
+                    if code.co_filename != cProfile.__file__:
+                        stack.append(_frame_name(code))
+                    frame = frame.f_back
+                # Sampel saat engine sudah kembali (di dalam end()) dibuang
+                if stack and code is not _StackSampler.end.__code__:
+                    target[1][";".join(reversed(stack))] += 1
+
+
+class EngineProfiler:
+    """
+    Kumpulkan profil panggilan engine per (engine, level).
+
+    Satu instance boleh dipakai beberapa controller / game berturut-turut;
+    panggilan engine tidak boleh tumpang tindih (cProfile per thread).
+    """
+
+    def __init__(self, out_dir, label=None, modes=PROFILE_MODES,
+                 sample_interval_ms=DEFAULT_SAMPLE_INTERVAL_MS):
+        self.out_dir = out_dir
+        self.label = label
+        self.modes = tuple(modes)
+        self.profiles = {}
+        self.stacks = {}
+        self.calls = Counter()
+        self._sampler = _StackSampler(sample_interval_ms, EngineProfiler.call.__code__) \
+            if "sample" in self.modes else None
+
+    def _key(self, algo_name):
+        return f"{_slug(algo_name)}_{_slug(self.label)}"
+
+    def wrap(self, algo_name, algo_func):
+        """Fungsi engine yang setiap panggilannya diprofil atas nama `algo_name`."""
+        def profiled(state, **kwargs):
+            return self.call(algo_name, algo_func, state, **kwargs)
+        return profiled
+
+    def call(self, algo_name, algo_func, state, **kwargs):
+        """Panggil engine di bawah profiler; hasilnya dikembalikan apa adanya."""
+        key = self._key(algo_name)
+        self.calls[key] += 1
+        profile = None
+        if "cprofile" in self.modes:
+            profile = self.profiles.get(key)
+            if profile is None:
+                profile = self.profiles[key] = cProfile.Profile()
+        if self._sampler is not None:
+            self._sampler.begin(self.stacks.setdefault(key, Counter()))
+        try:
+            if profile is not None:
+                return profile.runcall(algo_func, state, **kwargs)
+            return algo_func(state, **kwargs)
+        finally:
+            if self._sampler is not None:
+                self._sampler.end()
+
+    def dump(self):
+        """
+        Tulis profil yang terkumpul (digabung dengan file lama) lalu kosongkan.
+
+        Returns:
+            list: Path file yang ditulis
+        """
+        written = []
+        if not self.profiles and not any(self.stacks.values()):
+            return written
+        os.makedirs(self.out_dir, exist_ok=True)
+        for key, profile in self.profiles.items():
+            path = os.path.join(self.out_dir, key + ".pstats")
+            stats = pstats.Stats(profile)
+            if os.path.exists(path):
+                stats.add(path)
+            stats.dump_stats(path)
+            written.append(path)
+        for key, counts in self.stacks.items():
+            if not counts:
+                continue
+            path = os.path.join(self.out_dir, key + ".collapsed")
+            merged = Counter(_read_collapsed(path)) if os.path.exists(path) else Counter()
+            merged.update(counts)
+            with open(path, "w") as f:
+                for stack, count in sorted(merged.items()):
+                    f.write(f"{stack} {count}\n")
+            written.append(path)
+        self.profiles = {}
+        self.stacks = {}
+        return written
+
+    def close(self):
+        """Hentikan thread sampler (profil yang belum di-dump tetap tersimpan)."""
+        if self._sampler is not None:
+            self._sampler.close()
+
+
+def _read_collapsed(path):
+    """Baca file collapsed-stack: dict stack -> jumlah sampel."""
+    counts = {}
+    with open(path) as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack and count.isdigit():
+                counts[stack] = counts.get(stack, 0) + int(count)
+    return counts
+
+
+def main():
+    from config.settings import DIFFICULTY_LEVELS
+    from game.game_controller import GameController
+
+    parser = argparse.ArgumentParser(description="Profil engine per langkah (cProfile / sampling)")
+    parser.add_argument("player1")
+    parser.add_argument("player2")
+    parser.add_argument("--level", choices=list(DIFFICULTY_LEVELS), default="Medium")
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--mode", default="all", help="cprofile, sample, atau keduanya (koma)")
+    parser.add_argument("--out", default=os.environ.get(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR)
+    parser.add_argument("--interval-ms", type=float, default=DEFAULT_SAMPLE_INTERVAL_MS)
+    parser.add_argument("--top", type=int, default=15, help="Baris pstats yang dicetak per engine")
+    args = parser.parse_args()
+
+    level = DIFFICULTY_LEVELS[args.level]
+    profiler = EngineProfiler(args.out, label=args.level, modes=parse_modes(args.mode),
+                              sample_interval_ms=args.interval_ms)
+    try:
+        for _ in range(args.games):
+            controller = GameController(level["piles"], args.player1, args.player2,
+                                        rules=level.get("rules"), profiler=profiler)
+            while not controller.game_over:
+                controller.play_one_move()
+        profiles = dict(profiler.profiles)
+        written = profiler.dump()
+    finally:
+        profiler.close()
+
+    for key, profile in profiles.items():
+        print(f"\n== {key} ({profiler.calls[key]} panggilan engine) ==")
+        pstats.Stats(profile).sort_stats("cumulative").print_stats(args.top)
+    for path in written:
+        print(f"ditulis: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Aturan pengambilan stik (rule set) untuk varian NIM.
+
+NIM biasa membolehkan mengambil berapa saja dari satu tumpukan.
+Varian "subtraction game" membatasi jumlah yang boleh diambil,
+mis. hanya 1-3 stik, atau hanya pangkat dua (1, 2, 4, 8, ...).
+"""
+
+
+class RuleSet:
+    """
+    Satu aturan pengambilan.
+
+    Args:
+        name: Nama unik (dipakai sebagai kunci cache tabel Grundy)
+        description: Penjelasan singkat untuk GUI
+        allowed: None = bebas (NIM biasa), iterable int = himpunan jumlah
+            yang boleh diambil, atau "powers_of_two"
+    """
+
+    def __init__(self, name, description, allowed=None):
+        self.name = name
+        self.description = description
+        if allowed is None or allowed == "powers_of_two":
+            self.allowed = allowed
+        else:
+            self.allowed = tuple(sorted(set(allowed)))
+            if not self.allowed or self.allowed[0] <= 0:
+                raise ValueError("Jumlah yang boleh diambil harus bilangan positif")
+            # Mengambil 1 selalu legal, sehingga posisi terminal tetap
+            # "semua tumpukan kosong" seperti pada NIM biasa
+            if self.allowed[0] != 1:
+                raise ValueError("Rule set harus membolehkan mengambil 1 stik")
+
+    @property
+    def is_unrestricted(self):
+        return self.allowed is None
+
+    def takes(self, pile):
+        """Semua jumlah legal yang boleh diambil dari tumpukan berisi `pile`."""
+        if self.allowed is None:
+            return range(1, pile + 1)
+        if self.allowed == "powers_of_two":
+            return [1 << j for j in range(pile.bit_length())]
+        return [k for k in self.allowed if k <= pile]
+
+    def is_legal(self, pile, k):
+        if k <= 0 or k > pile:
+            return False
+        if self.allowed is None:
+            return True
+        if self.allowed == "powers_of_two":
+            return k & (k - 1) == 0
+        return k in self.allowed
+
+    def __repr__(self):
+        return f"RuleSet({self.name!r})"
+
+
+RULE_SETS = {
+    "nim": RuleSet("nim", "Ambil berapa saja dari satu tumpukan"),
+    "subtract_1_3": RuleSet("subtract_1_3", "Ambil 1-3 stik dari satu tumpukan", (1, 2, 3)),
+    "powers_of_two": RuleSet("powers_of_two", "Ambil 1, 2, 4, 8, ... stik", "powers_of_two"),
+    "subtract_1_3_4": RuleSet("subtract_1_3_4", "Ambil 1, 3, atau 4 stik", (1, 3, 4))
+}
+
+
+def get_rule_set(rules):
+    """
+    Normalisasi argumen rules: None, nama rule set, atau RuleSet.
+
+    Returns:
+        RuleSet atau None (None = NIM biasa)
+    """
+    if rules is None or isinstance(rules, RuleSet):
+        return rules
+    return RULE_SETS[rules]
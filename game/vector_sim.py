@@ -0,0 +1,235 @@
+"""
+Simulator lockstep tervektorisasi: ribuan game NIM Misère sekaligus.
+
+Setiap game adalah satu baris array NumPy (G x jumlah_tumpukan). Semua
+game berjalan serempak per ply (giliran pemain sama untuk semua baris),
+engine versi array memilih langkah untuk semua baris aktif sekaligus,
+langkah diterapkan dengan indexing vektor, dan game yang selesai
+dikeluarkan dari himpunan aktif sampai semua baris terminal.
+
+Engine versi array (VECTOR_ENGINES):
+    "Grundy" : strategi sempurna (nilai Grundy + aturan misère "tame"),
+               posisi kalah -> ambil 1 dari tumpukan terbesar (= grundy_move)
+    "Reflex" : strategi sempurna, posisi kalah -> langkah acak (seperti reflex_move)
+    "Random" : selalu langkah legal acak
+
+Rule set varian didukung lewat tabel Grundy (algorithms.grundy).
+NumPy adalah dependensi opsional yang hanya dibutuhkan modul ini.
+
+Contoh:
+    python -m game.vector_sim Reflex Random --games 1000000
+    python -m game.vector_sim Grundy Reflex --levels Easy Hard --batch-size 8192
+"""
+
+import argparse
+import time
+
+try:
+    import numpy as np
+except ImportError:  # hanya modul ini yang butuh numpy
+    np = None
+
+from algorithms.grundy import check_misere_rule, grundy_table
+from config.settings import DIFFICULTY_LEVELS
+from game.rules import get_rule_set
+
+VECTOR_ENGINES = ("Grundy", "Reflex", "Random")
+# Jumlah game per batch simulate_levels() (memori ~ batch x tumpukan x 8 byte)
+DEFAULT_BATCH_SIZE = 4096
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("game.vector_sim membutuhkan NumPy (pip install numpy)")
+
+
+def _random_moves(piles, takes, rng):
+    """Langkah legal acak untuk setiap baris (tumpukan acak, jumlah acak)."""
+    pile_idx = np.where(piles > 0, rng.random(piles.shape), -1.0).argmax(axis=1)
+    sizes = piles[np.arange(len(piles)), pile_idx]
+    if takes is None:
+        return pile_idx, (rng.random(len(sizes)) * sizes).astype(np.int64) + 1
+    legal = takes[None, :] <= sizes[:, None]
+    pick = np.where(legal, rng.random(legal.shape), -1.0).argmax(axis=1)
+    return pile_idx, takes[pick]
+
+
+def engine_moves(engine, piles, grundy=None, takes=None, rng=None):
+    """
+    Pilih langkah untuk semua baris `piles` sekaligus (semua belum terminal).
+
+    Args:
+        engine: Nama di VECTOR_ENGINES
+        piles: Array int64 (n x jumlah_tumpukan)
+        grundy: Array tabel Grundy (None = NIM biasa, g(n) = n)
+        takes: Array jumlah legal yang mungkin (None = NIM biasa)
+        rng: numpy.random.Generator untuk langkah acak
+
+    Returns:
+        tuple: (index_tumpukan, jumlah) - dua array int64 sepanjang n
+    """
+    if engine == "Random":
+        return _random_moves(piles, takes, rng)
+
+    n = len(piles)
+    rows = np.arange(n)
+    g = piles if grundy is None else grundy[piles]
+    xor = np.bitwise_xor.reduce(g, axis=1)
+    big = g > 1
+    bigs = big.sum(axis=1)
+    winning = np.where(bigs > 0, xor != 0, xor == 0)
+
+    target = g ^ xor[:, None]
+    # Misère: jika setelah langkah semua nilai Grundy <= 1,
+    # lawan harus menerima XOR 1 (jumlah tumpukan bernilai 1 ganjil)
+    target ^= ((bigs[:, None] - big) == 0) & (target <= 1)
+    if grundy is None:
+        found = target < piles
+        amounts = piles - target
+    else:
+        found = np.zeros(piles.shape, dtype=bool)
+        amounts = np.zeros(piles.shape, dtype=np.int64)
+        for k in takes:
+            ok = ~found & (piles >= k)
+            ok &= grundy[np.maximum(piles - k, 0)] == target
+            amounts[ok] = k
+            found |= ok
+    found &= winning[:, None]
+
+    has_move = found.any(axis=1)
+    pile_idx = found.argmax(axis=1)
+    take = amounts[rows, pile_idx]
+    losing = np.flatnonzero(~has_move)
+    if losing.size:
+        if engine == "Grundy":
+            # Posisi kalah: ambil 1 dari tumpukan terbesar agar permainan panjang
+            pile_idx[losing] = piles[losing].argmax(axis=1)
+            take[losing] = 1
+        else:
+            pile_idx[losing], take[losing] = _random_moves(piles[losing], takes, rng)
+    return pile_idx, take
+
+
+class VectorSimulator:
+    """
+    Jalankan banyak game dari posisi awal yang sama secara lockstep.
+    """
+
+    def __init__(self, initial_piles, player1_algo, player2_algo, rules=None, seed=None):
+        """
+        Args:
+            initial_piles: Tumpukan awal (sama untuk semua game)
+            player1_algo, player2_algo: Nama di VECTOR_ENGINES
+            rules: RuleSet / nama rule set (None = NIM biasa)
+            seed: Seed numpy.random.Generator (None = acak)
+
+        Raises:
+            ImportError: Jika NumPy tidak terpasang
+            ValueError: Engine tanpa versi array / misère tidak didukung rule set
+        """
+        _require_numpy()
+        for algo in (player1_algo, player2_algo):
+            if algo not in VECTOR_ENGINES:
+                raise ValueError(f"Engine '{algo}' tidak punya versi array "
+                                 f"(pilih dari {', '.join(VECTOR_ENGINES)})")
+        self.engines = {1: player1_algo, 2: player2_algo}
+        self.initial = np.array(list(initial_piles), dtype=np.int64)
+        self.rng = np.random.default_rng(seed)
+
+        rules = get_rule_set(rules)
+        self.grundy = None
+        self.takes = None
+        if rules is not None and not rules.is_unrestricted:
+            check_misere_rule(rules)
+            max_pile = int(self.initial.max(initial=0))
+            table = grundy_table(rules, max_pile)
+            self.grundy = np.array(table[:max_pile + 1], dtype=np.int64)
+            self.takes = np.array(rules.takes(max_pile), dtype=np.int64)
+
+    def run(self, num_games):
+        """
+        Mainkan `num_games` game sampai semuanya selesai.
+
+        Returns:
+            dict: "winners" (int8, 1/2 per game) dan "lengths" (int32, jumlah langkah)
+        """
+        piles = np.tile(self.initial, (num_games, 1))
+        remaining = np.full(num_games, int(self.initial.sum()), dtype=np.int64)
+        winners = np.zeros(num_games, dtype=np.int8)
+        lengths = np.zeros(num_games, dtype=np.int32)
+        active = np.flatnonzero(remaining > 0)
+        player = 1
+
+        while active.size:
+            pile_idx, take = engine_moves(self.engines[player], piles[active],
+                                          self.grundy, self.takes, self.rng)
+            piles[active, pile_idx] -= take
+            remaining[active] -= take
+            lengths[active] += 1
+            # Pemain yang mengambil stik terakhir = kalah (Misère)
+            done = remaining[active] == 0
+            winners[active[done]] = 3 - player
+            active = active[~done]
+            player = 3 - player
+
+        return {"winners": winners, "lengths": lengths}
+
+
+def simulate_levels(player1_algo, player2_algo, games, levels=None,
+                    batch_size=DEFAULT_BATCH_SIZE, seed=None):
+    """
+    Win rate per level DIFFICULTY_LEVELS untuk `games` game per level.
+
+    Game dijalankan per batch agar memori tetap kecil untuk jutaan game.
+
+    Returns:
+        dict: nama_level -> {"games", "player1_wins", "player1_win_rate",
+            "avg_length", "duration_sec"}
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    results = {}
+    for name in levels or DIFFICULTY_LEVELS:
+        level = DIFFICULTY_LEVELS[name]
+        sim = VectorSimulator(level["piles"], player1_algo, player2_algo,
+                              rules=level.get("rules"), seed=int(rng.integers(1 << 63)))
+        start = time.perf_counter()
+        p1_wins = 0
+        total_length = 0
+        played = 0
+        while played < games:
+            batch = sim.run(min(batch_size, games - played))
+            p1_wins += int((batch["winners"] == 1).sum())
+            total_length += int(batch["lengths"].sum())
+            played += len(batch["winners"])
+        results[name] = {
+            "games": games,
+            "player1_wins": p1_wins,
+            "player1_win_rate": p1_wins / games if games else 0.0,
+            "avg_length": total_length / games if games else 0.0,
+            "duration_sec": time.perf_counter() - start
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulasi lockstep banyak game (butuh NumPy)")
+    parser.add_argument("player1", choices=VECTOR_ENGINES)
+    parser.add_argument("player2", choices=VECTOR_ENGINES)
+    parser.add_argument("--games", type=int, default=100_000, help="Jumlah game per level")
+    parser.add_argument("--levels", nargs="+", choices=list(DIFFICULTY_LEVELS), default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    results = simulate_levels(args.player1, args.player2, args.games, args.levels,
+                              args.batch_size, args.seed)
+    print(f"{args.player1} (P1) vs {args.player2} (P2), {args.games} games per level")
+    for name, r in results.items():
+        print(f"  {name:<16} P1 win {r['player1_win_rate']:>7.2%}  "
+              f"avg moves {r['avg_length']:>8.1f}  "
+              f"{r['games'] / r['duration_sec']:>10.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
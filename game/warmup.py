@@ -0,0 +1,120 @@
+"""
+Warm-up engine: analisis spekulatif posisi awal di proses latar.
+
+Selama user masih memilih setting di SetupWindow, langkah pertama engine
+pemain 1 untuk level terpilih sudah dihitung di proses terpisah (spawn,
+tanpa Tk). Saat match dimulai hasilnya diserahkan ke GameController
+lewat add_precomputed(), sehingga langkah pertama langsung keluar.
+
+Hanya engine yang mahal (WARMUP_ALGOS) dan benar-benar dipakai pada
+papan/rule set itu (tidak diganti Grundy) yang di-warm-up. Hasil yang
+belum selesai saat match dimulai dibuang; engine lalu berpikir sendiri.
+"""
+
+import multiprocessing
+
+from game.game_controller import GameController
+from game.rules import get_rule_set
+
+WARMUP_ALGOS = ("Alpha-Beta", "Proof-Number", "MCTS")
+
+
+def _analyse(conn, piles, algo_name, rules, time_control):
+    """Entry point proses latar: satu langkah engine dari posisi awal."""
+    controller = GameController(piles, algo_name, algo_name,
+                                time_control=time_control, rules=rules)
+    move_info = controller.play_one_move()
+    # Langkah fallback (engine overrun) tidak layak dipakai ulang
+    if not move_info["stats"].get("overrun"):
+        conn.send((move_info["move"], move_info["stats"]))
+    conn.close()
+
+
+class EngineWarmup:
+    """
+    Satu analisis spekulatif yang berjalan di proses latar.
+
+    start() dengan setting berbeda membatalkan analisis lama; poll()
+    tidak pernah memblok, sehingga aman dipanggil dari thread Tk.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.result = None
+        self._process = None
+        self._conn = None
+
+    def start(self, piles, algo_name, rules=None, time_control=None):
+        """
+        Mulai (ulang) analisis posisi `piles` untuk engine `algo_name`.
+
+        Returns:
+            bool: True jika analisis berjalan / sudah selesai untuk setting ini
+        """
+        if algo_name not in WARMUP_ALGOS:
+            self.cancel()
+            return False
+        key = (tuple(piles), algo_name, getattr(get_rule_set(rules), "name", "nim"),
+               repr(time_control))
+        if key == self.key:
+            return True
+        self.cancel()
+        controller = GameController(piles, algo_name, algo_name,
+                                    time_control=time_control, rules=rules)
+        if controller.resolve_engine(algo_name)[0] is not controller.algo_map[algo_name]:
+            return False  # engine diganti Grundy (varian / huge-board): sudah instan
+
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_analyse, args=(child_conn, list(piles), algo_name, rules, time_control),
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self.key = key
+        return True
+
+    def poll(self):
+        """True jika hasil sudah tersedia (tidak memblok)."""
+        if self.result is None and self._conn is not None and self._conn.poll():
+            try:
+                self.result = self._conn.recv()
+            except EOFError:
+                pass  # proses selesai tanpa hasil (overrun)
+            self._close()
+        return self.result is not None
+
+    def cancel(self):
+        """Hentikan analisis yang sedang berjalan dan lupakan hasilnya."""
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+        self._close()
+        self.key = None
+        self.result = None
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join(timeout=1)
+            self._process = None
+
+    def hand_off(self, controller):
+        """
+        Serahkan langkah hasil warm-up ke `controller` jika sudah selesai dan
+        setting match sama persis, lalu hentikan proses latar.
+
+        Returns:
+            bool: True jika langkah diserahkan
+        """
+        handed = False
+        key = (tuple(controller.initial_state), controller.player1_algo,
+               getattr(controller.rules, "name", "nim"), repr(controller.time_control))
+        if key == self.key and self.poll():
+            move, stats = self.result
+            controller.add_precomputed(controller.player1_algo, key[0], move, stats)
+            handed = True
+        self.cancel()
+        return handed
@@ -0,0 +1,80 @@
+"""
+Zobrist-style hashing untuk posisi NIM yang tidak bergantung urutan tumpukan.
+
+Setiap ukuran tumpukan punya dua kunci acak 64-bit (key dan check).
+Hash posisi = JUMLAH (mod 2^64) kunci semua tumpukan, sehingga:
+  - [10, 50] dan [50, 10] punya hash yang sama (tanpa sorted())
+  - mengubah satu tumpukan cukup: hash + Z[baru] - Z[lama]  -> O(1)
+  - tumpukan kosong (ukuran 0) berkunci 0 sehingga tidak memengaruhi hash
+
+`check` adalah hash independen kedua yang disimpan di entri TT untuk
+mendeteksi tabrakan `key`.
+"""
+
+MASK64 = (1 << 64) - 1
+# Kunci ukuran kecil disimpan di tabel; ukuran lebih besar dihitung langsung
+TABLE_SIZE = 1 << 12
+
+_KEY_SEED = 0x9E3779B97F4A7C15
+_CHECK_SEED = 0xD1B54A32D192ED03
+
+# Di-XOR ke key saat giliran bukan milik pemain Max (root)
+SIDE_KEY = 0xA24BAED4963EE407
+# Di-XOR ke kunci kanonik jika masih ada tumpukan > 1 (fase normal)
+REGIME_KEY = 0x3C6EF372FE94F82B
+
+
+def _splitmix64(x):
+    """Fungsi campur 64-bit deterministik (SplitMix64)."""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def _make_key(size, seed):
+    if size == 0:
+        return 0
+    return _splitmix64(size * 0x2545F4914F6CDD1D ^ seed)
+
+
+KEYS = [_make_key(n, _KEY_SEED) for n in range(TABLE_SIZE)]
+CHECKS = [_make_key(n, _CHECK_SEED) for n in range(TABLE_SIZE)]
+
+
+def pile_key(size):
+    """Kunci utama untuk satu tumpukan berukuran `size`."""
+    return KEYS[size] if size < TABLE_SIZE else _make_key(size, _KEY_SEED)
+
+
+def pile_check(size):
+    """Kunci verifikasi untuk satu tumpukan berukuran `size`."""
+    return CHECKS[size] if size < TABLE_SIZE else _make_key(size, _CHECK_SEED)
+
+
+def position_xor_hash(piles):
+    """
+    Hitung (xkey, xcheck): versi XOR yang hanya bergantung pada paritas
+    jumlah tumpukan per ukuran (O(piles)).
+    """
+    key = 0
+    check = 0
+    for p in piles:
+        key ^= pile_key(p)
+        check ^= pile_check(p)
+    return key, check
+
+
+def position_hash(piles):
+    """
+    Hitung (key, check) dari nol untuk list tumpukan (O(piles)).
+
+    Returns:
+        tuple: (key, check)
+    """
+    key = 0
+    check = 0
+    for p in piles:
+        key += pile_key(p)
+        check += pile_check(p)
+    return key & MASK64, check & MASK64
@@ -0,0 +1,190 @@
+"""
+Chart ringan berbasis tk.Canvas untuk statistik per langkah
+(durasi_ms, nodes_explored) setiap pemain.
+
+Tidak memakai library plotting. Setiap seri digambar sebagai satu
+polyline; seri yang lebih panjang dari lebar chart didesimasi menjadi
+pasangan min/max per kolom piksel (lonjakan tetap terlihat) dari
+ringkasan chunk yang di-update inkremental, sehingga ribuan bahkan
+jutaan langkah tetap digambar instan.
+"""
+
+import tkinter as tk
+from array import array
+
+PLAYER_COLORS = {1: "#f1c40f", 2: "#e74c3c"}
+MARGIN_LEFT = 48
+MARGIN_RIGHT = 8
+MARGIN_TOP = 18
+MARGIN_BOTTOM = 14
+# Batas jumlah ringkasan min/max per seri; lewat dari ini chunk digandakan
+MAX_CHUNKS = 2048
+
+
+class Series:
+    """
+    Data satu pemain + ringkasan min/max per chunk yang di-update
+    inkremental, sehingga desimasi tidak pernah memindai semua nilai.
+
+    Ukuran chunk berlipat dua setiap kali ringkasan mencapai
+    2 x MAX_CHUNKS (pasangan chunk digabung), jadi biaya add() amortized O(1).
+    """
+
+    __slots__ = ("moves", "values", "chunk", "lows", "highs")
+
+    def __init__(self):
+        self.moves = array("I")
+        self.values = array("d")
+        self.chunk = 1
+        self.lows = array("d")
+        self.highs = array("d")
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, move_number, value):
+        self.moves.append(move_number)
+        self.values.append(value)
+        n = len(self.values)
+        if n % self.chunk:
+            return
+        if self.chunk == 1:
+            self.lows.append(value)
+            self.highs.append(value)
+        else:
+            block = self.values[n - self.chunk:]
+            self.lows.append(min(block))
+            self.highs.append(max(block))
+        if len(self.lows) == 2 * MAX_CHUNKS:
+            self.lows = array("d", map(min, self.lows[0::2], self.lows[1::2]))
+            self.highs = array("d", map(max, self.highs[0::2], self.highs[1::2]))
+            self.chunk *= 2
+
+    def peak(self):
+        tail = self.values[len(self.lows) * self.chunk:]
+        return max(max(self.highs, default=0.0), max(tail, default=0.0))
+
+    def points(self, buckets):
+        """
+        Titik polyline (index_nilai, nilai), paling banyak ~2 x `buckets`.
+
+        Setiap bucket menyumbang min lalu max-nya (di awal & akhir bucket)
+        agar lonjakan tetap terlihat walau didesimasi.
+        """
+        chunk = self.chunk
+        lows, highs = self.lows, self.highs
+        full = len(lows) * chunk
+        tail = self.values[full:]
+        if chunk == 1 and len(self.values) <= 2 * buckets:
+            return list(enumerate(self.values))
+
+        # Unit = satu chunk lengkap (+ sisa nilai yang belum jadi chunk)
+        n = len(self.values)
+        units = len(lows) + (1 if tail else 0)
+        buckets = max(1, min(buckets, units))
+        points = []
+        for b in range(buckets):
+            lo_u = b * units // buckets
+            hi_u = (b + 1) * units // buckets
+            full_hi = min(hi_u, len(lows))
+            low_part = lows[lo_u:full_hi].tolist()
+            high_part = highs[lo_u:full_hi].tolist()
+            if hi_u > len(lows):
+                low_part.append(min(tail))
+                high_part.append(max(tail))
+            points.append((lo_u * chunk, min(low_part)))
+            points.append((min(hi_u * chunk, n) - 1, max(high_part)))
+        return points
+
+
+class MoveChart:
+    """
+    Chart satu metrik stats (mis. "duration_ms") untuk kedua pemain.
+
+    add_move() hanya menambah data; redraw() dipanggil pemanggil
+    (mis. sekali per frame) agar biaya gambar tidak per langkah.
+    """
+
+    def __init__(self, parent, metric, title, height=100, unit=""):
+        self.metric = metric
+        self.title = title
+        self.unit = unit
+        self.canvas = tk.Canvas(parent, height=height, bg="#1e272e", highlightthickness=0)
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.series = {1: Series(), 2: Series()}
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def clear(self):
+        self.series = {1: Series(), 2: Series()}
+
+    def add_move(self, move_info):
+        stats = move_info.get("stats") or {}
+        self.series[move_info["player"]].add(move_info["move_number"],
+                                             float(stats.get(self.metric) or 0))
+
+    def set_moves(self, move_history):
+        """Isi ulang data dari move_history lengkap lalu gambar."""
+        self.clear()
+        for move_info in move_history:
+            self.add_move(move_info)
+        self.redraw()
+
+    def redraw(self):
+        canvas = self.canvas
+        canvas.delete("all")
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if width <= 1:
+            width = int(canvas["width"])
+        if height <= 1:
+            height = int(canvas["height"])
+        plot_w = width - MARGIN_LEFT - MARGIN_RIGHT
+        plot_h = height - MARGIN_TOP - MARGIN_BOTTOM
+
+        last_move = max((s.moves[-1] for s in self.series.values() if len(s)), default=0)
+        peak = max(s.peak() for s in self.series.values())
+        canvas.create_text(MARGIN_LEFT, 2, anchor="nw", fill="white",
+                           font=("Arial", 9, "bold"), text=self.title)
+        canvas.create_text(MARGIN_LEFT - 4, MARGIN_TOP, anchor="ne", fill="#bdc3c7",
+                           font=("Arial", 8), text=_format_value(peak, self.unit))
+        canvas.create_text(MARGIN_LEFT - 4, MARGIN_TOP + plot_h, anchor="e", fill="#bdc3c7",
+                           font=("Arial", 8), text="0")
+        canvas.create_text(width - MARGIN_RIGHT, height - 1, anchor="se", fill="#bdc3c7",
+                           font=("Arial", 8), text=f"move {last_move}")
+        canvas.create_rectangle(MARGIN_LEFT, MARGIN_TOP, MARGIN_LEFT + plot_w,
+                                MARGIN_TOP + plot_h, outline="#57606f")
+        if plot_w <= 2 or last_move == 0:
+            return
+
+        x_scale = plot_w / max(1, last_move - 1)
+        y_scale = plot_h / peak if peak > 0 else 0.0
+        base_y = MARGIN_TOP + plot_h
+        for player, series in self.series.items():
+            if not len(series):
+                continue
+            moves = series.moves
+            coords = []
+            for i, value in series.points(plot_w // 2):
+                coords.append(MARGIN_LEFT + (moves[i] - 1) * x_scale)
+                coords.append(base_y - value * y_scale)
+            if len(coords) == 2:
+                coords.extend(coords)  # satu titik: gambar garis nol-panjang
+            canvas.create_line(*coords, fill=PLAYER_COLORS[player], width=1)
+
+        for player, color in PLAYER_COLORS.items():
+            canvas.create_text(width - MARGIN_RIGHT - (2 - player) * 28, 2, anchor="ne",
+                               fill=color, font=("Arial", 8, "bold"), text=f"P{player}")
+
+
+def _format_value(value, unit):
+    if value >= 1_000_000:
+        text = f"{value / 1_000_000:.1f}M"
+    elif value >= 1_000:
+        text = f"{value / 1_000:.1f}K"
+    elif value >= 10 or value == 0:
+        text = f"{value:.0f}"
+    else:
+        text = f"{value:.2f}"
+    return text + unit
@@ -1,10 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import threading
 import time
 
-from config.settings import DIFFICULTY_LEVELS, ALGORITHMS, GUI_CONFIG
+from algorithms.alpha_beta import alphabeta_analyse
+from config.settings import (DIFFICULTY_LEVELS, HUGE_LEVELS, ALGORITHMS, AUTO_PLAY_SPEEDS,
+                             GUI_CONFIG, TIME_CONTROLS)
+from gui.charts import MoveChart
 from game.game_controller import GameController
-from game.nim_logic import get_game_info, apply_move
+from game.huge_board import get_level
+from game.nim_logic import get_game_info, apply_move, is_terminal
+from game.profiling import profiler_from_env
+from game.warmup import EngineWarmup
+
+# Maksimal pile yang dicantumkan di dialog langkah pemain
+DIALOG_MAX_PILES = 50
+# Jumlah tumpukan yang disampel untuk histogram huge-board
+HUGE_DRAW_SAMPLE = 20_000
+# Interval cek status warm-up engine di SetupWindow
+WARMUP_POLL_MS = 250
+# Interval cek hasil analisis hint di GameWindow
+HINT_POLL_MS = 50
 
 
 # ======================================================
@@ -13,11 +29,15 @@ from game.nim_logic import get_game_info, apply_move
 class SetupWindow:
     def __init__(self, on_start_callback):
         self.on_start_callback = on_start_callback
+        # Langkah pertama pemain 1 dianalisis di proses latar selama setup terbuka
+        self.warmup = EngineWarmup()
+        self._warmup_poll_id = None
         self.root = tk.Tk()
         self.root.title("NIM Misère - Setup")
-        self.root.geometry("400x360")
+        self.root.geometry("400x480")
         self.root.resizable(True, True)
         self._build_ui()
+        self._restart_warmup()
 
     def _build_ui(self):
         frame = ttk.Frame(self.root, padding=20)
@@ -41,7 +61,7 @@ class SetupWindow:
         ttk.Combobox(
             frame,
             textvariable=self.diff_var,
-            values=list(DIFFICULTY_LEVELS.keys()),
+            values=list(DIFFICULTY_LEVELS.keys()) + list(HUGE_LEVELS.keys()),
             state="readonly"
         ).pack(fill="x", pady=5)
 
@@ -65,14 +85,71 @@ class SetupWindow:
             state="readonly"
         ).pack(fill="x", pady=5)
 
+        # Time Control
+        ttk.Label(frame, text="Time Control").pack(anchor="w")
+        self.time_var = tk.StringVar(value="Unlimited")
+        ttk.Combobox(
+            frame,
+            textvariable=self.time_var,
+            values=list(TIME_CONTROLS.keys()),
+            state="readonly"
+        ).pack(fill="x", pady=5)
+
+        # Log per langkah (riwayat lengkap tetap ada di controller)
+        self.log_moves_var = tk.BooleanVar(value=GUI_CONFIG["log_moves"])
+        ttk.Checkbutton(frame, text="Catat setiap langkah di log",
+                        variable=self.log_moves_var).pack(anchor="w", pady=5)
+
+        # Status warm-up; analisis di-restart setiap setting yang relevan berubah
+        self.warmup_label = ttk.Label(frame, text="", foreground="gray")
+        self.warmup_label.pack(anchor="w")
+        for var in (self.mode_var, self.diff_var, self.p1_algo, self.time_var):
+            var.trace_add("write", lambda *args: self._restart_warmup())
+
         ttk.Button(frame, text="Start Match", command=self.start).pack(pady=15)
 
+    def _restart_warmup(self):
+        """Analisis spekulatif langkah pertama pemain 1 untuk setting terpilih."""
+        if self._warmup_poll_id is not None:
+            self.root.after_cancel(self._warmup_poll_id)
+            self._warmup_poll_id = None
+        running = False
+        # PLAYER_VS_Komputer: langkah pertama milik manusia. Huge-board: engine diganti Grundy.
+        if self.mode_var.get() == "Komputer_VS_Komputer" and self.diff_var.get() in DIFFICULTY_LEVELS:
+            level = DIFFICULTY_LEVELS[self.diff_var.get()]
+            running = self.warmup.start(level["piles"], self.p1_algo.get(),
+                                        rules=level.get("rules"),
+                                        time_control=TIME_CONTROLS.get(self.time_var.get()))
+        else:
+            self.warmup.cancel()
+        if running:
+            self._poll_warmup()
+        else:
+            self.warmup_label.config(text="")
+
+    def _poll_warmup(self):
+        self._warmup_poll_id = None
+        if self.warmup.key is None:
+            self.warmup_label.config(text="")
+        elif self.warmup.poll():
+            self.warmup_label.config(text="Warm-up: langkah pertama Player 1 siap")
+        else:
+            self.warmup_label.config(text="Warm-up: menganalisis posisi awal...")
+            self._warmup_poll_id = self.root.after(WARMUP_POLL_MS, self._poll_warmup)
+
     def start(self):
+        if self._warmup_poll_id is not None:
+            self.root.after_cancel(self._warmup_poll_id)
+            self._warmup_poll_id = None
         settings = {
             "mode": self.mode_var.get(),
             "difficulty": self.diff_var.get(),
             "player1_algo": self.p1_algo.get(),
-            "player2_algo": self.p2_algo.get()
+            "player2_algo": self.p2_algo.get(),
+            "time_control": self.time_var.get(),
+            "log_moves": self.log_moves_var.get(),
+            # Diserahkan ke GameController oleh GameWindow (lalu dihapus dari settings)
+            "warmup": self.warmup
         }
         self.root.destroy()
         self.on_start_callback(settings)
@@ -91,13 +168,44 @@ class GameWindow:
         self.auto_play = True  # Auto-play aktif by default
         self._auto_after_id = None
 
-
-        diff = DIFFICULTY_LEVELS[settings["difficulty"]]
+        # Buffer log: ditulis ke widget sekali per GUI_CONFIG["log_flush_ms"]
+        self.log_moves = settings.get("log_moves", GUI_CONFIG["log_moves"])
+        self._log_buffer = []
+        self._log_flush_id = None
+
+        # Turbo: controller dimainkan di thread latar; thread GUI hanya
+        # membaca state & mengambil langkah baru dari _turbo_pending per frame
+        self.speed_var = None
+        self._turbo_lock = threading.Lock()
+        self._turbo_stop = threading.Event()
+        self._turbo_running = False
+        self._turbo_pending = []
+        self._turbo_frame_id = None
+
+        # Hint (Player vs Komputer): AlphaBetaAgent.analyse() di thread latar;
+        # hasil (piles, lines, stats) diambil thread GUI lewat _poll_hint()
+        self.hint_var = None
+        self._hint_lock = threading.Lock()
+        self._hint = None
+        self._hint_pending = None
+        self._hint_requested = None
+        self._hint_poll_id = None
+        self._hint_label = None
+
+        diff = get_level(settings["difficulty"])
         self.controller = GameController(
             diff["piles"],
             settings["player1_algo"],
-            settings["player2_algo"]
+            settings["player2_algo"],
+            time_control=TIME_CONTROLS.get(settings.get("time_control")),
+            rules=diff.get("rules"),
+            # Profil engine per level jika NIM_PROFILE di-set (lihat game.profiling)
+            profiler=profiler_from_env(settings["difficulty"])
         )
+        # Langkah pertama dari warm-up SetupWindow (jika sudah selesai & setting sama)
+        warmup = settings.pop("warmup", None)
+        if warmup is not None:
+            warmup.hand_off(self.controller)
 
         self.root = tk.Tk()
         self.root.title("NIM Misère - Game")
@@ -130,6 +238,16 @@ class GameWindow:
         self.canvas = tk.Canvas(canvas_frame, bg="#0b4f0b", highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
 
+        # Chart live durasi & nodes per langkah
+        charts_frame = ttk.Frame(main_frame)
+        charts_frame.pack(fill="x", pady=(5, 0))
+        self.charts = [
+            MoveChart(charts_frame, "duration_ms", "Durasi per langkah", unit="ms"),
+            MoveChart(charts_frame, "nodes_explored", "Nodes per langkah")
+        ]
+        for chart in self.charts:
+            chart.pack(side="left", fill="x", expand=True, padx=2)
+
         # Info text
         self.info = tk.Text(main_frame, height=6, state="disabled", wrap="word")
         self.info.pack(fill="x", pady=5)
@@ -142,11 +260,23 @@ class GameWindow:
         if self.settings["mode"] == "PLAYER_VS_Komputer":
             # Info label untuk player
             ttk.Label(btn_frame, text="🎮 Tunggu giliran Anda - Dialog akan muncul otomatis", foreground="blue", font=("Arial", 10, "bold")).pack(side="left", padx=10)
+            # Analisis hanya untuk NIM standar (Alpha-Beta tidak mengenal varian)
+            if self.controller.rules is None and not self.controller.huge:
+                self.hint_var = tk.BooleanVar(value=False)
+                ttk.Checkbutton(btn_frame, text="💡 Hint", variable=self.hint_var,
+                                command=self._on_hint_toggle).pack(side="left", padx=5)
         else:
             ttk.Button(btn_frame, text="Next Move", command=self.next_move).pack(side="left", padx=5)
             self.auto_btn = ttk.Button(btn_frame, text="⏸ Pause Auto Play", command=self.toggle_auto)
             self.auto_btn.pack(side="left", padx=5)
 
+            ttk.Label(btn_frame, text="Speed").pack(side="left", padx=(15, 5))
+            self.speed_var = tk.StringVar(value=self.settings.get("speed", "Normal"))
+            speed_box = ttk.Combobox(btn_frame, textvariable=self.speed_var, width=10,
+                                     values=list(AUTO_PLAY_SPEEDS.keys()), state="readonly")
+            speed_box.pack(side="left")
+            speed_box.bind("<<ComboboxSelected>>", self._on_speed_change)
+
     def _on_resize(self, event):
         """Handle window resize untuk redraw"""
         if hasattr(self, 'controller'):
@@ -174,6 +304,7 @@ class GameWindow:
             
         if self.settings["mode"] == "PLAYER_VS_Komputer" and self.controller.current_player == 1:
             # Giliran player - tampilkan dialog otomatis
+            self._request_hint()
             self.root.after(200, self._player_move_dialog)
     
     def toggle_auto(self):
@@ -187,6 +318,23 @@ class GameWindow:
         else:
             self.auto_btn.config(text="▶ Resume Auto Play")
             self._cancel_auto_job()
+            self._stop_turbo()
+
+    def _auto_delay_ms(self):
+        """Delay auto-play untuk speed terpilih (None = turbo)."""
+        if self.speed_var is None:
+            return AUTO_PLAY_SPEEDS["Normal"]
+        return AUTO_PLAY_SPEEDS[self.speed_var.get()]
+
+    def _on_speed_change(self, event=None):
+        if not self.auto_play or self.controller.game_over:
+            return
+        if self._auto_delay_ms() is None:
+            self._cancel_auto_job()
+            self._start_turbo()
+        else:
+            self._stop_turbo()
+            self._schedule_auto_step(self._auto_delay_ms())
 
     def _auto_step(self):
         # Karena callback ini sedang jalan, id timer-nya dianggap selesai
@@ -195,6 +343,10 @@ class GameWindow:
         if not self.auto_play or self.controller.game_over:
             return
 
+        if self._auto_delay_ms() is None:
+            self._start_turbo()
+            return
+
         # PLAYER_VS_Komputer: auto hanya untuk AI (player 2)
         if self.settings["mode"] == "PLAYER_VS_Komputer":
             if self.controller.current_player == 1:
@@ -210,11 +362,13 @@ class GameWindow:
             return
 
         # Jadwalkan lagi (AMAN: tidak dobel)
-        self._schedule_auto_step(600)
+        self._schedule_auto_step(self._auto_delay_ms() or 0)
 
     def next_move(self):
         if self.controller.game_over:
             return  # Jangan proses lagi jika sudah game over
+        if self._turbo_running:
+            return  # Controller sedang dimainkan thread turbo
 
         # PLAYER VS Komputer - Giliran Player: dialog dipanggil otomatis oleh _check_player_turn
         if self.settings["mode"] == "PLAYER_VS_Komputer" and self.controller.current_player == 1:
@@ -227,6 +381,7 @@ class GameWindow:
 
         self._draw_state()
         self._log_move(move_info)
+        self._update_charts([move_info])
 
         # Jika game over, _auto_step yang akan handle show result
         if move_info.get("game_over", False):
@@ -301,6 +456,18 @@ class GameWindow:
                 font=("Arial", 10), 
                 fg="#7f8c8d", bg="white").pack(pady=(0, 15))
 
+        rules = self.controller.rules
+        if rules is not None:
+            tk.Label(frame, text=f"Aturan: {rules.description}",
+                    font=("Arial", 9, "bold"),
+                    fg="#c0392b", bg="white").pack(pady=(0, 10))
+
+        if self.hint_var is not None:
+            self._hint_label = tk.Label(frame, text=self._hint_text() or "",
+                                        font=("Arial", 9, "bold"), fg="#27ae60", bg="white",
+                                        wraplength=340, justify="left")
+            self._hint_label.pack(pady=(0, 10))
+
         pile_var = tk.IntVar(value=0)
         sticks_var = tk.IntVar(value=1)
 
@@ -334,7 +501,15 @@ class GameWindow:
                                   relief="groove", bd=2, padx=15, pady=10)
         info_frame.pack(fill="x", pady=(0, 15))
         
-        info_text = "\n".join([f"Pile {i}  →  {s} korek api" for i, s in enumerate(state) if s > 0])
+        shown = []
+        for i, s in enumerate(state):
+            if s > 0:
+                shown.append(f"Pile {i}  →  {s} korek api")
+                if len(shown) == DIALOG_MAX_PILES:
+                    break
+        if state.active > len(shown):
+            shown.append(f"... dan {state.active - len(shown)} pile lainnya")
+        info_text = "\n".join(shown)
         tk.Label(info_frame, text=info_text, 
                 font=("Courier", 9), 
                 fg="#27ae60", bg="white",
@@ -356,8 +531,14 @@ class GameWindow:
                     f"Anda hanya bisa ambil 1-{state[i]} korek api.")
                 return
 
+            if rules is not None and not rules.is_legal(state[i], k):
+                messagebox.showerror("Error",
+                    f"Move tidak valid!\n\n"
+                    f"Aturan: {rules.description}.")
+                return
+
             # Apply move
-            self.controller.state = apply_move(self.controller.state, (i, k))
+            self.controller.state = apply_move(self.controller.state, (i, k), rules)
             self.player_dialog = None
             dialog.destroy()
             self._draw_state()
@@ -369,15 +550,16 @@ class GameWindow:
                 "player": 1,
                 "algorithm": "Human",
                 "move": (i, k),
-                "state_after": self.controller.state.copy(),
+                "state_after": None if self.controller.huge else self.controller.state.to_list(),
                 "stats": {"duration_ms": 0, "nodes_explored": 0}
             }
             self.controller.move_history.append(player_move_info)
+            self._update_charts([player_move_info])
             
             self._log(f"👤 YOU → Pile {i}, ambil {k} korek api")
             
             # Cek apakah player yang mengambil batang terakhir (player kalah)
-            if sum(self.controller.state) == 0:
+            if is_terminal(self.controller.state):
                 # Player mengambil batang terakhir = Player KALAH
                 self.controller.game_over = True
                 self.controller.winner = 2  # AI menang
@@ -440,6 +622,125 @@ class GameWindow:
         pile_spin.focus()
         pile_spin.selection_range(0, tk.END)
 
+    # ---------------- HINT ----------------
+    def _on_hint_toggle(self):
+        self._request_hint()
+        self._draw_state()
+        self._update_hint_label()
+
+    def _request_hint(self):
+        """Mulai analisis posisi saat ini di thread latar (sekali per posisi)."""
+        if self.hint_var is None or not self.hint_var.get():
+            return
+        if self.controller.game_over or self.controller.current_player != 1:
+            return
+        piles = tuple(self.controller.state)
+        if piles == self._hint_requested:
+            return
+        self._hint_requested = piles
+        threading.Thread(target=self._hint_worker, args=(piles,), daemon=True).start()
+        if self._hint_poll_id is None:
+            self._hint_poll_id = self.root.after(HINT_POLL_MS, self._poll_hint)
+
+    def _hint_worker(self, piles):
+        lines, stats = alphabeta_analyse(list(piles), GUI_CONFIG["hint_time_ms"])
+        with self._hint_lock:
+            self._hint_pending = (piles, lines, stats)
+
+    def _poll_hint(self):
+        self._hint_poll_id = None
+        with self._hint_lock:
+            pending, self._hint_pending = self._hint_pending, None
+        if pending is not None:
+            self._hint = pending
+            self._draw_state()
+            self._update_hint_label()
+        if self._hint is None or self._hint[0] != self._hint_requested:
+            self._hint_poll_id = self.root.after(HINT_POLL_MS, self._poll_hint)
+
+    def _current_hint(self):
+        """(lines, stats) untuk posisi saat ini, atau None jika belum ada / tidak aktif."""
+        if self.hint_var is None or not self.hint_var.get() or self._hint is None:
+            return None
+        if self.controller.current_player != 1 or self._hint[0] != tuple(self.controller.state):
+            return None
+        return self._hint[1], self._hint[2]
+
+    def _hint_text(self):
+        if self.hint_var is None or not self.hint_var.get():
+            return None
+        hint = self._current_hint()
+        if hint is None:
+            return "💡 Menganalisis..."
+        lines, stats = hint
+        winning = [line for line in lines if line["result"] == "win"]
+        if winning:
+            i, k = winning[0]["move"]
+            return f"💡 Langkah menang: ambil {k} dari Pile {i} ({stats['winning_moves']} langkah menang)"
+        if stats["timed_out"]:
+            return "💡 Belum ada langkah menang yang terbukti (waktu analisis habis)"
+        return "💡 Posisi kalah: semua langkah kalah melawan lawan sempurna"
+
+    def _update_hint_label(self):
+        if self._hint_label is not None and self._hint_label.winfo_exists():
+            self._hint_label.config(text=self._hint_text() or "")
+
+    # ---------------- TURBO ----------------
+    def _start_turbo(self):
+        """Mulai (atau lanjutkan) thread turbo dan loop frame canvas."""
+        with self._turbo_lock:
+            self._turbo_stop.clear()
+            start_thread = not self._turbo_running
+            self._turbo_running = True
+        if start_thread:
+            threading.Thread(target=self._turbo_worker, daemon=True).start()
+        if self._turbo_frame_id is None:
+            self._turbo_frame_id = self.root.after(0, self._turbo_frame)
+
+    def _stop_turbo(self):
+        """Minta thread turbo berhenti setelah langkah yang sedang berjalan."""
+        self._turbo_stop.set()
+
+    def _turbo_worker(self):
+        """Mainkan langkah secepat engine mampu (tanpa menyentuh Tk)."""
+        try:
+            while True:
+                # Cek berhenti di bawah lock agar _start_turbo() tidak pernah
+                # melihat thread "masih jalan" yang sebenarnya sudah keluar
+                with self._turbo_lock:
+                    if self._turbo_stop.is_set() or self.controller.game_over:
+                        self._turbo_running = False
+                        return
+                move_info = self.controller.play_one_move()
+                with self._turbo_lock:
+                    self._turbo_pending.append(move_info)
+        except BaseException:
+            with self._turbo_lock:
+                self._turbo_running = False
+            raise
+
+    def _turbo_frame(self):
+        """Satu frame turbo: log langkah baru lalu gambar state terakhir saja."""
+        self._turbo_frame_id = None
+        with self._turbo_lock:
+            pending, self._turbo_pending = self._turbo_pending, []
+            running = self._turbo_running
+
+        if pending:
+            pending = [m for m in pending if m is not None]
+            # Langkah di luar batas log toh akan langsung dibuang
+            for move_info in pending[-GUI_CONFIG["log_max_lines"]:]:
+                self._log_move(move_info)
+            self._update_charts(pending)
+            self._draw_state()
+
+        if running:
+            self._turbo_frame_id = self.root.after(
+                max(1, 1000 // GUI_CONFIG["turbo_fps"]), self._turbo_frame)
+        elif self.controller.game_over:
+            summary = self.controller.get_match_summary()
+            self.root.after(1000, lambda: self._show_result(summary))
+
     # ---------------- DRAW ----------------
     def _draw_state(self):
         self.canvas.delete("all")
@@ -457,10 +758,14 @@ class GameWindow:
         state = self.controller.state
         if not state:
             return
+        if self.controller.huge:
+            self._draw_summary(canvas_width, canvas_height)
+            return
             
         total_piles = len(state)
         max_sticks = max(state) if state else 1
-        total_sticks = sum(state)
+        info = get_game_info(state)
+        total_sticks = info["total_sticks"]
 
         base_scale = min(canvas_width / 900, canvas_height / 500)
         
@@ -485,6 +790,15 @@ class GameWindow:
 
         pile_data_fixed = list(enumerate(state))  # JANGAN buang pile 0, biar baris tidak geser
 
+        # Hint: pile -> jumlah stik yang diambil oleh langkah menang
+        hint_takes = {}
+        hint = self._current_hint()
+        if hint is not None:
+            for line in hint[0]:
+                if line["result"] == "win":
+                    for i, k in line["moves"]:
+                        hint_takes.setdefault(i, k)
+
         for display_level, (original_pile_idx, pile_count) in enumerate(pile_data_fixed):
             # y pakai total_piles (konstan), bukan panjang list aktif
             y = base_y - (total_piles - 1 - display_level) * row_gap
@@ -502,6 +816,7 @@ class GameWindow:
                 continue
 
             start_x = center_x - (pile_count * pile_gap) // 2
+            hint_take = hint_takes.get(original_pile_idx, 0)
 
             for j in range(pile_count):
                 x = start_x + j * pile_gap
@@ -510,7 +825,7 @@ class GameWindow:
                     y - match_height,
                     x + match_width // 2,
                     y,
-                    fill="#f5e28b",
+                    fill="#2ecc71" if j >= pile_count - hint_take else "#f5e28b",
                     outline=""
                 )
                 self.canvas.create_oval(
@@ -532,14 +847,13 @@ class GameWindow:
             )
             self.canvas.create_text(
                 start_x + pile_count * pile_gap + 35, y - match_height // 2,
-                text=f"{pile_count}",
-                fill="yellow",
+                text=f"{pile_count}  ← ambil {hint_take}" if hint_take else f"{pile_count}",
+                fill="#2ecc71" if hint_take else "yellow",
                 font=("Arial", label_font_size, "bold"),
                 anchor="w"
             )
 
 
-        info = get_game_info(state)
         font_size = max(9, int(12 * base_scale))
         self.canvas.create_text(
             20, 20,
@@ -564,13 +878,97 @@ class GameWindow:
             text=f"Turn: {player_text}"
         )
 
+        hint_text = self._hint_text() if self.controller.current_player == 1 else None
+        if hint_text:
+            self.canvas.create_text(
+                20, 20 + font_size * 2,
+                anchor="nw",
+                fill="#2ecc71",
+                font=("Arial", font_size, "bold"),
+                text=hint_text
+            )
+
+    def _draw_summary(self, canvas_width, canvas_height):
+        """
+        Huge-board mode: gambar histogram ukuran tumpukan (skala log2)
+        dari sampel tumpukan, bukan setiap stik.
+        """
+        state = self.controller.state
+        piles = state.piles
+        step = max(1, len(piles) // HUGE_DRAW_SAMPLE)
+        sample = piles[::step]
+
+        buckets = [0] * 33
+        for p in sample:
+            if p:
+                buckets[min(32, p.bit_length())] += 1
+        used = [i for i, count in enumerate(buckets) if count] or [1]
+        lo, hi = used[0], used[-1]
+        peak = max(buckets) or 1
+
+        margin = 60
+        base_y = canvas_height - 50
+        bar_area = canvas_height - 140
+        bar_width = (canvas_width - 2 * margin) / (hi - lo + 1)
+        font_size = max(8, int(9 * min(canvas_width / 900, canvas_height / 500)))
+        for n, i in enumerate(range(lo, hi + 1)):
+            x0 = margin + n * bar_width
+            height = bar_area * buckets[i] / peak
+            self.canvas.create_rectangle(x0 + 2, base_y - height, x0 + bar_width - 2, base_y,
+                                         fill="#f5e28b", outline="")
+            self.canvas.create_text(x0 + bar_width / 2, base_y + 12,
+                                    text=f"<2^{i}", fill="white",
+                                    font=("Arial", font_size))
+
+        self.canvas.create_text(
+            20, 20, anchor="nw", fill="white",
+            font=("Arial", font_size + 3, "bold"),
+            text=(f"HUGE BOARD | Piles: {len(piles):,} | Active: {state.active:,} | "
+                  f"Total sticks: {state.total:,}")
+        )
+        self.canvas.create_text(
+            20, 45, anchor="nw", fill="#aaaaaa", font=("Arial", font_size),
+            text=f"Histogram ukuran tumpukan (sampel {len(sample):,} tumpukan)"
+        )
+        player_text = "Player 1" if self.controller.current_player == 1 else "Player 2"
+        self.canvas.create_text(
+            canvas_width - 20, 20, anchor="ne", fill="yellow",
+            font=("Arial", font_size + 3, "bold"), text=f"Turn: {player_text}"
+        )
+
     # ---------------- LOG ----------------
     def _show_result(self, summary):
         """Tampilkan result window dan tutup game window"""
+        self._stop_turbo()
+        if self._turbo_frame_id is not None:
+            self.root.after_cancel(self._turbo_frame_id)
+            self._turbo_frame_id = None
+        if self._log_flush_id is not None:
+            self.root.after_cancel(self._log_flush_id)
+            self._log_flush_id = None
         self.root.destroy()
-        self.on_finish_callback(summary, self.settings)
+        self._dump_profile()
+        self.on_finish_callback(summary, self.settings, self.controller.move_history)
+
+    def _dump_profile(self):
+        """Tulis profil engine (jika profiling aktif) lalu hentikan sampler."""
+        profiler = self.controller.profiler
+        if profiler is None:
+            return
+        for path in profiler.dump():
+            print(f"[PROFILE] {path}")
+        profiler.close()
+
+    def _update_charts(self, move_infos):
+        """Tambahkan langkah baru ke chart lalu gambar ulang sekali."""
+        for chart in self.charts:
+            for move_info in move_infos:
+                chart.add_move(move_info)
+            chart.redraw()
     
     def _log_move(self, m):
+        if not self.log_moves:
+            return
         self._log(
             f"Move {m['move_number']} | "
             f"P{m['player']} ({m['algorithm']}) "
@@ -578,25 +976,47 @@ class GameWindow:
         )
 
     def _log(self, text):
+        """Tampung satu baris log; ditulis ke widget oleh _flush_log()."""
+        self._log_buffer.append(text + "\n")
+        if self._log_flush_id is None:
+            self._log_flush_id = self.root.after(GUI_CONFIG["log_flush_ms"], self._flush_log)
+
+    def _flush_log(self):
+        """Tulis seluruh buffer dengan satu insert lalu buang baris lama."""
+        self._log_flush_id = None
+        if not self._log_buffer:
+            return
+        max_lines = GUI_CONFIG["log_max_lines"]
+        # Buffer yang lebih panjang dari batas tidak perlu ditulis seluruhnya
+        text = "".join(self._log_buffer[-max_lines:])
+        self._log_buffer.clear()
+
         self.info.config(state="normal")
-        self.info.insert("end", text + "\n")
+        self.info.insert("end", text)
+        # Widget Text selalu diakhiri satu newline kosong ("end-1c")
+        lines = int(self.info.index("end-1c").split(".")[0]) - 1
+        if lines > max_lines:
+            self.info.delete("1.0", f"{lines - max_lines + 1}.0")
         self.info.see("end")
         self.info.config(state="disabled")
 
     def run(self):
         self.root.mainloop()
+        # Window ditutup sebelum match selesai: profil tetap ditulis
+        self._dump_profile()
 
 
 # ======================================================
 # RESULT WINDOW
 # ======================================================
 class ResultWindow:
-    def __init__(self, summary, settings):
+    def __init__(self, summary, settings, move_history=None):
         self.summary = summary
         self.settings = settings
+        self.move_history = move_history or []
         self.root = tk.Tk()
         self.root.title("🏆 Match Result")
-        self.root.geometry("500x400")
+        self.root.geometry("560x720" if self.move_history else "500x400")
         self.root.resizable(True, True)
         self.root.configure(bg="#2c3e50")
         self._build_ui()
@@ -655,6 +1075,11 @@ class ResultWindow:
             ("Difficulty:", self.settings['difficulty']),
             ("Game Mode:", self.settings['mode'])
         ]
+        if self.summary.get("time_control"):
+            stats.append(("Time Control:", self.settings.get("time_control")))
+            for i in (1, 2):
+                p = self.summary[f"player{i}"]
+                stats.append((f"P{i} Flag/Overrun:", f"{p['flag_falls']} / {p['overruns']}"))
         
         for label, value in stats:
             row = tk.Frame(stats_frame, bg="#34495e")
@@ -692,6 +1117,14 @@ class ResultWindow:
             )
             player_label.pack()
 
+        # Chart lengkap durasi & nodes per langkah
+        if self.move_history:
+            for metric, title, unit in (("duration_ms", "Durasi per langkah", "ms"),
+                                        ("nodes_explored", "Nodes per langkah", "")):
+                chart = MoveChart(main_frame, metric, title, height=130, unit=unit)
+                chart.pack(fill="x", pady=(0, 8))
+                chart.set_moves(self.move_history)
+
         tk.Button(
             main_frame,
             text="Close",
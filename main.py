@@ -17,9 +17,9 @@ def main():
         game = GameWindow(settings, on_match_finish)
         game.run()
     
-    def on_match_finish(summary, settings):
+    def on_match_finish(summary, settings, move_history=None):
         """Callback ketika match AI vs AI selesai."""
-        result = ResultWindow(summary, settings)
+        result = ResultWindow(summary, settings, move_history)
         result.run()
     
     # Mulai dari setup window
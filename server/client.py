@@ -0,0 +1,107 @@
+"""
+Klien asyncio sederhana untuk match server (untuk script & load test lokal).
+
+Contoh:
+    python -m server.client --port 8765 --games 200 --difficulty Medium
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from server.match_server import DEFAULT_HOST, DEFAULT_PORT
+
+
+class MatchClient:
+    """Satu koneksi ke match server; request dikirim berurutan."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self._next_id = 1
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT, unix=None):
+        if unix:
+            reader, writer = await asyncio.open_unix_connection(unix)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, op, **fields):
+        request_id = self._next_id
+        self._next_id += 1
+        payload = {"id": request_id, "op": op, **fields}
+        self.writer.write(json.dumps(payload).encode() + b"\n")
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("server menutup koneksi")
+        return json.loads(line)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play_game(client, difficulty, player1, player2, time_control=None):
+    """Mainkan satu game penuh lewat request engine_move."""
+    response = await client.request(
+        "new_game", difficulty=difficulty, player1=player1, player2=player2,
+        time_control=time_control
+    )
+    if not response["ok"]:
+        raise RuntimeError(response["error"])
+    game_id = response["game_id"]
+
+    while not response["game_over"]:
+        response = await client.request("engine_move", game_id=game_id)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+
+    summary = (await client.request("summary", game_id=game_id))["summary"]
+    await client.request("close", game_id=game_id)
+    return summary
+
+
+async def run_games(args):
+    """Jalankan banyak game paralel, satu koneksi per game."""
+    async def one_game(_):
+        client = await MatchClient.connect(args.host, args.port, args.unix)
+        try:
+            return await play_game(client, args.difficulty, args.player1,
+                                   args.player2, args.time_control)
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    summaries = await asyncio.gather(*(one_game(i) for i in range(args.games)))
+    elapsed = time.perf_counter() - start
+
+    wins = {1: 0, 2: 0}
+    for s in summaries:
+        wins[s["winner"]] += 1
+    print(f"{args.games} games in {elapsed:.2f}s ({args.games / elapsed:.1f} games/s)")
+    print(f"P1 ({args.player1}) wins: {wins[1]}  |  P2 ({args.player2}) wins: {wins[2]}")
+
+    client = await MatchClient.connect(args.host, args.port, args.unix)
+    print(await client.request("server_stats"))
+    await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scripted client untuk match server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix")
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--difficulty", default="Easy")
+    parser.add_argument("--player1", default="Reflex")
+    parser.add_argument("--player2", default="Alpha-Beta")
+    parser.add_argument("--time-control", default=None)
+    asyncio.run(run_games(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
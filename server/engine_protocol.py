@@ -0,0 +1,288 @@
+"""
+Protokol engine berbasis baris (mirip UCI) lewat stdin/stdout.
+
+Satu proses berumur panjang menyimpan AlphaBetaAgent dengan memo yang
+tetap hangat antar perintah, sehingga orchestrator tidak membayar
+start-up interpreter dan cache dingin di setiap langkah.
+
+Perintah (input):
+    uci                                 -> id ..., option ..., uciok
+    isready                             -> readyok
+    setoption name Algorithm value <Reflex|Alpha-Beta>
+    setoption name Search value <alphabeta|pvs>
+    ucinewgame                          -> kosongkan transposition table
+    position piles 1 3 5 7 [moves 0:1 2:3]
+    go [depth N] [movetime MS] [nodes N] [infinite]
+    stop                                -> hentikan pencarian, kirim bestmove
+    quit
+
+Output:
+    info depth D nodes N nps X time MS hashentries E [score wdl win|loss]
+    bestmove <pile>:<take>              (atau "bestmove none" jika terminal)
+
+Transposition table persisten (opsional): dengan --tt-file PATH (atau
+environment variable NIM_TT_FILE) memo dimuat saat start, disimpan ulang
+setelah pencarian paling cepat tiap TT_SAVE_INTERVAL_SEC, dan saat quit.
+File yang rusak / dari versi engine lain diabaikan (mulai dingin).
+
+Menjalankan:
+    python -m server.engine_protocol [--tt-file engine.nimtt]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from algorithms.alpha_beta import AlphaBetaAgent, DEFAULT_SEARCH, SEARCH_MODES
+from algorithms.reflex import reflex_move
+from algorithms.tt_store import default_path, load_table, save_table
+from game.nim_logic import apply_move, is_terminal
+
+ENGINE_NAME = "NIM Misere Engine"
+ENGINE_AUTHOR = "game_nim"
+ALGORITHM_NAMES = ("Alpha-Beta", "Reflex")
+# Interval baris "info" selama pencarian berjalan
+INFO_INTERVAL_SEC = 0.5
+# Jarak minimum antar penyimpanan transposition table ke disk
+TT_SAVE_INTERVAL_SEC = 300.0
+
+
+class EngineProtocol:
+    """
+    Interpreter perintah protokol. Pencarian berjalan di thread terpisah
+    agar "stop" dan "isready" tetap dilayani saat engine sedang berpikir.
+    """
+
+    def __init__(self, out=None, tt_file=None):
+        self.out = out or sys.stdout
+        self._out_lock = threading.Lock()
+        self.agent = AlphaBetaAgent(keep_memo=True, search=DEFAULT_SEARCH)
+        self.algorithm = "Alpha-Beta"
+        self.state = []
+        self._search_thread = None
+        self.tt_file = tt_file
+        self._tt_saved_at = time.monotonic()
+        if tt_file and os.path.exists(tt_file):
+            self.load_table()
+
+    # ---------------- OUTPUT ----------------
+    def send(self, line):
+        with self._out_lock:
+            self.out.write(line + "\n")
+            self.out.flush()
+
+    # ---------------- DISPATCH ----------------
+    def handle(self, line):
+        """
+        Proses satu baris perintah.
+
+        Returns:
+            bool: False jika proses harus berhenti (quit)
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+
+        if command == "quit":
+            self.stop_search()
+            return False
+        if command == "stop":
+            self.stop_search()
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            self.send("option name Algorithm type combo default Alpha-Beta "
+                      + " ".join(f"var {name}" for name in ALGORITHM_NAMES))
+            self.send(f"option name Search type combo default {DEFAULT_SEARCH} "
+                      + " ".join(f"var {name}" for name in SEARCH_MODES))
+            self.send("uciok")
+        elif command == "ucinewgame":
+            self.wait_search()
+            self.agent.reset_counters(clear_memo=True)
+        elif command == "setoption":
+            self.wait_search()
+            self._setoption(args)
+        elif command == "position":
+            self.wait_search()
+            self._position(args)
+        elif command == "go":
+            self.wait_search()
+            self._go(args)
+        else:
+            self.send(f"info string unknown command: {command}")
+        return True
+
+    def _setoption(self, args):
+        # setoption name <nama> value <nilai>
+        if "name" not in args or "value" not in args:
+            self.send("info string usage: setoption name <name> value <value>")
+            return
+        name = " ".join(args[args.index("name") + 1:args.index("value")])
+        value = " ".join(args[args.index("value") + 1:])
+        if name == "Algorithm" and value in ALGORITHM_NAMES:
+            self.algorithm = value
+        elif name == "Search" and value in SEARCH_MODES:
+            self.agent.search = value
+        else:
+            self.send(f"info string unsupported option: {name}={value}")
+
+    def _position(self, args):
+        if not args or args[0] != "piles":
+            self.send("info string usage: position piles <n1> <n2> ... [moves p:k ...]")
+            return
+        try:
+            if "moves" in args:
+                split = args.index("moves")
+                piles, moves = args[1:split], args[split + 1:]
+            else:
+                piles, moves = args[1:], []
+            state = [int(p) for p in piles]
+            if any(p < 0 for p in state):
+                raise ValueError("piles must be >= 0")
+            for token in moves:
+                pile, take = token.split(":")
+                state = apply_move(state, (int(pile), int(take)))
+        except ValueError as e:
+            self.send(f"info string invalid position: {e}")
+            return
+        self.state = state
+
+    def _go(self, args):
+        limits = {"depth": None, "movetime": None, "nodes": None}
+        i = 0
+        try:
+            while i < len(args):
+                if args[i] in limits and i + 1 < len(args):
+                    value = int(args[i + 1])
+                    if value < 0:
+                        raise ValueError(f"{args[i]} must be >= 0")
+                    limits[args[i]] = value
+                    i += 2
+                else:
+                    # "infinite" dan token lain: tanpa batas tambahan
+                    i += 1
+        except ValueError as e:
+            self.send(f"info string invalid go: {e}")
+            return
+
+        if any(p < 0 for p in self.state) or not self.state or is_terminal(self.state):
+            self.send("bestmove none")
+            return
+
+        self.agent.stop_requested = False
+        self._search_thread = threading.Thread(
+            target=self._search, args=(list(self.state), limits), daemon=True
+        )
+        self._search_thread.start()
+
+    # ---------------- SEARCH ----------------
+    def _search(self, state, limits):
+        if self.algorithm == "Reflex":
+            move, stats = reflex_move(state)
+            self._send_info(stats, stats["duration_ms"])
+            self.send(f"bestmove {move[0]}:{move[1]}")
+            return
+
+        agent = self.agent
+        default_depth = agent.max_depth
+        if limits["depth"] is not None:
+            agent.max_depth = limits["depth"]
+        agent.node_limit = limits["nodes"]
+
+        done = threading.Event()
+        start = time.perf_counter()
+
+        def report_progress():
+            while not done.wait(INFO_INTERVAL_SEC):
+                self._send_info({"nodes_explored": agent.nodes_explored,
+                                 "depth_limit": agent.depth_limit},
+                                (time.perf_counter() - start) * 1000.0)
+
+        reporter = threading.Thread(target=report_progress, daemon=True)
+        reporter.start()
+        try:
+            move, stats = agent.get_best_move(state, time_limit_ms=limits["movetime"])
+        finally:
+            done.set()
+            reporter.join()
+            agent.max_depth = default_depth
+            agent.node_limit = None
+
+        self._send_info(stats, stats["duration_ms"])
+        self.send(f"bestmove {move[0]}:{move[1]}")
+        self._maybe_save_table()
+
+    def _send_info(self, stats, elapsed_ms):
+        nodes = stats.get("nodes_explored", 0)
+        nps = int(nodes * 1000.0 / elapsed_ms) if elapsed_ms > 0 else 0
+        parts = [
+            f"depth {stats.get('depth_limit', 0)}",
+            f"nodes {nodes}",
+            f"nps {nps}",
+            f"time {int(elapsed_ms)}",
+            f"hashentries {len(self.agent.memo)}"
+        ]
+        if "best_value" in stats and not stats.get("timed_out"):
+            parts.append(f"score wdl {'win' if stats['best_value'] > 0 else 'loss'}")
+        self.send("info " + " ".join(parts))
+
+    # ---------------- PERSISTENCE ----------------
+    def load_table(self):
+        try:
+            self.agent.memo = load_table(self.tt_file)
+        except (OSError, ValueError) as e:
+            self.send(f"info string tt not loaded: {e}")
+            return
+        self.send(f"info string tt loaded {len(self.agent.memo)} entries from {self.tt_file}")
+
+    def save_table(self):
+        if not self.tt_file:
+            return
+        try:
+            count = save_table(self.agent.memo, self.tt_file)
+        except OSError as e:
+            self.send(f"info string tt not saved: {e}")
+            return
+        self._tt_saved_at = time.monotonic()
+        self.send(f"info string tt saved {count} entries to {self.tt_file}")
+
+    def _maybe_save_table(self):
+        if self.tt_file and time.monotonic() - self._tt_saved_at >= TT_SAVE_INTERVAL_SEC:
+            self.save_table()
+
+    def stop_search(self):
+        """Minta pencarian berhenti dan tunggu bestmove terkirim."""
+        if self._search_thread is not None and self._search_thread.is_alive():
+            self.agent.stop_requested = True
+        self.wait_search()
+
+    def wait_search(self):
+        if self._search_thread is not None:
+            self._search_thread.join()
+            self._search_thread = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Engine NIM Misère (protokol mirip UCI)")
+    parser.add_argument("--tt-file", default=default_path(),
+                        help="File transposition table persisten (default: $NIM_TT_FILE)")
+    args = parser.parse_args()
+
+    protocol = EngineProtocol(tt_file=args.tt_file)
+    try:
+        for line in sys.stdin:
+            if not protocol.handle(line):
+                break
+        protocol.stop_search()
+    finally:
+        # Memo tetap disimpan walau loop berhenti karena error
+        protocol.save_table()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+"""
+Server pertandingan asyncio untuk banyak game NIM sekaligus.
+
+Protokol: satu objek JSON per baris (request dan response) lewat
+TCP localhost atau Unix socket. Perhitungan engine dilempar ke
+ProcessPoolExecutor yang dibatasi (jumlah worker + antrian), dengan
+timeout per request dan backpressure. Sesi yang lama tidak menerima
+request dibuang oleh sweep periodik (--idle-timeout-s).
+
+Request (field "id" opsional, dikembalikan apa adanya di response):
+    {"op": "new_game", "difficulty": "Easy", "player1": "Reflex",
+     "player2": "Alpha-Beta", "time_control": "Blitz 5s + 100ms"}
+    {"op": "new_game", "piles": [3, 4, 5], "rules": "subtract_1_3", ...}
+    {"op": "move", "game_id": 1, "pile": 0, "take": 2}
+    {"op": "engine_move", "game_id": 1}
+    {"op": "state", "game_id": 1}
+    {"op": "summary", "game_id": 1}
+    {"op": "close", "game_id": 1}
+    {"op": "server_stats"}
+
+Menjalankan:
+    python -m server.match_server --port 8765 --workers 4
+    python -m server.match_server --unix /tmp/nim.sock
+    python -m server.match_server --match-log tournament.nimlog
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from config.settings import TIME_CONTROLS
+from game.game_controller import GameController
+from game.huge_board import get_level
+from game.match_log import MatchLogWriter
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_REQUEST_TIMEOUT_MS = 5000
+# Maksimal job engine yang boleh antre per worker sebelum request menunggu
+QUEUE_PER_WORKER = 4
+# Sesi tanpa request selama ini (detik) dibuang oleh sweep periodik
+DEFAULT_IDLE_TIMEOUT_S = 1800
+
+
+def _timed_call(algo_func, state, kwargs):
+    """
+    Entry point worker: panggil engine dan ukur waktunya di dalam worker.
+
+    Returns:
+        tuple: (move, stats, elapsed_ms) - waktu antre tidak ikut terhitung
+    """
+    start = time.perf_counter()
+    move, stats = algo_func(state, **kwargs)
+    return move, stats, (time.perf_counter() - start) * 1000.0
+
+
+class GameSession:
+    """Satu game yang di-host server, dengan lock agar move tidak balapan."""
+
+    def __init__(self, game_id, controller):
+        self.game_id = game_id
+        self.controller = controller
+        self.lock = asyncio.Lock()
+        self.last_active = time.time()
+
+
+class MatchServer:
+    """
+    Host banyak sesi GameController dan worker pool engine.
+    """
+
+    def __init__(self, workers=None, request_timeout_ms=DEFAULT_REQUEST_TIMEOUT_MS,
+                 max_pending=None, match_log=None, idle_timeout_s=DEFAULT_IDLE_TIMEOUT_S):
+        """
+        Args:
+            workers: Jumlah proses engine (default: jumlah CPU)
+            request_timeout_ms: Batas waktu satu request engine (termasuk antre)
+            max_pending: Maksimal job engine in-flight (default workers * QUEUE_PER_WORKER)
+            match_log: Path log biner; semua game server ditulis ke file ini
+            idle_timeout_s: Sesi yang tidak disentuh selama ini dibuang
+                (None = sesi hanya ditutup lewat op "close")
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.request_timeout_ms = request_timeout_ms
+        self.max_pending = max_pending or self.workers * QUEUE_PER_WORKER
+        self.idle_timeout_s = idle_timeout_s
+        self.pool = None
+        self._slots = None
+        self._sweeper = None
+        self.sessions = {}
+        self._next_game_id = 1
+        self.match_log = MatchLogWriter(match_log) if match_log else None
+
+        # Statistik server
+        self.stats = {
+            "games_created": 0,
+            "engine_requests": 0,
+            "engine_timeouts": 0,
+            "busy_rejections": 0,
+            "sessions_expired": 0
+        }
+
+    # ---------------- LIFECYCLE ----------------
+    def start_pool(self):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+    def start_sweeper(self):
+        """Jalankan sweep sesi idle di latar (dipanggil dari dalam event loop)."""
+        if self._sweeper is None and self.idle_timeout_s:
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+
+    def shutdown(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+        if self.match_log is not None:
+            self.match_log.close()
+
+    async def serve_tcp(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.start_pool()
+        self.start_sweeper()
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    async def serve_unix(self, path):
+        self.start_pool()
+        self.start_sweeper()
+        return await asyncio.start_unix_server(self.handle_client, path)
+
+    def sweep_idle_sessions(self, now=None):
+        """
+        Buang sesi yang tidak disentuh lebih dari idle_timeout_s.
+
+        Sesi yang sedang menghitung langkah (lock dipegang) tidak dibuang.
+
+        Returns:
+            int: Jumlah sesi yang dibuang
+        """
+        if not self.idle_timeout_s:
+            return 0
+        cutoff = (time.time() if now is None else now) - self.idle_timeout_s
+        expired = [game_id for game_id, session in self.sessions.items()
+                   if session.last_active < cutoff and not session.lock.locked()]
+        for game_id in expired:
+            del self.sessions[game_id]
+        self.stats["sessions_expired"] += len(expired)
+        return len(expired)
+
+    async def _sweep_loop(self):
+        # Cek beberapa kali per periode timeout agar sesi tidak hidup jauh melewatinya
+        interval = max(1.0, self.idle_timeout_s / 4)
+        while True:
+            await asyncio.sleep(interval)
+            self.sweep_idle_sessions()
+
+    # ---------------- CONNECTION ----------------
+    async def handle_client(self, reader, writer):
+        """Proses request satu koneksi secara berurutan (baris per baris)."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self.handle_line(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                # Backpressure ke arah klien: tunggu buffer tulis kosong
+                await writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_line(self, line):
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "invalid JSON"}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request harus berupa objek JSON"}
+
+        response = await self.dispatch(request)
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def dispatch(self, request):
+        handler = getattr(self, "op_" + str(request.get("op")), None)
+        if handler is None:
+            return {"ok": False, "error": f"unknown op: {request.get('op')}"}
+        try:
+            return await handler(request)
+        except (KeyError, ValueError, TypeError) as e:
+            return {"ok": False, "error": str(e)}
+
+    # ---------------- OPERATIONS ----------------
+    def _get_session(self, request):
+        game_id = request["game_id"]
+        if game_id not in self.sessions:
+            raise KeyError(f"game {game_id} tidak ditemukan")
+        session = self.sessions[game_id]
+        session.last_active = time.time()
+        return session
+
+    async def op_new_game(self, request):
+        if "piles" in request:
+            piles = [int(p) for p in request["piles"]]
+            if not piles or min(piles) < 0:
+                raise ValueError("piles harus list bilangan >= 0")
+            rules = request.get("rules")
+        else:
+            level = get_level(request.get("difficulty", "Easy"))
+            piles = level["piles"]
+            rules = request.get("rules", level.get("rules"))
+
+        time_control = request.get("time_control")
+        if isinstance(time_control, str):
+            time_control = TIME_CONTROLS[time_control]
+
+        controller = GameController(
+            piles,
+            request.get("player1", "Reflex"),
+            request.get("player2", "Reflex"),
+            time_control=time_control,
+            rules=rules,
+            match_log=self.match_log
+        )
+        for algo in (controller.player1_algo, controller.player2_algo):
+            if algo != "Human" and algo not in controller.algo_map:
+                raise ValueError(f"unknown algorithm: {algo}")
+
+        game_id = self._next_game_id
+        self._next_game_id += 1
+        self.sessions[game_id] = GameSession(game_id, controller)
+        self.stats["games_created"] += 1
+        return {"ok": True, "game_id": game_id, **self._state_payload(controller)}
+
+    async def op_move(self, request):
+        session = self._get_session(request)
+        async with session.lock:
+            move = (int(request["pile"]), int(request["take"]))
+            info = session.controller.play_move(move, algorithm=request.get("algorithm", "Client"))
+        return {"ok": True, "move": list(info["move"]), **self._state_payload(session.controller)}
+
+    async def op_engine_move(self, request):
+        session = self._get_session(request)
+        async with session.lock:
+            controller = session.controller
+            if controller.game_over:
+                raise ValueError("Game sudah selesai")
+            algo_name = request.get("algorithm") or controller.get_current_algo()
+            if algo_name not in controller.algo_map:
+                raise ValueError(f"algoritma {algo_name} tidak punya engine")
+
+            info = await self._engine_move(controller, algo_name)
+        return {
+            "ok": True,
+            "move": list(info["move"]),
+            "stats": info["stats"],
+            **self._state_payload(controller)
+        }
+
+    async def op_state(self, request):
+        session = self._get_session(request)
+        return {"ok": True, **self._state_payload(session.controller)}
+
+    async def op_summary(self, request):
+        session = self._get_session(request)
+        return {"ok": True, "summary": session.controller.get_match_summary()}
+
+    async def op_close(self, request):
+        session = self._get_session(request)
+        del self.sessions[session.game_id]
+        return {"ok": True}
+
+    async def op_server_stats(self, request):
+        return {
+            "ok": True,
+            "active_games": len(self.sessions),
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            **self.stats
+        }
+
+    # ---------------- ENGINE ----------------
+    async def _engine_move(self, controller, algo_name):
+        """
+        Hitung move di worker pool lalu commit ke controller.
+
+        Timeout (antre + hitung) dan budget clock diperlakukan sama seperti
+        overrun: controller memakai fallback Reflex. Clock dan overrun
+        dihitung dari waktu engine di worker saja; waktu antre di semaphore
+        dan executor tidak dibebankan ke pemain.
+        """
+        self.stats["engine_requests"] += 1
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.request_timeout_ms / 1000.0
+
+        budget_ms = controller.get_move_budget_ms()
+        start = time.perf_counter()
+        kwargs = controller.engine_call_kwargs(budget_ms)
+        move, stats = None, None
+
+        if kwargs is not None:
+            # Engine juga diberi batas waktu agar worker tidak tersandera
+            # oleh job yang sudah tidak ditunggu
+            limit_ms = min(budget_ms or self.request_timeout_ms, self.request_timeout_ms)
+            kwargs["time_limit_ms"] = min(kwargs.get("time_limit_ms", limit_ms), limit_ms)
+            algo_func, extra = controller.resolve_engine(algo_name)
+            kwargs.update(extra)
+            # Huge-board: kirim ArrayNimState (array ter-pickle ringkas, invariant
+            # tidak dihitung ulang di worker) alih-alih list jutaan int
+            state = controller.state if controller.huge else list(controller.state)
+            try:
+                move, stats, engine_ms = await self._submit(algo_func, state, kwargs, deadline)
+                start = time.perf_counter() - engine_ms / 1000.0
+            except asyncio.TimeoutError:
+                self.stats["engine_timeouts"] += 1
+
+        return controller.finish_engine_move(algo_name, move, stats, start, budget_ms)
+
+    async def _submit(self, algo_func, state, kwargs, deadline):
+        loop = asyncio.get_running_loop()
+        # Backpressure: tunggu slot kosong, tapi tidak melewati deadline request
+        try:
+            await asyncio.wait_for(self._slots.acquire(), max(0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            self.stats["busy_rejections"] += 1
+            raise
+        try:
+            job = self.pool.submit(_timed_call, algo_func, state, kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Slot baru dikembalikan saat job benar-benar selesai (atau dibatalkan
+        # sebelum mulai), bukan saat request timeout: job yang sudah berjalan
+        # tetap menempati worker dan harus tetap dihitung sebagai in-flight
+        job.add_done_callback(partial(self._release_slot, loop))
+        return await asyncio.wait_for(asyncio.wrap_future(job), max(0, deadline - loop.time()))
+
+    def _release_slot(self, loop, _job):
+        """Done-callback job executor (dipanggil dari thread executor)."""
+        try:
+            loop.call_soon_threadsafe(self._slots.release)
+        except RuntimeError:
+            # Event loop sudah ditutup (server shutdown)
+            pass
+
+    # ---------------- HELPERS ----------------
+    @staticmethod
+    def _state_payload(controller):
+        if controller.huge:
+            # Papan raksasa tidak dikirim ulang di setiap response
+            state = controller.state
+            return {
+                "state": None,
+                "state_summary": {
+                    "num_piles": len(state),
+                    "total_sticks": state.total,
+                    "active_piles": state.active,
+                    "nim_sum": state.nim_sum
+                },
+                "current_player": controller.current_player,
+                "game_over": controller.game_over,
+                "winner": controller.winner
+            }
+        return {
+            "state": list(controller.state),
+            "current_player": controller.current_player,
+            "game_over": controller.game_over,
+            "winner": controller.winner
+        }
+
+
+async def _run(args):
+    server = MatchServer(
+        workers=args.workers,
+        request_timeout_ms=args.timeout_ms,
+        max_pending=args.max_pending,
+        match_log=args.match_log,
+        idle_timeout_s=args.idle_timeout_s or None
+    )
+    if args.unix:
+        listener = await server.serve_unix(args.unix)
+        print(f"[SERVER] listening on unix:{args.unix}")
+    else:
+        listener = await server.serve_tcp(args.host, args.port)
+        print(f"[SERVER] listening on {args.host}:{args.port}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NIM Misère match server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="Path Unix socket (menggantikan TCP)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-pending", type=int, default=None)
+    parser.add_argument("--timeout-ms", type=int, default=DEFAULT_REQUEST_TIMEOUT_MS)
+    parser.add_argument("--match-log", help="Path log biner untuk semua game")
+    parser.add_argument("--idle-timeout-s", type=float, default=DEFAULT_IDLE_TIMEOUT_S,
+                        help="Buang sesi idle setelah sekian detik (0 = tidak pernah)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Solver brute force tanpa teori NIM, dipakai sebagai oracle di test.
+
+Misère: pemain yang mengambil stik terakhir kalah, jadi pemain yang
+mendapat giliran pada posisi kosong menang.
+"""
+
+from functools import lru_cache
+from itertools import combinations_with_replacement
+
+from game.rules import get_rule_set
+
+
+def mover_wins(piles, rules=None):
+    """True jika pemain giliran menang dengan permainan sempurna dari `piles`."""
+    rules = get_rule_set(rules)
+    return _mover_wins(tuple(sorted(p for p in piles if p > 0)),
+                       rules.name if rules is not None else "nim")
+
+
+@lru_cache(maxsize=None)
+def _mover_wins(piles, rules_name):
+    if not piles:
+        return True
+    rules = get_rule_set(rules_name)
+    for i, pile in enumerate(piles):
+        for k in rules.takes(pile):
+            child = piles[:i] + (pile - k,) + piles[i + 1:]
+            if not _mover_wins(tuple(sorted(p for p in child if p > 0)), rules_name):
+                return True
+    return False
+
+
+def small_positions(max_piles, max_pile):
+    """Semua posisi tak-kosong (multiset terurut) dengan <= max_piles tumpukan <= max_pile."""
+    for count in range(1, max_piles + 1):
+        for piles in combinations_with_replacement(range(max_pile + 1), count):
+            if any(piles):
+                yield list(piles)
@@ -0,0 +1,48 @@
+"""
+Reduksi kanonik (canonical_form / canonical_key) dicek terhadap solver
+brute force pada semua posisi kecil.
+"""
+
+from itertools import permutations
+
+from algorithms.alpha_beta import canonical_form, canonical_key
+from game.nim_logic import NimState, PileHistogram
+from tests.brute_force import mover_wins, small_positions
+
+MAX_PILES = 5
+MAX_PILE = 6
+
+POSITIONS = list(small_positions(MAX_PILES, MAX_PILE))
+
+
+def test_canonical_form_preserves_outcome():
+    for piles in POSITIONS:
+        assert mover_wins(canonical_form(piles)) == mover_wins(piles), piles
+
+
+def test_equal_canonical_keys_have_equal_outcomes():
+    outcome_by_key = {}
+    for piles in POSITIONS:
+        key = canonical_key(NimState(piles), True)
+        outcome = mover_wins(piles)
+        assert outcome_by_key.setdefault(key, outcome) == outcome, piles
+
+
+def test_canonical_key_matches_explicit_form():
+    for piles in POSITIONS:
+        for is_max_turn in (True, False):
+            key = canonical_key(NimState(piles), is_max_turn)
+            assert key == canonical_key(NimState(canonical_form(piles)), is_max_turn), piles
+
+
+def test_canonical_key_ignores_order_and_representation():
+    for piles in POSITIONS:
+        key = canonical_key(NimState(piles), True)
+        assert canonical_key(PileHistogram(piles), True) == key, piles
+        for order in set(permutations(piles)):
+            assert canonical_key(NimState(order), True) == key, order
+
+
+def test_side_to_move_changes_key():
+    for piles in POSITIONS:
+        assert canonical_key(NimState(piles), True) != canonical_key(NimState(piles), False)
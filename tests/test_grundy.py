@@ -0,0 +1,34 @@
+"""
+Engine Sprague-Grundy (termasuk aturan misère "tame" untuk varian) dicek
+terhadap solver brute force pada semua posisi kecil.
+"""
+
+import pytest
+
+from algorithms.grundy import check_misere_rule, grundy_move
+from game.nim_logic import NimState, apply_move
+from game.rules import RULE_SETS
+from tests.brute_force import mover_wins, small_positions
+
+POSITIONS = list(small_positions(4, 8))
+
+
+@pytest.mark.parametrize("rules_name", sorted(RULE_SETS))
+def test_grundy_move_is_perfect(rules_name):
+    rules = None if rules_name == "nim" else rules_name
+    for piles in POSITIONS:
+        move, _ = grundy_move(piles, rules=rules)
+        # apply_move memvalidasi legalitas terhadap rule set
+        child = apply_move(piles, move, rules)
+        if mover_wins(piles, rules):
+            assert not mover_wins(child, rules), (piles, move)
+
+
+def test_grundy_move_accepts_nim_state():
+    for piles in POSITIONS:
+        assert grundy_move(NimState(piles))[0] == grundy_move(piles)[0], piles
+
+
+@pytest.mark.parametrize("rules_name", sorted(RULE_SETS))
+def test_shipped_rule_sets_are_tame(rules_name):
+    check_misere_rule(rules_name)
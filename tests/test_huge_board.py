@@ -0,0 +1,30 @@
+"""
+ArrayNimState harus tetap memenuhi kontrak NimState (kesetaraan & invariant).
+"""
+
+from game.huge_board import ArrayNimState
+from game.nim_logic import NimState
+
+
+def test_equality_matches_nim_state():
+    state = ArrayNimState([1, 2, 3])
+    assert state == [1, 2, 3]
+    assert state == (1, 2, 3)
+    assert state == NimState([1, 2, 3])
+    assert NimState([1, 2, 3]) == state
+    assert state == ArrayNimState([1, 2, 3])
+    assert state != [1, 2]
+    assert state != [1, 2, 4]
+    assert state != None  # noqa: E711
+
+
+def test_invariants_follow_moves():
+    piles = [5, 1, 0, 7, 2]
+    state = ArrayNimState(piles)
+    reference = NimState(piles)
+    for i, k in [(0, 3), (3, 7), (1, 1), (4, 2), (0, 2)]:
+        state.play(i, k)
+        reference.play(i, k)
+        assert state == reference
+        assert (state.total, state.nim_sum, state.ones, state.bigs, state.active) == \
+            (reference.total, reference.nim_sum, reference.ones, reference.bigs, reference.active)
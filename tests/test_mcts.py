@@ -0,0 +1,37 @@
+"""
+MCTS-Solver: status terbukti (proven) di root harus sesuai solver brute
+force, dan langkah dari posisi yang terbukti menang harus menang.
+"""
+
+import pytest
+
+from algorithms.mcts import MCTSAgent
+from game.nim_logic import apply_move
+from game.rules import RULE_SETS
+from tests.brute_force import mover_wins, small_positions
+
+POSITIONS = list(small_positions(3, 4))
+
+
+@pytest.mark.parametrize("rules_name", sorted(RULE_SETS))
+def test_mcts_proofs_match_brute_force(rules_name):
+    rules = None if rules_name == "nim" else rules_name
+    for piles in POSITIONS:
+        # Tanpa batas iterasi: pencarian berhenti sendiri begitu root terbukti
+        agent = MCTSAgent(time_limit_ms=10000, seed=1)
+        move, stats = agent.get_best_move(piles, rules=rules)
+        child = apply_move(piles, move, rules)
+        expected = mover_wins(piles, rules)
+        assert stats["proven"] == ("win" if expected else "loss"), piles
+        if expected:
+            assert not mover_wins(child, rules), (piles, move)
+
+
+def test_mcts_tree_reuse_keeps_proofs():
+    agent = MCTSAgent(time_limit_ms=10000, seed=1)
+    piles = [1, 3, 4]
+    while any(piles):
+        move, stats = agent.get_best_move(piles)
+        if mover_wins(piles):
+            assert not mover_wins(apply_move(piles, move)), (piles, move)
+        piles = apply_move(piles, move)
@@ -0,0 +1,39 @@
+"""
+Akuntansi memori engine: tracemalloc tidak boleh tertinggal aktif dan
+peak tabel tidak boleh lebih kecil dari ukuran akhirnya.
+"""
+
+import tracemalloc
+
+import pytest
+
+from algorithms.alpha_beta import AlphaBetaAgent
+from algorithms.proof_number import ProofNumberAgent
+
+
+def _fail(*args, **kwargs):
+    raise RuntimeError("search failed")
+
+
+@pytest.mark.parametrize("agent, method", [
+    (AlphaBetaAgent(track_memory=True, search="pvs"), "probe"),
+    (AlphaBetaAgent(track_memory=True, search="alphabeta"), "alphabeta"),
+    (ProofNumberAgent(track_memory=True), "_mid"),
+])
+def test_tracing_stops_when_search_fails(agent, method):
+    assert not tracemalloc.is_tracing()
+    setattr(agent, method, _fail)
+    with pytest.raises(RuntimeError):
+        agent.get_best_move([1, 3, 5, 7])
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_stats_reported():
+    agent = AlphaBetaAgent(track_memory=True, keep_memo=True)
+    _, first = agent.get_best_move([1, 3, 5, 7])
+    _, second = agent.get_best_move([2, 3, 5, 7])
+    assert not tracemalloc.is_tracing()
+    for stats in (first, second):
+        assert stats["memo_peak"] >= stats["memo_size"] > 0
+        assert stats["traced_peak_bytes"] > 0
+    assert second["memo_peak"] >= first["memo_size"]
@@ -0,0 +1,44 @@
+"""
+Engine df-pn dicek terhadap solver brute force: hasil terbukti (win/loss)
+dan langkah menang harus benar, juga saat transposition table kecil
+sehingga entri sering di-evict.
+"""
+
+import pytest
+
+from algorithms.proof_number import ProofNumberAgent
+from game.nim_logic import apply_move
+from tests.brute_force import mover_wins, small_positions
+
+POSITIONS = list(small_positions(4, 5))
+
+
+def _check_solution(piles, move, stats):
+    expected = mover_wins(piles)
+    assert stats["solved"] == ("win" if expected else "loss"), piles
+    if expected:
+        assert not mover_wins(apply_move(piles, move)), (piles, move)
+
+
+@pytest.mark.parametrize("canonicalize", [True, False])
+def test_proof_number_solves_small_positions(canonicalize):
+    for piles in POSITIONS:
+        agent = ProofNumberAgent(time_limit_ms=10000, canonicalize=canonicalize)
+        move, stats = agent.get_best_move(piles)
+        _check_solution(piles, move, stats)
+
+
+def test_eviction_never_produces_wrong_proofs():
+    # TT sangat kecil: beberapa posisi tidak terpecahkan dalam batas node,
+    # tapi yang terpecahkan harus tetap benar
+    evictions = 0
+    solved = 0
+    for piles in POSITIONS:
+        agent = ProofNumberAgent(time_limit_ms=10000, max_entries=16, node_limit=20000)
+        move, stats = agent.get_best_move(piles)
+        evictions += stats["tt_evictions"]
+        if stats["solved"] is not None:
+            solved += 1
+            _check_solution(piles, move, stats)
+    assert evictions > 0
+    assert solved > len(POSITIONS) // 2
@@ -0,0 +1,74 @@
+"""
+Persistensi transposition table (algorithms.tt_store): round-trip,
+penolakan file yang tidak cocok / rusak, dan memo yang dimuat ulang
+tetap menghasilkan langkah yang benar.
+"""
+
+import pytest
+
+from algorithms.alpha_beta import EXACT, LOWER, UPPER, AlphaBetaAgent
+from algorithms.tt_store import HEADER, load_table, save_table
+from game.nim_logic import apply_move
+from tests.brute_force import mover_wins, small_positions
+
+POSITIONS = list(small_positions(3, 5))
+
+
+def _warm_memo():
+    agent = AlphaBetaAgent(keep_memo=True, search="pvs")
+    for piles in POSITIONS:
+        agent.get_best_move(piles)
+    return agent.memo
+
+
+def test_round_trip(tmp_path):
+    memo = _warm_memo()
+    path = tmp_path / "tt.bin"
+    assert save_table(memo, path) == len(memo)
+    assert load_table(path) == {key: (check, int(value), flag)
+                                for key, (check, value, flag) in memo.items()}
+
+
+def test_loaded_memo_plays_perfectly(tmp_path):
+    path = tmp_path / "tt.bin"
+    save_table(_warm_memo(), path)
+    agent = AlphaBetaAgent(keep_memo=True, search="pvs")
+    agent.memo = load_table(path)
+    for piles in POSITIONS:
+        move, _ = agent.get_best_move(piles)
+        if mover_wins(piles):
+            assert not mover_wins(apply_move(piles, move)), (piles, move)
+
+
+def test_max_entries_keeps_exact_first(tmp_path):
+    # Bound dan EXACT berselang-seling agar urutan dict tidak kebetulan benar
+    flags = (LOWER, EXACT, UPPER)
+    memo = {key: (key * 7, 1 if key % 2 else -1, flags[key % 3]) for key in range(1, 301)}
+    path = tmp_path / "tt.bin"
+    assert save_table(memo, path, max_entries=100) == 100
+    loaded = load_table(path)
+    assert all(entry[2] == EXACT for entry in loaded.values())
+    assert all(memo[key] == entry for key, entry in loaded.items())
+
+
+def test_rejects_other_rule_set(tmp_path):
+    path = tmp_path / "tt.bin"
+    save_table(_warm_memo(), path)
+    with pytest.raises(ValueError):
+        load_table(path, rules="subtract_1_3")
+
+
+@pytest.mark.parametrize("damage", ["flip", "truncate", "header"])
+def test_rejects_damaged_file(tmp_path, damage):
+    path = tmp_path / "tt.bin"
+    save_table(_warm_memo(), path)
+    data = bytearray(path.read_bytes())
+    if damage == "flip":
+        data[HEADER.size + 3] ^= 0xFF
+    elif damage == "truncate":
+        del data[-5:]
+    else:
+        data = data[:HEADER.size - 1]
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        load_table(path)
@@ -0,0 +1,77 @@
+"""
+Engine array game.vector_sim dicek terhadap grundy_move() dan GameController.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from algorithms.grundy import grundy_move, grundy_table  # noqa: E402
+from config.settings import DIFFICULTY_LEVELS  # noqa: E402
+from game.game_controller import GameController  # noqa: E402
+from game.rules import RULE_SETS, get_rule_set  # noqa: E402
+from game.vector_sim import VectorSimulator, engine_moves  # noqa: E402
+
+RULE_NAMES = sorted(RULE_SETS)
+NUM_POSITIONS = 500
+
+
+def _random_positions(seed, max_pile=40, num_piles=5):
+    rng = np.random.default_rng(seed)
+    piles = rng.integers(0, max_pile + 1, size=(NUM_POSITIONS, num_piles), dtype=np.int64)
+    # Posisi terminal tidak pernah diberikan ke engine
+    return piles[piles.sum(axis=1) > 0]
+
+
+def _tables(rules_name, piles):
+    """(grundy, takes) seperti yang disiapkan VectorSimulator."""
+    rules = get_rule_set(rules_name)
+    if rules.is_unrestricted:
+        return None, None
+    max_pile = int(piles.max())
+    grundy = np.array(grundy_table(rules, max_pile)[:max_pile + 1], dtype=np.int64)
+    return grundy, np.array(rules.takes(max_pile), dtype=np.int64)
+
+
+def _grundy_reference(rules_name, row):
+    rules = None if rules_name == "nim" else rules_name
+    return grundy_move([int(p) for p in row], rules=rules)[0]
+
+
+@pytest.mark.parametrize("rules_name", RULE_NAMES)
+def test_array_grundy_matches_grundy_move(rules_name):
+    piles = _random_positions(1)
+    grundy, takes = _tables(rules_name, piles)
+    pile_idx, take = engine_moves("Grundy", piles, grundy, takes)
+    for row, i, k in zip(piles, pile_idx, take):
+        assert (int(i), int(k)) == _grundy_reference(rules_name, row), row.tolist()
+
+
+@pytest.mark.parametrize("rules_name", RULE_NAMES)
+@pytest.mark.parametrize("engine", ["Reflex", "Random"])
+def test_array_moves_are_legal(rules_name, engine):
+    rules = get_rule_set(rules_name)
+    piles = _random_positions(2)
+    grundy, takes = _tables(rules_name, piles)
+    rng = np.random.default_rng(3)
+    pile_idx, take = engine_moves(engine, piles, grundy, takes, rng)
+    for row, i, k in zip(piles, pile_idx, take):
+        assert rules.is_legal(int(row[i]), int(k)), (row.tolist(), i, k)
+        if engine == "Reflex":
+            # Dari posisi menang Reflex memilih langkah sempurna yang sama
+            g_row = row if grundy is None else grundy[row]
+            bigs = int((g_row > 1).sum())
+            xor = int(np.bitwise_xor.reduce(g_row))
+            if (xor != 0) if bigs else (xor == 0):
+                assert (int(i), int(k)) == _grundy_reference(rules_name, row), row.tolist()
+
+
+@pytest.mark.parametrize("level", sorted(DIFFICULTY_LEVELS))
+def test_winners_match_game_controller(level):
+    spec = DIFFICULTY_LEVELS[level]
+    controller = GameController(spec["piles"], "Grundy", "Grundy", rules=spec.get("rules"))
+    controller.play_full_game()
+    result = VectorSimulator(spec["piles"], "Grundy", "Grundy",
+                             rules=spec.get("rules"), seed=0).run(8)
+    assert (result["winners"] == controller.winner).all()
+    assert (result["lengths"] == controller.total_moves).all()
@@ -0,0 +1,310 @@
+"""
+Rating harness: kekuatan (Elo) vs latensi untuk beberapa konfigurasi engine.
+
+Setiap pasangan konfigurasi bermain round robin dari posisi awal acak
+(deterministik dari --seed); setiap posisi dimainkan dua kali dengan
+warna ditukar. Game dibagi ke worker ProcessPoolExecutor dan setiap
+hasil langsung ditambahkan ke file JSONL, sehingga run yang terputus
+bisa dilanjutkan: game yang id-nya sudah ada di file dilewati (pakai
+--seed dan --positions yang sama saat melanjutkan).
+
+Rating = model Bradley-Terry (skala Elo, rata-rata 0) dengan interval
+kepercayaan 95% dari bootstrap game; ditabulasikan bersama median
+latensi per langkah.
+
+Spesifikasi konfigurasi: nama[:param=nilai,...]
+    reflex | grundy
+    alphabeta:depth=4,time=50[,search=pvs]
+    mcts:time=50[,iterations=200]
+    pn:time=100
+
+Contoh:
+    python -m tools.rating_harness reflex alphabeta:depth=2,time=20 mcts:time=20 \\
+        mcts:time=100 --positions 100 --out ratings.jsonl
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+
+from algorithms.alpha_beta import AlphaBetaAgent, DEFAULT_MOVE_TIME_MS, DEFAULT_SEARCH
+from algorithms.grundy import grundy_move
+from algorithms.mcts import MCTSAgent
+from algorithms.proof_number import ProofNumberAgent
+from algorithms.reflex import reflex_move
+from game.game_controller import GameController, MoveRecord
+
+ENGINE_NAMES = ("reflex", "grundy", "alphabeta", "mcts", "pn")
+# Rentang posisi awal acak
+DEFAULT_MAX_PILES = 6
+DEFAULT_MAX_PILE = 12
+# Jumlah sampel bootstrap untuk interval kepercayaan rating
+BOOTSTRAP_SAMPLES = 200
+# Pseudo-game per pasangan (dibagi rata) agar rating tetap berhingga
+# untuk konfigurasi yang selalu menang / selalu kalah
+PRIOR_GAMES = 1.0
+
+
+def parse_spec(spec):
+    """
+    "alphabeta:depth=4,time=50" -> ("alphabeta", {"depth": "4", "time": "50"})
+
+    Raises:
+        ValueError: Nama engine tidak dikenal / parameter tidak valid
+    """
+    name, _, params = spec.partition(":")
+    if name not in ENGINE_NAMES:
+        raise ValueError(f"Engine tidak dikenal: '{name}' (pilih dari {', '.join(ENGINE_NAMES)})")
+    options = {}
+    for item in filter(None, params.split(",")):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Parameter tidak valid di '{spec}': {item}")
+        options[key] = value
+    return name, options
+
+
+def make_engine(spec):
+    """Fungsi engine (state -> (move, stats)) untuk satu spesifikasi."""
+    name, options = parse_spec(spec)
+    time_ms = float(options["time"]) if "time" in options else DEFAULT_MOVE_TIME_MS
+    if name == "reflex":
+        return reflex_move
+    if name == "grundy":
+        return grundy_move
+    if name == "alphabeta":
+        agent = AlphaBetaAgent(max_depth=int(options.get("depth", 200)),
+                               search=options.get("search", DEFAULT_SEARCH))
+        return lambda state: agent.get_best_move(state, time_limit_ms=time_ms)
+    if name == "mcts":
+        iterations = options.get("iterations")
+        agent = MCTSAgent(max_iterations=int(iterations) if iterations else None)
+        return lambda state: agent.get_best_move(state, time_limit_ms=time_ms)
+    agent = ProofNumberAgent()
+    return lambda state: agent.get_best_move(state, time_limit_ms=time_ms)
+
+
+def random_positions(count, seed, max_piles=DEFAULT_MAX_PILES, max_pile=DEFAULT_MAX_PILE):
+    rng = random.Random(seed)
+    return [[rng.randint(1, max_pile) for _ in range(rng.randint(2, max_piles))]
+            for _ in range(count)]
+
+
+def schedule(specs, positions):
+    """Semua game round robin: (game_id, spec_p1, spec_p2, piles)."""
+    jobs = []
+    for index, piles in enumerate(positions):
+        for a, b in combinations(specs, 2):
+            jobs.append((f"{index}:{a}|{b}", a, b, piles))
+            jobs.append((f"{index}:{b}|{a}", b, a, piles))
+    return jobs
+
+
+def play_game(job):
+    """Entry point worker: mainkan satu game lewat GameController.play_full_game()."""
+    game_id, spec1, spec2, piles = job
+    controller = GameController(piles, spec1, spec2)
+    controller.algo_map[spec1] = make_engine(spec1)
+    controller.algo_map[spec2] = make_engine(spec2)
+    record = MoveRecord(sum(piles))
+    result = controller.play_full_game(record)
+
+    latencies = {1: [], 2: []}
+    for j in range(record.count):
+        latencies[record.players[j]].append(round(record.duration_ms[j], 4))
+    return {
+        "id": game_id,
+        "player1": spec1,
+        "player2": spec2,
+        "piles": piles,
+        "winner": result["winner"],
+        "moves": result["total_moves"],
+        "p1_ms": latencies[1],
+        "p2_ms": latencies[2]
+    }
+
+
+def load_results(path):
+    """Hasil yang sudah ada di file JSONL (baris terakhir yang terpotong diabaikan)."""
+    results = []
+    if not os.path.exists(path):
+        return results
+    with open(path) as f:
+        for line in f:
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return results
+
+
+def run_games(jobs, path, workers=None, on_result=None):
+    """
+    Mainkan `jobs` dan tambahkan setiap hasil ke `path` (JSONL) segera setelah selesai.
+
+    Args:
+        workers: Jumlah proses (1 = tanpa pool)
+        on_result: Callback opsional per hasil (mis. progress)
+    """
+    workers = workers or os.cpu_count() or 1
+    with open(path, "a+") as out:
+        # Run sebelumnya terputus di tengah baris: mulai di baris baru
+        if out.tell() > 0:
+            out.seek(out.tell() - 1)
+            if out.read(1) != "\n":
+                out.write("\n")
+
+        def write(result):
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            if on_result is not None:
+                on_result(result)
+
+        if workers == 1:
+            for job in jobs:
+                write(play_game(job))
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(play_game, job) for job in jobs]):
+                write(future.result())
+
+
+def fit_ratings(games, specs, iterations=200):
+    """
+    Rating Bradley-Terry (skala Elo, rata-rata 0) dengan algoritma MM.
+
+    Args:
+        games: List (spec_pemenang, spec_kalah)
+    """
+    index = {spec: i for i, spec in enumerate(specs)}
+    n = len(specs)
+    wins = [0.0] * n
+    pairs = [[0.0] * n for _ in range(n)]
+    for winner, loser in games:
+        w, l = index[winner], index[loser]
+        wins[w] += 1
+        pairs[w][l] += 1
+        pairs[l][w] += 1
+    for i in range(n):
+        for j in range(n):
+            if i != j and pairs[i][j]:
+                pairs[i][j] += PRIOR_GAMES
+                wins[i] += PRIOR_GAMES / 2
+
+    strength = [1.0] * n
+    for _ in range(iterations):
+        updated = []
+        for i in range(n):
+            denominator = sum(pairs[i][j] / (strength[i] + strength[j])
+                              for j in range(n) if j != i and pairs[i][j])
+            updated.append(wins[i] / denominator if denominator else strength[i])
+        strength = updated
+    elo = [400.0 * math.log10(s) for s in strength]
+    mean = sum(elo) / n
+    return {spec: elo[index[spec]] - mean for spec in specs}
+
+
+def rating_table(results, specs, seed=0):
+    """
+    Rating, interval kepercayaan 95%, skor, dan median latensi per konfigurasi.
+
+    Returns:
+        list of dict, terurut menurut median latensi
+    """
+    games = []
+    for r in results:
+        winner = r["player1"] if r["winner"] == 1 else r["player2"]
+        loser = r["player2"] if r["winner"] == 1 else r["player1"]
+        games.append((winner, loser))
+    ratings = fit_ratings(games, specs)
+
+    rng = random.Random(seed)
+    samples = {spec: [] for spec in specs}
+    for _ in range(BOOTSTRAP_SAMPLES if games else 0):
+        resampled = fit_ratings([rng.choice(games) for _ in games], specs)
+        for spec, value in resampled.items():
+            samples[spec].append(value)
+
+    rows = []
+    for spec in specs:
+        latencies = []
+        played = won = 0
+        for r in results:
+            for player, key in ((1, "p1_ms"), (2, "p2_ms")):
+                if r[f"player{player}"] == spec:
+                    latencies.extend(r[key])
+                    played += 1
+                    won += r["winner"] == player
+        values = sorted(samples[spec])
+        rows.append({
+            "config": spec,
+            "games": played,
+            "score": won / played if played else 0.0,
+            "elo": ratings[spec],
+            "elo_low": values[int(0.025 * len(values))] if values else None,
+            "elo_high": values[int(0.975 * len(values)) - 1] if values else None,
+            "median_ms": statistics.median(latencies) if latencies else 0.0
+        })
+    rows.sort(key=lambda row: row["median_ms"])
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rating Elo vs latensi untuk konfigurasi engine")
+    parser.add_argument("specs", nargs="+", help="Konfigurasi engine, mis. alphabeta:depth=4,time=50")
+    parser.add_argument("--positions", type=int, default=50, help="Jumlah posisi awal acak")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-piles", type=int, default=DEFAULT_MAX_PILES)
+    parser.add_argument("--max-pile", type=int, default=DEFAULT_MAX_PILE)
+    parser.add_argument("--out", default="ratings.jsonl", help="File hasil JSONL (dilanjutkan jika ada)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", help="Tulis tabel rating ke file JSON")
+    args = parser.parse_args()
+
+    specs = list(dict.fromkeys(args.specs))
+    if len(specs) < 2:
+        parser.error("butuh minimal dua konfigurasi")
+    for spec in specs:
+        try:
+            parse_spec(spec)
+        except ValueError as e:
+            parser.error(str(e))
+
+    positions = random_positions(args.positions, args.seed, args.max_piles, args.max_pile)
+    jobs = schedule(specs, positions)
+    done = {r["id"] for r in load_results(args.out)}
+    pending = [job for job in jobs if job[0] not in done]
+    print(f"{len(jobs)} games scheduled, {len(jobs) - len(pending)} already in {args.out}")
+
+    start = time.perf_counter()
+    finished = [0]
+
+    def progress(_):
+        finished[0] += 1
+        if finished[0] % 100 == 0 or finished[0] == len(pending):
+            print(f"  {finished[0]}/{len(pending)} games ({time.perf_counter() - start:.1f}s)")
+
+    run_games(pending, args.out, args.workers, progress)
+
+    job_ids = {job[0] for job in jobs}
+    results = [r for r in load_results(args.out) if r["id"] in job_ids]
+    rows = rating_table(results, specs, args.seed)
+    print(f"\n  {'config':<32}{'games':>7}{'score':>8}{'elo':>8}{'95% CI':>17}{'median ms':>12}")
+    for row in rows:
+        ci = f"[{row['elo_low']:+.0f}, {row['elo_high']:+.0f}]" if row["elo_low"] is not None else "-"
+        print(f"  {row['config']:<32}{row['games']:>7}{row['score']:>8.1%}{row['elo']:>+8.0f}"
+              f"{ci:>17}{row['median_ms']:>12.3f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
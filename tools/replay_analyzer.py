@@ -0,0 +1,257 @@
+"""
+Replay analyzer: nilai setiap langkah di match log biner terhadap strategi sempurna.
+
+Setiap game diputar ulang dari tumpukan awal. Sebelum tiap langkah,
+posisi dinilai dengan evaluator eksak (nilai Grundy + aturan misère,
+di-update O(1) per langkah):
+    - posisi kalah bagi pemain giliran -> "forced" (tidak ada langkah bagus)
+    - posisi menang, lawan dibiarkan di posisi kalah -> "best"
+    - posisi menang, lawan dibiarkan di posisi menang -> "blunder"
+
+Hasil diagregasi per (algoritma, level, fase). Game dibagi ke worker
+ProcessPoolExecutor berdasarkan rentang record; tiap worker membuka file
+lewat mmap sendiri dan hanya menyimpan satu game di memori.
+
+Contoh:
+    python -m tools.replay_analyzer tournament.nimlog --workers 8
+    python -m tools.replay_analyzer a.nimlog b.nimlog --json report.json
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.grundy import check_misere_rule, grundy_function
+from config.settings import DIFFICULTY_LEVELS
+from game.match_log import FLAG_OVERRUN, FLAG_SUBSTITUTED, MatchLogReader
+from game.rules import get_rule_set
+
+# Jumlah batch per worker (lebih banyak = pembagian beban lebih rata)
+BATCHES_PER_WORKER = 4
+
+
+class ExactEvaluator:
+    """
+    Evaluator posisi eksak untuk satu rule set, dengan XOR nilai Grundy
+    dan jumlah tumpukan bernilai > 1 yang di-update per langkah.
+    """
+
+    def __init__(self, rules=None):
+        rules = get_rule_set(rules)
+        self.rules = None if rules is None or rules.is_unrestricted else rules
+        if self.rules is not None:
+            check_misere_rule(self.rules)
+        self._grundy = None
+
+    def grundy(self, pile):
+        if self.rules is None:
+            return pile
+        return self._grundy(pile)
+
+    def summarize(self, piles):
+        """(xor, bigs) untuk tumpukan awal (tumpukan hanya bisa mengecil)."""
+        if self.rules is not None:
+            self._grundy = grundy_function(self.rules, max(piles, default=0))
+        xor = 0
+        bigs = 0
+        for p in piles:
+            g = self.grundy(p)
+            xor ^= g
+            if g > 1:
+                bigs += 1
+        return xor, bigs
+
+    def update(self, xor, bigs, old, new):
+        """(xor, bigs) setelah satu tumpukan berubah dari `old` ke `new`."""
+        g_old = self.grundy(old)
+        g_new = self.grundy(new)
+        return xor ^ g_old ^ g_new, bigs - (g_old > 1) + (g_new > 1)
+
+    @staticmethod
+    def mover_wins(xor, bigs):
+        # Misère "tame": semua nilai <= 1 -> menang jika XOR == 0
+        return xor != 0 if bigs else xor == 0
+
+
+def difficulty_of(initial_piles, rules):
+    """Nama level di DIFFICULTY_LEVELS yang cocok, atau "Custom"."""
+    for name, level in DIFFICULTY_LEVELS.items():
+        if level["piles"] == initial_piles and level.get("rules", "nim") == rules:
+            return name
+    return "Custom"
+
+
+def phase_of(remaining, initial_total, bigs):
+    if bigs == 0 or remaining * 3 <= initial_total:
+        return "endgame"
+    if remaining * 3 > initial_total * 2:
+        return "opening"
+    return "middlegame"
+
+
+def move_label(algorithm, flags):
+    """
+    Nama yang dinilai untuk satu langkah: langkah pengganti (varian) dicatat
+    sebagai Grundy dan langkah fallback setelah overrun dipisahkan.
+    """
+    if flags & FLAG_OVERRUN:
+        return f"{algorithm} (fallback)"
+    if flags & FLAG_SUBSTITUTED:
+        return "Grundy"
+    return algorithm
+
+
+def _add(totals, key, field):
+    entry = totals.get(key)
+    if entry is None:
+        entry = totals[key] = {"moves": 0, "winning_positions": 0, "best": 0,
+                               "blunders": 0, "forced": 0, "invalid": 0}
+    entry[field] += 1
+
+
+def analyze_game(reader, game, totals):
+    """Putar ulang satu game dan tambahkan hasilnya ke `totals`."""
+    piles = reader.initial_piles(game["game_id"], game["start_record"])
+    try:
+        evaluator = ExactEvaluator(game["rules"])
+    except (KeyError, ValueError):
+        return  # rule set tidak dikenal / misère tidak didukung
+    difficulty = difficulty_of(piles, game["rules"])
+    players = {1: game["player1"], 2: game["player2"]}
+    initial_total = remaining = sum(piles)
+    xor, bigs = evaluator.summarize(piles)
+
+    stop = game["end_record"] + 1 if game["end_record"] is not None else None
+    for rec in reader.iter_moves(game["game_id"], game["start_record"], stop):
+        player, flags, pile, take = rec[1], rec[2], rec[4], rec[5]
+        key = (move_label(players[player], flags), difficulty, phase_of(remaining, initial_total, bigs))
+        if (pile >= len(piles) or take <= 0 or take > piles[pile]
+                or (evaluator.rules is not None and not evaluator.rules.is_legal(piles[pile], take))):
+            _add(totals, key, "invalid")
+            return
+
+        _add(totals, key, "moves")
+        winning = evaluator.mover_wins(xor, bigs)
+        old = piles[pile]
+        piles[pile] = old - take
+        remaining -= take
+        xor, bigs = evaluator.update(xor, bigs, old, piles[pile])
+
+        if not winning:
+            _add(totals, key, "forced")
+            continue
+        _add(totals, key, "winning_positions")
+        # Mengambil stik terakhir selalu kalah; selain itu lawan harus kalah
+        if remaining == 0 or evaluator.mover_wins(xor, bigs):
+            _add(totals, key, "blunders")
+        else:
+            _add(totals, key, "best")
+
+
+def analyze_batch(path, games):
+    """Entry point worker: analisis sekumpulan game dari satu file."""
+    totals = {}
+    with MatchLogReader(path) as reader:
+        for game in games:
+            analyze_game(reader, game, totals)
+    return path, len(games), totals
+
+
+def merge_totals(into, totals):
+    for key, entry in totals.items():
+        target = into.setdefault(key, dict.fromkeys(entry, 0))
+        for field, value in entry.items():
+            target[field] += value
+    return into
+
+
+def analyze_logs(paths, workers=None):
+    """
+    Analisis semua game di `paths`.
+
+    Args:
+        paths: List path match log
+        workers: Jumlah proses (1 = tanpa pool)
+
+    Returns:
+        tuple: (totals, jumlah_game)
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = []
+    for path in paths:
+        with MatchLogReader(path) as reader:
+            games = sorted(reader.games().values(), key=lambda g: g["start_record"])
+        size = max(1, -(-len(games) // (workers * BATCHES_PER_WORKER)))
+        jobs.extend((path, games[i:i + size]) for i in range(0, len(games), size))
+
+    totals = {}
+    game_count = 0
+    if workers == 1:
+        results = (analyze_batch(path, games) for path, games in jobs)
+        for _, count, batch_totals in results:
+            merge_totals(totals, batch_totals)
+            game_count += count
+        return totals, game_count
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(analyze_batch, path, games) for path, games in jobs]
+        for future in futures:
+            _, count, batch_totals = future.result()
+            merge_totals(totals, batch_totals)
+            game_count += count
+    return totals, game_count
+
+
+def group_by(totals, index):
+    """Jumlahkan totals per satu komponen key (0 = algoritma, 1 = level, 2 = fase)."""
+    grouped = {}
+    for key, entry in totals.items():
+        merge_totals(grouped, {key[index]: entry})
+    return grouped
+
+
+def blunder_rate(entry):
+    if not entry["winning_positions"]:
+        return 0.0
+    return entry["blunders"] / entry["winning_positions"]
+
+
+def _print_table(title, grouped):
+    print(f"\n{title}")
+    print(f"  {'':<24}{'moves':>10}{'forced':>10}{'winning':>10}{'best':>10}"
+          f"{'blunders':>10}{'rate':>9}")
+    for name, entry in sorted(grouped.items()):
+        print(f"  {name:<24}{entry['moves']:>10}{entry['forced']:>10}"
+              f"{entry['winning_positions']:>10}{entry['best']:>10}"
+              f"{entry['blunders']:>10}{blunder_rate(entry):>8.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nilai langkah di match log terhadap strategi sempurna")
+    parser.add_argument("paths", nargs="+", help="File match log biner")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", help="Tulis hasil lengkap ke file JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    totals, game_count = analyze_logs(args.paths, args.workers)
+    elapsed = time.perf_counter() - start
+    moves = sum(entry["moves"] for entry in totals.values())
+    print(f"{game_count} games, {moves} moves in {elapsed:.2f}s")
+
+    _print_table("Per algorithm", group_by(totals, 0))
+    _print_table("Per difficulty", group_by(totals, 1))
+    _print_table("Per phase", group_by(totals, 2))
+
+    if args.json:
+        rows = [{"algorithm": a, "difficulty": d, "phase": p, **entry,
+                 "blunder_rate": blunder_rate(entry)}
+                for (a, d, p), entry in sorted(totals.items())]
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Soak test: mainkan banyak game berturut-turut dalam satu proses dan
+laporkan pertumbuhan memori per game, untuk menangkap leak sebelum production.
+
+Setelah setiap game controller dibuang dan gc dijalankan, lalu dicatat
+memori yang di-trace tracemalloc (atau hanya RSS dengan --no-trace).
+Game pemanasan (--warmup) tidak dihitung karena cache modul (tabel
+Grundy, tabel Zobrist, dll.) memang tumbuh sekali di awal. Laporan berisi
+kemiringan regresi linear memori terhadap nomor game (byte per game) dan
+baris kode dengan pertumbuhan alokasi terbesar sejak akhir pemanasan.
+
+Contoh:
+    python -m tools.soak_test Alpha-Beta Reflex --level Medium --games 200
+    python -m tools.soak_test MCTS Grundy --level Hard --games 50 --fast
+"""
+
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from array import array
+
+from algorithms.memory_stats import HOTSPOT_COUNT, frame_location
+from config.settings import DIFFICULTY_LEVELS
+from game.game_controller import GameController
+
+DEFAULT_WARMUP = 5
+
+
+def current_rss_bytes():
+    """RSS proses saat ini dari /proc (Linux), atau None jika tidak tersedia."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _slope(values):
+    """Kemiringan regresi linear values terhadap index (satuan per game)."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(values) / n
+    num = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    den = sum((x - mean_x) ** 2 for x in range(n))
+    return num / den
+
+
+def soak(player1_algo, player2_algo, piles, games, rules=None, warmup=DEFAULT_WARMUP,
+         fast=False, trace=True, on_game=None):
+    """
+    Mainkan `games` game berturut-turut dan ukur memori setelah setiap game.
+
+    Args:
+        fast: True = GameController.play_full_game(), False = play_one_move() per langkah
+        trace: True = tracemalloc (akurat per baris kode, lebih lambat)
+        on_game: Callback opsional (index_game, moves, traced_bytes, rss_bytes)
+            per game; nilai -1 = tidak diukur
+
+    Returns:
+        dict: "samples" (list per game), "traced_growth_per_game",
+            "rss_growth_per_game", dan "hotspots" (pertumbuhan per baris)
+    """
+    # Penyimpanan sampel dialokasikan sebelum tracing agar tidak ikut terukur
+    moves = array("Q", bytes(8 * games))
+    durations = array("d", bytes(8 * games))
+    traced = array("q", bytes(8 * games))
+    rss = array("q", bytes(8 * games))
+    baseline = None
+    hotspots = []
+    if trace:
+        tracemalloc.start()
+    try:
+        for index in range(games):
+            start = time.perf_counter()
+            controller = GameController(piles, player1_algo, player2_algo, rules=rules)
+            if fast:
+                controller.play_full_game()
+            else:
+                while not controller.game_over:
+                    controller.play_one_move()
+            moves[index] = controller.total_moves
+            del controller
+            gc.collect()
+
+            durations[index] = time.perf_counter() - start
+            traced[index] = tracemalloc.get_traced_memory()[0] if trace else -1
+            rss[index] = current_rss_bytes() or -1
+            if trace and index + 1 == warmup:
+                baseline = tracemalloc.take_snapshot()
+            if on_game is not None:
+                on_game(index, moves[index], traced[index], rss[index])
+
+        if baseline is not None:
+            ignore = (tracemalloc.Filter(False, __file__),
+                      tracemalloc.Filter(False, tracemalloc.__file__))
+            diff = tracemalloc.take_snapshot().filter_traces(ignore).compare_to(
+                baseline.filter_traces(ignore), "lineno")
+            hotspots = [{"location": frame_location(stat.traceback[0]),
+                         "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                        for stat in diff[:HOTSPOT_COUNT]]
+    finally:
+        if trace:
+            tracemalloc.stop()
+
+    samples = [{"game": i + 1, "moves": moves[i], "duration_sec": durations[i],
+                "traced_bytes": traced[i] if traced[i] >= 0 else None,
+                "rss_bytes": rss[i] if rss[i] >= 0 else None}
+               for i in range(games)]
+    measured_traced = [v for v in traced[warmup:] if v >= 0]
+    measured_rss = [v for v in rss[warmup:] if v >= 0]
+    return {
+        "samples": samples,
+        "traced_growth_per_game": _slope(measured_traced) if measured_traced else None,
+        "rss_growth_per_game": _slope(measured_rss) if measured_rss else None,
+        "hotspots": hotspots
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak test memori: banyak game dalam satu proses")
+    parser.add_argument("player1")
+    parser.add_argument("player2")
+    parser.add_argument("--level", choices=list(DIFFICULTY_LEVELS), default="Medium")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--fast", action="store_true", help="Pakai play_full_game()")
+    parser.add_argument("--no-trace", action="store_true", help="Tanpa tracemalloc (hanya RSS)")
+    args = parser.parse_args()
+
+    level = DIFFICULTY_LEVELS[args.level]
+    report_every = max(1, args.games // 20)
+
+    def progress(index, moves, traced, rss):
+        if (index + 1) % report_every == 0 or index + 1 == args.games:
+            line = f"  game {index + 1:>6}  moves {moves:>5}"
+            if traced >= 0:
+                line += f"  traced {traced / 1024:>10.1f} KB"
+            if rss >= 0:
+                line += f"  rss {rss / 1048576:>8.1f} MB"
+            print(line)
+
+    report = soak(args.player1, args.player2, level["piles"], args.games,
+                  rules=level.get("rules"), warmup=args.warmup, fast=args.fast,
+                  trace=not args.no_trace, on_game=progress)
+
+    print(f"\n{args.player1} vs {args.player2} on {args.level}, "
+          f"{args.games} games ({args.warmup} warm-up)")
+    if report["traced_growth_per_game"] is not None:
+        print(f"  traced growth: {report['traced_growth_per_game']:+.0f} bytes/game")
+    if report["rss_growth_per_game"] is not None:
+        print(f"  rss growth:    {report['rss_growth_per_game']:+.0f} bytes/game")
+    for spot in report["hotspots"]:
+        print(f"  {spot['location']:<40}{spot['size_diff']:>+12} B{spot['count_diff']:>+9} blocks")
+
+
+if __name__ == "__main__":
+    main()